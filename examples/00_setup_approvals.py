@@ -27,144 +27,391 @@ Setup:
 """
 
 import asyncio
+import json
 import os
+import sys
 from decimal import Decimal
-from dotenv import load_dotenv
+from eth_abi import encode as abi_encode
 from eth_account import Account
 from web3 import Web3
 
-from limitless_sdk.api import HttpClient
+from _common import close_clients, get_clients, load_env
 from limitless_sdk.markets import MarketFetcher
 from limitless_sdk.utils.constants import get_contract_address, DEFAULT_CHAIN_ID
 
-# Load environment variables
-load_dotenv()
+load_env()
 
 # Configuration
 API_URL = os.getenv("API_URL", "https://api.limitless.exchange")
 PRIVATE_KEY = os.getenv("PRIVATE_KEY")
 MARKET_SLUG = os.getenv("MARKET_SLUG", "largest-company-end-of-2025-1746118069282")
 RPC_URL = os.getenv("RPC_URL", "https://mainnet.base.org")  # Base mainnet
+# Optional WebSocket RPC endpoint. When set, receipt confirmations are
+# pushed by the node (newHeads subscription) instead of polled over HTTP.
+RPC_WS_URL = os.getenv("RPC_WS_URL")
 CHAIN_ID = int(os.getenv("CHAIN_ID", str(DEFAULT_CHAIN_ID)))
+# Receipt poll interval in seconds. Base mainnet produces a block every ~2s,
+# so web3.py's 0.1s default wastes ~10x the RPC calls per confirmation (and
+# can trigger 429s on rate-limited public endpoints). Drop to 0.1-0.2 for
+# private/dev RPCs.
+RECEIPT_POLL_INTERVAL = float(os.getenv("RECEIPT_POLL_INTERVAL", "1.0"))
+
+# Precomputed 4-byte function selectors (keccak256 of the canonical
+# signature). The approval flow only ever calls these four fixed-signature
+# functions, so hand-encoding calldata with eth_abi skips web3.py's
+# Contract/ContractFunction machinery (ABI walking, argument munging)
+# entirely.
+APPROVE_SEL = bytes.fromhex("095ea7b3")               # approve(address,uint256)
+SET_APPROVAL_FOR_ALL_SEL = bytes.fromhex("a22cb465")  # setApprovalForAll(address,bool)
+ALLOWANCE_SEL = bytes.fromhex("dd62ed3e")             # allowance(address,address)
+IS_APPROVED_FOR_ALL_SEL = bytes.fromhex("e985e9c5")   # isApprovedForAll(address,address)
+
+# Approve uint96-max rather than uint256-max. It is still effectively
+# unlimited (7.9e28 with 6-decimal USDC) but leaves the upper bits clear, so
+# exchange-side integrations that pack allowances into 96/160-bit slots
+# (Permit2-style) treat it as a plain large allowance instead of tripping
+# "unlimited" special cases.
+MAX_UINT96 = 2**96 - 1
+
+
+def encode_call(selector, types, args):
+    """Build calldata for a fixed-signature call: selector + ABI-encoded args."""
+    return Web3.to_hex(selector + abi_encode(types, args))
+
+
+# When stdout is a pipe (container/log shipper), every print() is a
+# line-buffered syscall that serializes with the event loop and can delay
+# the latency-critical RPC sends. Buffer status lines and flush once per
+# phase instead; interactive TTY runs keep immediate output.
+_OUT_BUFFERED = not sys.stdout.isatty()
+_out_buf = []
+
+
+def log(line=""):
+    """Queue (non-TTY) or immediately print (TTY) one status line."""
+    if _OUT_BUFFERED:
+        _out_buf.append(line)
+    else:
+        print(line)
+
+
+def flush_log():
+    """Write all queued status lines in one syscall."""
+    if _out_buf:
+        sys.stdout.write("\n".join(_out_buf) + "\n")
+        sys.stdout.flush()
+        _out_buf.clear()
+
+
+# Approvals are effectively monotonic (users rarely revoke), so once an
+# approval has been observed on-chain it can be remembered locally and the
+# eth_call skipped on every later run. Keyed by (chain, owner, token, spender).
+APPROVAL_CACHE_PATH = os.path.expanduser("~/.limitless/approvals.json")
 
-# ERC-20 approve ABI (for USDC)
-ERC20_APPROVE_ABI = [
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "_spender", "type": "address"},
-            {"name": "_value", "type": "uint256"},
-        ],
-        "name": "approve",
-        "outputs": [{"name": "", "type": "bool"}],
-        "payable": False,
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "constant": True,
-        "inputs": [
-            {"name": "_owner", "type": "address"},
-            {"name": "_spender", "type": "address"},
-        ],
-        "name": "allowance",
-        "outputs": [{"name": "", "type": "uint256"}],
-        "payable": False,
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
-
-# ERC-1155 setApprovalForAll ABI (for Conditional Tokens)
-ERC1155_APPROVAL_ABI = [
-    {
-        "inputs": [
-            {"internalType": "address", "name": "operator", "type": "address"},
-            {"internalType": "bool", "name": "approved", "type": "bool"},
-        ],
-        "name": "setApprovalForAll",
-        "outputs": [],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "address", "name": "account", "type": "address"},
-            {"internalType": "address", "name": "operator", "type": "address"},
-        ],
-        "name": "isApprovedForAll",
-        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
+
+def _approval_cache_key(chain_id, owner, token_contract, spender):
+    return f"{chain_id}:{owner}:{token_contract}:{spender}".lower()
+
+
+def load_approval_cache():
+    """Load the local approval cache; --force bypasses it entirely."""
+    if "--force" in sys.argv:
+        return {}
+    try:
+        with open(APPROVAL_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_approval_cache(cache):
+    """Persist observed approvals for the next run."""
+    try:
+        os.makedirs(os.path.dirname(APPROVAL_CACHE_PATH), exist_ok=True)
+        with open(APPROVAL_CACHE_PATH, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass  # Cache is best-effort; never fail the setup over it
+
+
+# Signed-but-possibly-unconfirmed transactions are persisted here before they
+# hit the wire. If send_raw_transaction succeeds on the node but the response
+# is lost (flaky RPC, process killed), a restart would otherwise re-sign at a
+# new nonce and pay gas twice; instead the next run rebroadcasts the exact
+# same raw bytes.
+PENDING_TX_PATH = os.path.expanduser("~/.limitless/pending.json")
+
+
+def load_pending_txs():
+    try:
+        with open(PENDING_TX_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_pending_txs(entries):
+    try:
+        os.makedirs(os.path.dirname(PENDING_TX_PATH), exist_ok=True)
+        with open(PENDING_TX_PATH, "w") as f:
+            json.dump(entries, f, indent=2)
+    except OSError:
+        pass
+
+
+async def flush_pending_txs(w3, approval_cache):
+    """Recover transactions persisted by an interrupted earlier run.
+
+    Checks all recorded hashes in one batched eth_getTransactionReceipt:
+    mined transactions are dropped (successful ones also update the approval
+    cache); unmined ones are rebroadcast from the stored raw bytes — no
+    re-signing, no new nonce — and awaited before the caller reads approval
+    state.
+
+    Args:
+        w3: AsyncWeb3 instance
+        approval_cache: Approval cache dict, updated in place for confirmed txs
+    """
+    entries = load_pending_txs()
+    if not entries:
+        return
+
+    log(f"♻️  Found {len(entries)} persisted transaction(s) from a previous run")
+    receipts = await rpc_batch(
+        w3, [("eth_getTransactionReceipt", [entry["hash"]]) for entry in entries]
+    )
+
+    outstanding = []
+    for entry, receipt in zip(entries, receipts):
+        if receipt is not None:
+            status = receipt.get("status")
+            if isinstance(status, str):
+                status = int(status, 16)
+            if status == 1 and entry.get("cache_key"):
+                approval_cache[entry["cache_key"]] = True
+            log(f"   ✅ {entry['label']} already mined: {entry['hash']}")
+            continue
+        try:
+            await w3.eth.send_raw_transaction(entry["raw"])
+            log(f"   ♻️  Rebroadcast {entry['label']}: {entry['hash']}")
+        except Exception:
+            pass  # Already in the mempool (or replaced) — nothing to resend
+        outstanding.append(entry)
+
+    if outstanding:
+        log("   ⏳ Waiting for rebroadcast confirmations...")
+        flush_log()
+        receipts = await asyncio.gather(
+            *(
+                w3.eth.wait_for_transaction_receipt(
+                    entry["hash"], poll_latency=RECEIPT_POLL_INTERVAL
+                )
+                for entry in outstanding
+            )
+        )
+        for entry, receipt in zip(outstanding, receipts):
+            if receipt["status"] == 1 and entry.get("cache_key"):
+                approval_cache[entry["cache_key"]] = True
+            log(f"   ✅ {entry['label']} confirmed: {entry['hash']}")
+
+    save_pending_txs([])
+    save_approval_cache(approval_cache)
+
+
+async def rpc_batch(w3, calls):
+    """Issue a single JSON-RPC batch request and return results in call order.
+
+    Collapses N sequential HTTP round-trips into one. Keep batches small
+    (<= 20 calls) — public RPC endpoints often reject larger batches.
+
+    Args:
+        w3: AsyncWeb3 instance with an HTTP provider
+        calls: List of (method, params) tuples
+
+    Returns:
+        List of raw RPC results in the same order as calls
+
+    Raises:
+        RuntimeError: If any call in the batch returned an error
+    """
+    responses = await w3.provider.make_batch_request(calls)
+    results = []
+    for (method, _), response in zip(calls, responses):
+        if "error" in response:
+            raise RuntimeError(f"RPC batch call {method} failed: {response['error']}")
+        results.append(response["result"])
+    return results
+
+
+async def wait_for_receipts(w3, tx_hashes):
+    """Wait for all transaction receipts, preferring push over polling.
+
+    When RPC_WS_URL is set, subscribe to newHeads over a WebSocket provider
+    and issue ONE batched eth_getTransactionReceipt for all outstanding
+    hashes each time a block lands — the node tells us when to look instead
+    of us guessing on a timer. This shaves up to one poll interval off the
+    median confirmation latency and removes the redundant
+    eth_getTransactionReceipt calls between blocks. Falls back to the HTTP
+    polling loop when no WebSocket endpoint is configured.
+
+    Args:
+        w3: AsyncWeb3 instance with an HTTP provider
+        tx_hashes: Transaction hashes to wait for
+
+    Returns:
+        List of receipts in the same order as tx_hashes
+    """
+    if not RPC_WS_URL:
+        return await asyncio.gather(
+            *(
+                w3.eth.wait_for_transaction_receipt(tx_hash, poll_latency=RECEIPT_POLL_INTERVAL)
+                for tx_hash in tx_hashes
+            )
+        )
+
+    from web3 import AsyncWeb3
+    from web3.providers.persistent import WebSocketProvider
+
+    receipts = {tx_hash: None for tx_hash in tx_hashes}
+
+    async with AsyncWeb3(WebSocketProvider(RPC_WS_URL)) as ws_w3:
+        await ws_w3.eth.subscribe("newHeads")
+        async for _ in ws_w3.socket.process_subscriptions():
+            outstanding = [tx_hash for tx_hash, receipt in receipts.items() if receipt is None]
+            results = await rpc_batch(
+                w3,
+                [("eth_getTransactionReceipt", [Web3.to_hex(tx_hash)]) for tx_hash in outstanding],
+            )
+            for tx_hash, result in zip(outstanding, results):
+                if result is not None:
+                    # Raw RPC receipts carry hex-encoded status
+                    if isinstance(result.get("status"), str):
+                        result["status"] = int(result["status"], 16)
+                    receipts[tx_hash] = result
+
+            if all(receipt is not None for receipt in receipts.values()):
+                break
+
+    return [receipts[tx_hash] for tx_hash in tx_hashes]
+
+
+async def try_send_calls(w3, account, approvals, chain_id):
+    """Submit all approvals as one atomic EIP-5792 batch, if the RPC supports it.
+
+    For smart-account-compatible wallets, `wallet_sendCalls` collapses the
+    separate approval transactions into a single user-op: one inclusion, one
+    receipt poll, one base-transaction fee instead of three.
+
+    Args:
+        w3: AsyncWeb3 instance
+        account: Signing account
+        approvals: List of (label, to_address, calldata, cache_key) pending approvals
+        chain_id: Expected chain ID
+
+    Returns:
+        True if the batch confirmed with all calls successful, False if it
+        was submitted but failed, None if the RPC does not support
+        wallet_sendCalls (caller should fall back to per-tx submission)
+    """
+    calls = [{"to": to_address, "data": data} for _, to_address, data, _ in approvals]
+
+    try:
+        response = await w3.provider.make_request(
+            "wallet_sendCalls",
+            [{
+                "version": "1.0",
+                "chainId": hex(chain_id),
+                "from": account.address,
+                "calls": calls,
+            }],
+        )
+    except Exception:
+        return None
+
+    if "error" in response:
+        # Method not found / not a smart-account wallet — use the per-tx path
+        return None
+
+    batch_id = response["result"]
+    log(f"   Batch submitted via wallet_sendCalls: {batch_id}")
+    log("   ⏳ Waiting for batch confirmation...")
+
+    while True:
+        status_response = await w3.provider.make_request("wallet_getCallsStatus", [batch_id])
+        result = status_response.get("result") or {}
+        status = result.get("status")
+
+        # Pre-final EIP-5792 drafts report "CONFIRMED"/"FAILED"; the final
+        # spec uses numeric codes (200 = confirmed)
+        if status in ("CONFIRMED", 200):
+            receipts = result.get("receipts") or []
+            return all(int(r.get("status", "0x0"), 16) == 1 for r in receipts)
+        if status in ("FAILED", 400, 500):
+            return False
+
+        await asyncio.sleep(1.0)
 
 
 async def setup_approvals():
     """Set up token approvals for trading on Limitless Exchange."""
-    print("🔐 Token Approval Setup for Limitless Exchange\n")
+    log("🔐 Token Approval Setup for Limitless Exchange\n")
 
     # Validate environment
     if not PRIVATE_KEY:
-        print("❌ Error: PRIVATE_KEY not found in .env file")
-        print("   Please add your private key to .env")
+        log("❌ Error: PRIVATE_KEY not found in .env file")
+        log("   Please add your private key to .env")
         return
 
     # Show configuration
-    print("⚙️  Configuration:")
-    print(f"   API URL: {API_URL}")
-    print(f"   Chain ID: {CHAIN_ID}")
-    print(f"   RPC URL: {RPC_URL}")
-    print(f"   Market Slug: {MARKET_SLUG}\n")
-
-    # Initialize wallet and Web3
+    log("⚙️  Configuration:")
+    log(f"   API URL: {API_URL}")
+    log(f"   Chain ID: {CHAIN_ID}")
+    log(f"   RPC URL: {RPC_URL}")
+    log(f"   Market Slug: {MARKET_SLUG}\n")
+    flush_log()
+
+    # Initialize wallet and the shared clients. The async Web3 provider gives
+    # non-blocking RPC I/O so independent transactions can be submitted and
+    # awaited concurrently; both clients keep warm connection pools for the
+    # life of the process (see examples/_common.py).
     account = Account.from_key(PRIVATE_KEY)
-    w3 = Web3(Web3.HTTPProvider(RPC_URL))
-
-    print(f"👛 Wallet Address: {account.address}\n")
-
-    # Check network connectivity
-    if not w3.is_connected():
-        print("❌ Error: Failed to connect to RPC endpoint")
-        print(f"   RPC URL: {RPC_URL}")
-        return
+    http_client, w3 = await get_clients()
 
-    # Verify chain ID
-    actual_chain_id = w3.eth.chain_id
-    if actual_chain_id != CHAIN_ID:
-        print(f"⚠️  Warning: Connected to chain {actual_chain_id}, expected {CHAIN_ID}")
-        print("   Please check your RPC_URL and CHAIN_ID in .env")
-        return
+    log(f"👛 Wallet Address: {account.address}\n")
 
-    print(f"✅ Connected to chain ID: {actual_chain_id}\n")
+    # No up-front connectivity/chain-id pre-flight: is_connected() issues
+    # web3_clientVersion and eth.chain_id is another round-trip, both serial
+    # and before any useful work. Instead, eth_chainId rides along as the
+    # first call of whichever RPC batch runs first, and a transport error
+    # from that batch IS the "failed to connect" diagnosis — same coverage,
+    # two fewer cold-start RTTs.
 
-    # Initialize SDK
-    http_client = HttpClient(base_url=API_URL)
+    # Initialize SDK with the shared HTTP client
     market_fetcher = MarketFetcher(http_client)
 
     # Fetch market to get venue information
-    print(f"📊 Fetching market: {MARKET_SLUG}...")
+    log(f"📊 Fetching market: {MARKET_SLUG}...")
     try:
         market = await market_fetcher.get_market(MARKET_SLUG)
-        print(f"   Market: {market.title}")
-        print(f"   Type: {market.market_type}")
+        log(f"   Market: {market.title}")
+        log(f"   Type: {market.market_type}")
     except Exception as e:
-        print(f"❌ Error fetching market: {e}")
+        log(f"❌ Error fetching market: {e}")
         return
 
     # Check if market has venue
     if not market.venue:
-        print("❌ Error: Market does not have venue information")
-        print("   This market may not support trading via the venue system")
+        log("❌ Error: Market does not have venue information")
+        log("   This market may not support trading via the venue system")
         return
 
     venue = market.venue
-    print(f"   Exchange: {venue.exchange}")
+    log(f"   Exchange: {venue.exchange}")
     if venue.adapter:
-        print(f"   Adapter: {venue.adapter}")
+        log(f"   Adapter: {venue.adapter}")
     else:
-        print(f"   Adapter: None (CLOB market - adapter not needed)")
-    print()
+        log(f"   Adapter: None (CLOB market - adapter not needed)")
+    log()
 
     # Determine if this is a NegRisk market
     is_negrisk = market.neg_risk_request_id is not None
@@ -173,155 +420,314 @@ async def setup_approvals():
     usdc_address = get_contract_address("USDC", CHAIN_ID)
     ctf_address = get_contract_address("CTF", CHAIN_ID)  # ERC-1155 Conditional Tokens contract
 
-    print("📝 Contract Addresses:")
-    print(f"   USDC: {usdc_address}")
-    print(f"   CTF: {ctf_address}")
-    print(f"   Exchange (venue.exchange): {venue.exchange}\n")
-
-    # Create contract instances
-    usdc_contract = w3.eth.contract(address=Web3.to_checksum_address(usdc_address), abi=ERC20_APPROVE_ABI)
-    ctf_contract = w3.eth.contract(address=Web3.to_checksum_address(ctf_address), abi=ERC1155_APPROVAL_ABI)
-
-    # Check and set up USDC approval for BUY orders
-    print("🔍 Checking USDC approval for BUY orders...")
+    log("📝 Contract Addresses:")
+    log(f"   USDC: {usdc_address}")
+    log(f"   CTF: {ctf_address}")
+    log(f"   Exchange (venue.exchange): {venue.exchange}\n")
+
+    # Checksum each address ONCE and reuse the locals below.
+    # to_checksum_address runs a full keccak256 over the hex string every
+    # call, so re-checksumming the same five addresses per .call() argument
+    # and per transaction build is pure waste.
+    owner = Web3.to_checksum_address(account.address)
+    exchange = Web3.to_checksum_address(venue.exchange)
+    adapter = Web3.to_checksum_address(venue.adapter) if venue.adapter else None
+    usdc = Web3.to_checksum_address(usdc_address)
+    ctf = Web3.to_checksum_address(ctf_address)
+
+    # Consult the local approval cache first: on the common path where the
+    # wallet is already set up from a previous run, all three on-chain reads
+    # are skipped and the script is essentially instant (use --force to
+    # re-check on-chain).
+    approval_cache = load_approval_cache()
+
+    # Recover any signed transactions an interrupted earlier run left behind
+    # BEFORE reading approval state, so the reads observe their effects
     try:
-        current_allowance = usdc_contract.functions.allowance(
-            Web3.to_checksum_address(account.address),
-            Web3.to_checksum_address(venue.exchange)
-        ).call()
-
-        if current_allowance > 0:
-            print(f"   ✅ USDC already approved (allowance: {current_allowance})")
-        else:
-            print("   📝 Approving USDC for venue.exchange...")
-            # Approve max uint256
-            max_uint256 = 2**256 - 1
-            tx = usdc_contract.functions.approve(
-                Web3.to_checksum_address(venue.exchange),
-                max_uint256
-            ).build_transaction({
-                'from': account.address,
-                'nonce': w3.eth.get_transaction_count(account.address),
-                'gas': 100000,
-                'maxFeePerGas': w3.eth.gas_price,
-                'maxPriorityFeePerGas': w3.eth.max_priority_fee,
-                'chainId': CHAIN_ID,
-            })
-
-            signed_tx = account.sign_transaction(tx)
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            print(f"   Transaction sent: {tx_hash.hex()}")
-
-            print("   ⏳ Waiting for confirmation...")
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-
-            if receipt['status'] == 1:
-                print("   ✅ USDC approval successful!\n")
-            else:
-                print("   ❌ USDC approval failed\n")
-                return
-
+        await flush_pending_txs(w3, approval_cache)
     except Exception as e:
-        print(f"   ❌ Error: {e}\n")
-        return
+        log(f"   ⚠️  Could not recover persisted transactions: {e}")
+
+    usdc_key = _approval_cache_key(CHAIN_ID, owner, usdc, exchange)
+    exchange_key = _approval_cache_key(CHAIN_ID, owner, ctf, exchange)
+    adapter_key = _approval_cache_key(CHAIN_ID, owner, ctf, adapter) if adapter else None
+
+    usdc_approved = approval_cache.get(usdc_key, False)
+    exchange_approved = approval_cache.get(exchange_key, False)
+    adapter_approved = approval_cache.get(adapter_key, False) if adapter_key else True
+
+    # Batch the remaining approval-state reads into ONE JSON-RPC request
+    # instead of sequential eth_calls (one HTTP round-trip for all of them).
+    log("🔍 Checking current approvals (batched)...")
+
+    current_allowance = None
+    read_calls = []
+    read_keys = []
+    if not usdc_approved:
+        allowance_data = encode_call(ALLOWANCE_SEL, ["address", "address"], [owner, exchange])
+        read_calls.append(("eth_call", [{"to": usdc, "data": allowance_data}, "latest"]))
+        read_keys.append("usdc")
+    else:
+        log("   ✅ USDC approval cached — skipping on-chain read")
+    if not exchange_approved:
+        exchange_approval_data = encode_call(IS_APPROVED_FOR_ALL_SEL, ["address", "address"], [owner, exchange])
+        read_calls.append(("eth_call", [{"to": ctf, "data": exchange_approval_data}, "latest"]))
+        read_keys.append("exchange")
+    else:
+        log("   ✅ CT approval for venue.exchange cached — skipping on-chain read")
+    # The adapter read depends only on the NegRisk flag (known from market
+    # metadata), not on the exchange-read result, so on a first run it sits
+    # in the same batch as the other two reads rather than waiting on them.
+    if is_negrisk and adapter:
+        if not adapter_approved:
+            adapter_approval_data = encode_call(IS_APPROVED_FOR_ALL_SEL, ["address", "address"], [owner, adapter])
+            read_calls.append(("eth_call", [{"to": ctf, "data": adapter_approval_data}, "latest"]))
+            read_keys.append("adapter")
+        else:
+            log("   ✅ CT approval for venue.adapter cached — skipping on-chain read")
 
-    # Check and set up CT approval for SELL orders
-    print("🔍 Checking CT approval for SELL orders (venue.exchange)...")
-    try:
-        is_approved = ctf_contract.functions.isApprovedForAll(
-            Web3.to_checksum_address(account.address),
-            Web3.to_checksum_address(venue.exchange)
-        ).call()
+    if read_calls:
+        try:
+            # eth_chainId rides along as call 0 — this batch doubles as the
+            # connectivity + chain check
+            results = await rpc_batch(w3, [("eth_chainId", [])] + read_calls)
+        except Exception as e:
+            log("   ❌ Error: Failed to connect to RPC endpoint (or batch rejected)")
+            log(f"   RPC URL: {RPC_URL}")
+            log(f"   {e}\n")
+            return
 
-        if is_approved:
-            print("   ✅ CT already approved for venue.exchange")
-        else:
-            print("   📝 Approving CT for venue.exchange...")
-            tx = ctf_contract.functions.setApprovalForAll(
-                Web3.to_checksum_address(venue.exchange),
-                True
-            ).build_transaction({
-                'from': account.address,
-                'nonce': w3.eth.get_transaction_count(account.address),
-                'gas': 100000,
-                'maxFeePerGas': w3.eth.gas_price,
-                'maxPriorityFeePerGas': w3.eth.max_priority_fee,
-                'chainId': CHAIN_ID,
-            })
-
-            signed_tx = account.sign_transaction(tx)
-            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            print(f"   Transaction sent: {tx_hash.hex()}")
-
-            print("   ⏳ Waiting for confirmation...")
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-
-            if receipt['status'] == 1:
-                print("   ✅ CT approval successful!\n")
+        batch_chain_id = int(results[0], 16)
+        if batch_chain_id != CHAIN_ID:
+            log(f"⚠️  Warning: Connected to chain {batch_chain_id}, expected {CHAIN_ID}")
+            log("   Please check your RPC_URL and CHAIN_ID in .env")
+            return
+        read_results = results[1:]
+
+        for key, result in zip(read_keys, read_results):
+            if key == "usdc":
+                current_allowance = int(result, 16)
+                usdc_approved = current_allowance > 0
+                if usdc_approved:
+                    approval_cache[usdc_key] = True
+            elif key == "exchange":
+                exchange_approved = int(result, 16) != 0
+                if exchange_approved:
+                    approval_cache[exchange_key] = True
             else:
-                print("   ❌ CT approval failed\n")
-                return
+                adapter_approved = int(result, 16) != 0
+                if adapter_approved:
+                    approval_cache[adapter_key] = True
+
+        save_approval_cache(approval_cache)
+
+    needs_usdc_approval = not usdc_approved
+    # Venues that support Permit2/EIP-2612 take a signed permit with each
+    # order instead of a standing allowance — no on-chain approve needed.
+    # (getattr: the field is only present on newer API responses.)
+    if needs_usdc_approval and getattr(venue, "supports_permit2", False):
+        log("   ✅ Permit2/EIP-2612 supported — skipping on-chain USDC approval")
+        needs_usdc_approval = False
+    needs_exchange_approval = not exchange_approved
+    needs_adapter_approval = is_negrisk and adapter is not None and not adapter_approved
+
+    # Fetch all pre-send transaction parameters in ONE batch before any
+    # transaction build. eth_feeHistory yields both the base fee and a
+    # percentile-based priority fee in a single call, replacing the
+    # eth_gasPrice + eth_maxPriorityFeePerGas pair; the same fee data is
+    # reused across every approval transaction.
+    max_fee = None
+    priority_fee = None
+    nonce = None
+    if needs_usdc_approval or needs_exchange_approval or needs_adapter_approval:
+        try:
+            gas_results = await rpc_batch(
+                w3,
+                [
+                    ("eth_chainId", []),
+                    ("eth_feeHistory", ["0x5", "latest", [50]]),
+                    # "pending" counts mempool txs too, so consecutive runs
+                    # (or anything else this key signed recently) don't
+                    # collide on a stale nonce
+                    ("eth_getTransactionCount", [owner, "pending"]),
+                ],
+            )
+        except Exception as e:
+            log(f"   ❌ Error fetching transaction parameters: {e}\n")
+            return
 
-    except Exception as e:
-        print(f"   ❌ Error: {e}\n")
-        return
+        batch_chain_id = int(gas_results[0], 16)
+        if batch_chain_id != CHAIN_ID:
+            log(f"⚠️  Warning: Connected to chain {batch_chain_id}, expected {CHAIN_ID}")
+            return
 
-    # For NegRisk markets, also approve CT to adapter
-    if is_negrisk and venue.adapter:
-        print("🔍 NegRisk Market Detected - Checking CT approval for venue.adapter...")
-        try:
-            is_approved_adapter = ctf_contract.functions.isApprovedForAll(
-                Web3.to_checksum_address(account.address),
-                Web3.to_checksum_address(venue.adapter)
-            ).call()
+        fee_history = gas_results[1]
+        base_fee = int(fee_history["baseFeePerGas"][-1], 16)
+        priority_fee = max(
+            (int(reward[0], 16) for reward in fee_history.get("reward", []) if reward),
+            default=0,
+        )
+        # Double the base fee so the transactions survive short fee spikes
+        max_fee = 2 * base_fee + priority_fee
+        nonce = int(gas_results[2], 16)
+
+    # Report the approvals that were just observed on-chain (cache hits were
+    # already reported above)
+    if "usdc" in read_keys and usdc_approved:
+        log(f"   ✅ USDC already approved (allowance: {current_allowance})")
+    if "exchange" in read_keys and exchange_approved:
+        log("   ✅ CT already approved for venue.exchange")
+    if "adapter" in read_keys and adapter_approved:
+        log("   ✅ CT already approved for venue.adapter")
+
+    # Collect the pending approvals. The three transactions are independent
+    # (different contracts or different operator slots), so they can be
+    # signed with consecutive nonces and submitted in parallel — total
+    # latency is ~1 block time instead of ~3.
+    approvals_needed = []
+    if needs_usdc_approval:
+        approvals_needed.append((
+            "USDC approval for venue.exchange",
+            usdc,
+            encode_call(APPROVE_SEL, ["address", "uint256"], [exchange, MAX_UINT96]),
+            usdc_key,
+        ))
+    if needs_exchange_approval:
+        approvals_needed.append((
+            "CT approval for venue.exchange",
+            ctf,
+            encode_call(SET_APPROVAL_FOR_ALL_SEL, ["address", "bool"], [exchange, True]),
+            exchange_key,
+        ))
+    if needs_adapter_approval:
+        approvals_needed.append((
+            "CT approval for venue.adapter",
+            ctf,
+            encode_call(SET_APPROVAL_FOR_ALL_SEL, ["address", "bool"], [adapter, True]),
+            adapter_key,
+        ))
+
+    if approvals_needed:
+        # Prefer one atomic EIP-5792 batch over N separate transactions when
+        # the signing key is a smart-account-compatible wallet
+        batch_result = await try_send_calls(w3, account, approvals_needed, CHAIN_ID)
+        if batch_result is True:
+            for label, _, _, _ in approvals_needed:
+                log(f"   ✅ {label} successful!")
+            log()
+            if needs_usdc_approval:
+                approval_cache[usdc_key] = True
+            if needs_exchange_approval:
+                approval_cache[exchange_key] = True
+            if needs_adapter_approval:
+                approval_cache[adapter_key] = True
+            save_approval_cache(approval_cache)
+        elif batch_result is False:
+            for label, _, _, _ in approvals_needed:
+                log(f"   ❌ {label} failed")
+            log()
+            return
 
-            if is_approved_adapter:
-                print("   ✅ CT already approved for venue.adapter")
-            else:
-                print("   📝 Approving CT for venue.adapter...")
-                tx = ctf_contract.functions.setApprovalForAll(
-                    Web3.to_checksum_address(venue.adapter),
-                    True
-                ).build_transaction({
-                    'from': account.address,
-                    'nonce': w3.eth.get_transaction_count(account.address),
-                    'gas': 100000,
-                    'maxFeePerGas': w3.eth.gas_price,
-                    'maxPriorityFeePerGas': w3.eth.max_priority_fee,
+    if approvals_needed and batch_result is None:
+        try:
+            # Sign all transactions up front with pre-assigned nonces N, N+1, N+2.
+            # Every field is supplied, so the dicts are assembled directly and
+            # signed without web3.py's build_transaction defaulting pipeline.
+            signed_txs = []
+            pending_entries = []
+            for i, (label, to_address, data, cache_key) in enumerate(approvals_needed):
+                log(f"   📝 Building {label}...")
+                tx = {
                     'chainId': CHAIN_ID,
+                    'nonce': nonce + i,
+                    'to': to_address,
+                    'value': 0,
+                    # approve/setApprovalForAll cost ~25-46k gas; a fixed 60k
+                    # limit covers both and skips eth_estimateGas entirely
+                    'gas': 60000,
+                    'maxFeePerGas': max_fee,
+                    'maxPriorityFeePerGas': priority_fee,
+                    'data': data,
+                    'type': 2,
+                }
+                signed = account.sign_transaction(tx)
+                signed_txs.append((label, signed))
+                pending_entries.append({
+                    "nonce": nonce + i,
+                    "hash": Web3.to_hex(signed.hash),
+                    "raw": Web3.to_hex(signed.raw_transaction),
+                    "label": label,
+                    "cache_key": cache_key,
                 })
 
-                signed_tx = account.sign_transaction(tx)
-                tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                print(f"   Transaction sent: {tx_hash.hex()}")
-
-                print("   ⏳ Waiting for confirmation...")
-                receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-
+            # Persist the signed raw txs BEFORE hitting the wire: if the
+            # response is lost mid-send, the next run rebroadcasts these
+            # exact bytes instead of re-signing at a new nonce
+            save_pending_txs(pending_entries)
+
+            # Submit all approvals concurrently
+            tx_hashes = await asyncio.gather(
+                *(w3.eth.send_raw_transaction(signed.raw_transaction) for _, signed in signed_txs)
+            )
+            for (label, _), tx_hash in zip(signed_txs, tx_hashes):
+                log(f"   Transaction sent ({label}): {tx_hash.hex()}")
+
+            # Await all receipts concurrently — they land in the same block
+            # (or adjacent blocks), so this costs ~1 block time total
+            log("   ⏳ Waiting for confirmations...")
+            flush_log()
+            receipts = await wait_for_receipts(w3, tx_hashes)
+
+            # All txs are mined (successfully or not) — nothing left to
+            # rebroadcast on a future run
+            save_pending_txs([])
+
+            for (label, _), receipt in zip(signed_txs, receipts):
                 if receipt['status'] == 1:
-                    print("   ✅ CT approval for adapter successful!\n")
+                    log(f"   ✅ {label} successful!")
                 else:
-                    print("   ❌ CT approval for adapter failed\n")
-                    return
+                    log(f"   ❌ {label} failed")
+
+            if any(receipt['status'] != 1 for receipt in receipts):
+                log()
+                return
+            log()
+
+            # Remember the confirmed approvals so the next run skips the reads
+            if needs_usdc_approval:
+                approval_cache[usdc_key] = True
+            if needs_exchange_approval:
+                approval_cache[exchange_key] = True
+            if needs_adapter_approval:
+                approval_cache[adapter_key] = True
+            save_approval_cache(approval_cache)
 
         except Exception as e:
-            print(f"   ❌ Error: {e}\n")
+            log(f"   ❌ Error: {e}\n")
             return
 
     # Summary
-    print("=" * 60)
-    print("✅ Token Approval Setup Complete!")
-    print("=" * 60)
-    print()
-    print("You can now:")
-    print("  - Place BUY orders (USDC approved)")
-    print("  - Place SELL orders (CT approved)")
+    log("=" * 60)
+    log("✅ Token Approval Setup Complete!")
+    log("=" * 60)
+    log()
+    log("You can now:")
+    log("  - Place BUY orders (USDC approved)")
+    log("  - Place SELL orders (CT approved)")
     if is_negrisk:
-        print("  - Trade on NegRisk markets (CT approved for both exchange and adapter)")
-    print()
-    print("These approvals are permanent until you revoke them.")
-    print("You only need to run this setup once per wallet.")
+        log("  - Trade on NegRisk markets (CT approved for both exchange and adapter)")
+    log()
+    log("These approvals are permanent until you revoke them.")
+    log("You only need to run this setup once per wallet.")
+
+
+async def main():
+    try:
+        await setup_approvals()
+    finally:
+        flush_log()
+        await close_clients()
 
 
 if __name__ == "__main__":
-    asyncio.run(setup_approvals())
+    asyncio.run(main())
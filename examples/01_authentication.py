@@ -33,14 +33,14 @@ Logging:
 
 import asyncio
 import os
-from dotenv import load_dotenv
 from limitless_sdk.api import HttpClient, APIError, AuthenticationError
 from limitless_sdk.portfolio import PortfolioFetcher
 from limitless_sdk.markets import MarketFetcher
 from limitless_sdk.types import ConsoleLogger, LogLevel
 
-# Load environment variables from .env file
-load_dotenv()
+from _common import load_env
+
+load_env()
 
 # Configuration
 API_URL = "https://api.limitless.exchange"
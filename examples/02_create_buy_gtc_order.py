@@ -15,15 +15,15 @@ Notes:
 
 import asyncio
 import os
-from dotenv import load_dotenv
 from eth_account import Account
-from limitless_sdk.api import HttpClient
+
+from _cache import get_market_cached, get_profile
+from _common import close_clients, get_clients, load_env
 from limitless_sdk.orders import OrderClient
 from limitless_sdk.markets import MarketFetcher
 from limitless_sdk.types import Side, OrderType
 
-# Load environment variables
-load_dotenv()
+load_env()
 
 # Configuration
 API_URL = os.getenv("API_URL", "https://api.limitless.exchange")
@@ -47,13 +47,15 @@ async def main():
     account = Account.from_key(private_key)
     print(f"Wallet: {account.address}")
 
-    http_client = HttpClient(base_url=API_URL, api_key=LIMITLESS_API_KEY)
+    # Shared, warm-keep-alive HTTP client (see examples/_common.py)
+    http_client, _ = await get_clients()
 
     try:
 
-        # Get market by slug
+        # Get market by slug (from the on-disk cache when fresh; see
+        # examples/_cache.py — pass --force to bypass)
         market_fetcher = MarketFetcher(http_client)
-        market = await market_fetcher.get_market(MARKET_SLUG)
+        market = await get_market_cached(market_fetcher, MARKET_SLUG)
 
         print(f"Market: {market.title}")
 
@@ -63,10 +65,14 @@ async def main():
 
         token_id = str(market.tokens.yes)
 
-        # Create order client (user data fetched automatically from profile)
+        # Create order client, seeding user data from the cache so the first
+        # order skips the profile round-trip
+        user_data = await get_profile(http_client, account.address)
         order_client = OrderClient(
             http_client=http_client,
             wallet=account,
+            market_fetcher=market_fetcher,
+            user_data=user_data,
         )
 
         # Place GTC order
@@ -87,8 +93,30 @@ async def main():
         if order.maker_matches:
             print(f"Matched: {len(order.maker_matches)} fills")
 
+        # Place a ladder of bids concurrently. create_orders() signs in a
+        # thread pool and submits with asyncio.gather, so the whole ladder
+        # costs ~1 API round-trip instead of one per level.
+        price_grid = [0.45, 0.46, 0.47]
+        specs = [
+            dict(
+                token_id=token_id,
+                price=p,
+                size=5.0,
+                side=Side.BUY,
+                order_type=OrderType.GTC,
+                market_slug=market.slug,
+                post_only=True,
+            )
+            for p in price_grid
+        ]
+        ladder = await order_client.create_orders(specs)
+
+        print(f"\nLadder placed: {len(ladder)} orders")
+        for placed in ladder:
+            print(f"  {placed.order.price} -> {placed.order.id}")
+
     finally:
-        await http_client.close()
+        await close_clients()
 
 
 if __name__ == "__main__":
@@ -17,13 +17,12 @@ Setup:
 
 import asyncio
 import os
-from dotenv import load_dotenv
 from eth_account import Account
-from limitless_sdk.api import HttpClient
+
+from _common import close_clients, get_clients, load_env
 from limitless_sdk.orders import OrderClient
 
-# Load environment variables
-load_dotenv()
+load_env()
 
 # Configuration
 API_URL = os.getenv("API_URL", "https://api.limitless.exchange")
@@ -52,7 +51,8 @@ async def main():
     account = Account.from_key(private_key)
     print(f"Wallet: {account.address}\n")
 
-    http_client = HttpClient(base_url=API_URL, api_key=LIMITLESS_API_KEY)
+    # Shared, warm-keep-alive HTTP client (see examples/_common.py)
+    http_client, _ = await get_clients()
 
     try:
         # Create order client (user data fetched automatically from profile)
@@ -79,7 +79,7 @@ async def main():
             print("No order_id or market_slug set. Update lines 36-37 with your values.")
 
     finally:
-        await http_client.close()
+        await close_clients()
 
 
 if __name__ == "__main__":
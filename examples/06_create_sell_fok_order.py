@@ -17,15 +17,15 @@ Note:
 
 import asyncio
 import os
-from dotenv import load_dotenv
 from eth_account import Account
 from limitless_sdk.api import HttpClient
 from limitless_sdk.orders import OrderClient
 from limitless_sdk.markets import MarketFetcher
 from limitless_sdk.types import Side, OrderType
 
-# Load environment variables
-load_dotenv()
+from _common import load_env
+
+load_env()
 
 # Configuration
 API_URL = os.getenv("API_URL", "https://api.limitless.exchange")
@@ -16,13 +16,13 @@ Features:
 
 import asyncio
 import os
-from dotenv import load_dotenv
 from limitless_sdk.api import HttpClient, RetryableClient, RetryConfig, APIError
 from limitless_sdk.portfolio import PortfolioFetcher
 from limitless_sdk.types import ConsoleLogger, LogLevel
 
-# Load environment variables
-load_dotenv()
+from _common import load_env
+
+load_env()
 
 # Configuration
 API_URL = os.getenv("API_URL", "https://api.limitless.exchange")
@@ -9,11 +9,11 @@ Setup:
 
 import asyncio
 import os
-from dotenv import load_dotenv
 from limitless_sdk.websocket import WebSocketClient, WebSocketConfig, OrderbookUpdate
 
-# Load environment variables
-load_dotenv()
+from _common import load_env
+
+load_env()
 
 # Configuration
 WS_URL = os.getenv("WS_URL", "wss://ws.limitless.exchange")
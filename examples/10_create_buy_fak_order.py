@@ -17,7 +17,6 @@ Note:
 import asyncio
 import os
 
-from dotenv import load_dotenv
 from eth_account import Account
 
 from limitless_sdk.api import HttpClient
@@ -25,7 +24,9 @@ from limitless_sdk.markets import MarketFetcher
 from limitless_sdk.orders import OrderClient
 from limitless_sdk.types import OrderType, Side
 
-load_dotenv()
+from _common import load_env
+
+load_env()
 
 API_URL = os.getenv("API_URL", "https://api.limitless.exchange")
 LIMITLESS_API_KEY = os.getenv("LIMITLESS_API_KEY")
@@ -0,0 +1,113 @@
+"""Thin on-disk cache for the example scripts.
+
+Examples 02/04 re-fetch the full market object on every invocation purely to
+look up token IDs and venue addresses, and the order client re-fetches the
+wallet's profile for user_id/fee_rate_bps. Both are effectively static for
+the life of a market, so each script run pays ~3 avoidable HTTP round-trips.
+This module persists them to ~/.limitless/cache.json: market entries are
+keyed by (api_url, slug) with a 10-minute TTL, profile entries by
+(api_url, wallet) with a 24-hour TTL (fee rates change rarely). A cache miss
+falls through to the normal fetch path, and passing --force bypasses reads.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from limitless_sdk.markets import MarketFetcher
+from limitless_sdk.portfolio import PortfolioFetcher
+from limitless_sdk.types import Market, UserData
+
+CACHE_PATH = Path.home() / ".limitless" / "cache.json"
+
+MARKET_TTL = 600        # 10 minutes
+PROFILE_TTL = 86400     # 24 hours
+
+
+def _load_cache() -> dict:
+    """Read the cache file, honoring --force and tolerating corruption."""
+    if "--force" in sys.argv:
+        return {}
+    try:
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict) -> None:
+    """Best-effort write of the cache file; failures are non-fatal."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _get_entry(cache: dict, key: str, ttl: int) -> Optional[dict]:
+    entry = cache.get(key)
+    if entry and time.time() - entry.get("ts", 0) < ttl:
+        return entry["data"]
+    return None
+
+
+async def get_profile(http_client, wallet_address: str) -> UserData:
+    """Get UserData for a wallet, from cache when fresh.
+
+    Args:
+        http_client: Shared HttpClient (its base_url keys the cache entry)
+        wallet_address: Wallet address to fetch the profile for
+
+    Returns:
+        UserData with user_id and fee_rate_bps
+    """
+    cache = _load_cache()
+    key = f"profile:{http_client.base_url}:{wallet_address.lower()}"
+
+    data = _get_entry(cache, key, PROFILE_TTL)
+    if data is None:
+        profile = await PortfolioFetcher(http_client).get_profile(wallet_address)
+        data = {
+            "user_id": profile["id"],
+            "fee_rate_bps": profile.get("rank", {}).get("feeRateBps", 300),
+        }
+        cache[key] = {"ts": time.time(), "data": data}
+        _save_cache(cache)
+
+    return UserData(**data)
+
+
+async def get_market_cached(market_fetcher: MarketFetcher, slug: str) -> Market:
+    """Get a market by slug, from cache when fresh.
+
+    On a hit the market is rebuilt from the cached API payload and its venue
+    is seeded into the fetcher's venue cache (mirroring what get_market()
+    does), so order creation still skips the market round-trip.
+
+    Args:
+        market_fetcher: MarketFetcher to use on cache miss (and to seed)
+        slug: Market slug identifier
+
+    Returns:
+        Market object
+    """
+    cache = _load_cache()
+    key = f"market:{market_fetcher._http_client.base_url}:{slug}"
+
+    data = _get_entry(cache, key, MARKET_TTL)
+    if data is not None:
+        market = Market(**data)
+        if market.venue:
+            market_fetcher._venue_cache[slug] = market.venue
+        return market
+
+    market = await market_fetcher.get_market(slug)
+    cache[key] = {
+        "ts": time.time(),
+        "data": market.model_dump(mode="json", by_alias=True, exclude_none=True),
+    }
+    _save_cache(cache)
+    return market
@@ -0,0 +1,74 @@
+"""Shared client setup for the example scripts.
+
+Each example script used to construct its own HttpClient (and, for on-chain
+scripts, its own Web3 provider), so every invocation opened a fresh
+connection pool and paid a TCP+TLS handshake (~2 RTTs) on the first request.
+When the examples are reused as building blocks for a bot, that per-script
+cold start dominates. This module builds the clients once per process and
+hands out the same warm, keep-alive instances to every caller.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from limitless_sdk.api import HttpClient
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Parse .env into os.environ exactly once per process.
+
+    Every example calling dotenv.load_dotenv() directly means one .env read
+    and os.environ rewrite per imported module; routing them all through this
+    cached wrapper makes it a single parse no matter how many example modules
+    a bot pulls in. Set LIMITLESS_SKIP_DOTENV in container/CI runs where the
+    environment is already populated.
+    """
+    if os.getenv("LIMITLESS_SKIP_DOTENV"):
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+# Process-wide client pair, built on first use
+_clients: Optional[Tuple[HttpClient, "AsyncWeb3"]] = None
+
+
+async def get_clients():
+    """Return the process-wide (HttpClient, AsyncWeb3) pair.
+
+    Both clients keep their underlying aiohttp sessions alive between calls,
+    so repeated API and RPC requests reuse pooled connections instead of
+    re-handshaking. Callers must NOT close the returned clients — they are
+    shared; call close_clients() once at process exit instead.
+
+    Returns:
+        Tuple of (HttpClient, AsyncWeb3) configured from API_URL,
+        LIMITLESS_API_KEY and RPC_URL environment variables
+    """
+    global _clients
+    if _clients is None:
+        from web3 import AsyncWeb3
+        from web3.providers.rpc import AsyncHTTPProvider
+
+        http_client = HttpClient(
+            base_url=os.getenv("API_URL", "https://api.limitless.exchange"),
+            api_key=os.getenv("LIMITLESS_API_KEY"),
+        )
+        w3 = AsyncWeb3(AsyncHTTPProvider(os.getenv("RPC_URL", "https://mainnet.base.org")))
+        _clients = (http_client, w3)
+
+    return _clients
+
+
+async def close_clients() -> None:
+    """Close the shared clients. Call once, at process exit."""
+    global _clients
+    if _clients is not None:
+        http_client, w3 = _clients
+        await http_client.close()
+        provider = getattr(w3, "provider", None)
+        if provider is not None and hasattr(provider, "disconnect"):
+            await provider.disconnect()
+        _clients = None
@@ -7,18 +7,18 @@ for your account using API key authentication.
 import asyncio
 import os
 import sys
-from dotenv import load_dotenv
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from _common import load_env
 from limitless_sdk.websocket import WebSocketClient
 from limitless_sdk.websocket.types import WebSocketConfig
 
 
 async def main():
-    # Load environment variables
-    load_dotenv()
+    # Load environment variables (cached one-shot parse; see _common.py)
+    load_env()
 
     # Validate API key is set
     api_key = os.getenv('LIMITLESS_API_KEY')
@@ -88,11 +88,11 @@ async def main():
         print(f"Subscribed to positions for markets: {', '.join(market_slugs)}")
         print('Monitoring positions...\n')
 
-        # Keep the client running
-        while True:
-            await asyncio.sleep(1)
+        # Park until cancelled — unlike a sleep loop this never wakes the
+        # event loop while idle
+        await asyncio.Event().wait()
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print('\nShutting down...')
         await client.disconnect()
     except Exception as e:
@@ -39,14 +39,6 @@ from .portfolio import PortfolioFetcher
 from .api_tokens import ApiTokenService
 from .partner_accounts import PartnerAccountService
 from .delegated_orders import DelegatedOrderService
-from .server_wallets import ServerWalletService
-
-# Orders module
-from .orders import (
-    OrderBuilder,
-    OrderSigner,
-    OrderClient,
-)
 
 # WebSocket module
 from .websocket import (
@@ -64,9 +56,6 @@ from .websocket import (
     PriceUpdate,
 )
 
-# Root client
-from .sdk_client import Client
-
 # Type definitions
 from .types import (
     # Logger types
@@ -159,7 +148,6 @@ from .utils import (
 )
 
 # Legacy client - maintained for backward compatibility
-from .client import LimitlessClient
 from .models import (
     Order,
     CreateOrderDto as LegacyCreateOrderDto,
@@ -175,6 +163,34 @@ from .exceptions import (
     AuthenticationError as LegacyAuthenticationError,
 )
 
+# PEP 562 lazy imports for everything that drags in the crypto stack
+# (eth_account / eth_abi / eth_utils, ~0.5s of import time). Read-only or
+# websocket-only consumers never pay for signing machinery they don't use;
+# the attribute is imported on first access and cached in module globals.
+_LAZY_IMPORTS = {
+    "OrderBuilder": ".orders",
+    "OrderSigner": ".orders",
+    "OrderClient": ".orders",
+    "Client": ".sdk_client",
+    "LimitlessClient": ".client",
+    "ServerWalletService": ".server_wallets",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 __all__ = [
     # Version
     "__version__",
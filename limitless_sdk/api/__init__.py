@@ -13,6 +13,12 @@ from .retry import (
     RetryConfig,
     RetryableClient,
 )
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from .rate_limiter import AsyncTokenBucket
 
 __all__ = [
     "HttpClient",
@@ -25,4 +31,8 @@ __all__ = [
     "retry_on_errors",
     "RetryConfig",
     "RetryableClient",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "AsyncTokenBucket",
 ]
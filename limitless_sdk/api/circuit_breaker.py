@@ -0,0 +1,106 @@
+"""Circuit breaker for failing fast during sustained API outages."""
+
+import time
+from enum import Enum
+
+from .errors import APIError
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(APIError):
+    """Raised when a request is rejected because the circuit is open.
+
+    No HTTP request was made; the breaker is failing fast until the
+    recovery timeout elapses.
+    """
+
+    __slots__ = ("recovery_in",)
+
+    def __init__(self, recovery_in: float):
+        super().__init__(
+            f"Circuit breaker is open; retry in {recovery_in:.1f}s"
+        )
+        self.recovery_in = recovery_in
+
+
+class CircuitBreaker:
+    """CLOSED -> OPEN -> HALF_OPEN circuit breaker state machine.
+
+    Retrying blindly through a sustained outage wastes backoff sleeps and
+    amplifies load on an already-struggling API. After failure_threshold
+    consecutive server-side failures the breaker opens and requests fail
+    fast with CircuitOpenError — an O(1) state check instead of a full
+    request + backoff cycle. After recovery_timeout seconds one probe
+    request is let through (HALF_OPEN): success closes the circuit,
+    failure re-opens it.
+
+    Args:
+        failure_threshold: Consecutive failures before opening (default: 5)
+        recovery_timeout: Seconds to stay open before probing (default: 30)
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+        >>> if breaker.allow():
+        ...     try:
+        ...         data = await client.get("/markets")
+        ...         breaker.on_success()
+        ...     except APIError:
+        ...         breaker.on_failure()
+        ...         raise
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            recovery_timeout: Seconds to stay open before probing
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current breaker state."""
+        return self._state
+
+    def allow(self) -> bool:
+        """Check whether a request may proceed.
+
+        Returns:
+            True if the request should be attempted, False to fail fast
+        """
+        if self._state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self._state = CircuitState.HALF_OPEN
+                return True
+            return False
+        return True
+
+    def recovery_in(self) -> float:
+        """Seconds until the breaker will allow a probe request."""
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def on_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+
+    def on_failure(self) -> None:
+        """Record a failed call, opening the circuit when warranted."""
+        self._failures += 1
+        if self._state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
@@ -1,11 +1,17 @@
 """Exception classes for Limitless Exchange SDK."""
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 
 class APIError(Exception):
     """Base exception for API errors with rich context."""
 
+    # One of these is raised on every failed HTTP call, and RetryableClient
+    # raises/catches several per retried request. Slots keep attribute writes
+    # out of a per-instance __dict__ (which is then never materialized),
+    # roughly halving the memory per exception.
+    __slots__ = ("message", "status_code", "response_data", "url", "method", "headers", "_str_cache")
+
     def __init__(
         self,
         message: str,
@@ -13,6 +19,7 @@ class APIError(Exception):
         response_data: Optional[Any] = None,
         url: Optional[str] = None,
         method: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         """Initialize API error with context.
 
@@ -22,6 +29,7 @@ class APIError(Exception):
             response_data: Raw response data from API
             url: Request URL that caused the error
             method: HTTP method (GET, POST, etc.)
+            headers: Response headers, lowercase keys (e.g. retry-after)
         """
         super().__init__(message)
         self.message = message
@@ -29,6 +37,7 @@ class APIError(Exception):
         self.response_data = response_data
         self.url = url
         self.method = method
+        self.headers = headers
 
     def is_auth_error(self) -> bool:
         """Check if this is an authentication error (401 or 403).
@@ -36,20 +45,33 @@ class APIError(Exception):
         Returns:
             True if status code is 401 or 403
         """
-        return self.status_code in (401, 403)
+        s = self.status_code
+        return s == 401 or s == 403
 
     def __str__(self) -> str:
-        """String representation with context."""
-        if not self.method and not self.url:
-            return self.message
+        """String representation with context.
 
-        parts = []
-        if self.method and self.url:
-            parts.append(f"{self.method} {self.url}")
-        if self.status_code:
-            parts.append(f"HTTP {self.status_code}")
-        parts.append(self.message)
-        return " | ".join(parts)
+        Formatted once and memoized: retry loops str() the same exception
+        several times (logger lines, on_retry callbacks) and the attributes
+        never change after construction.
+        """
+        cached = getattr(self, "_str_cache", None)
+        if cached is not None:
+            return cached
+
+        if not self.method and not self.url:
+            result = self.message
+        else:
+            parts = []
+            if self.method and self.url:
+                parts.append(f"{self.method} {self.url}")
+            if self.status_code:
+                parts.append(f"HTTP {self.status_code}")
+            parts.append(self.message)
+            result = " | ".join(parts)
+
+        self._str_cache = result
+        return result
 
     def __repr__(self) -> str:
         """String representation of error."""
@@ -64,6 +86,8 @@ class APIError(Exception):
 class RateLimitError(APIError):
     """Exception for rate limiting errors (429)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -71,6 +95,7 @@ class RateLimitError(APIError):
         response_data: Optional[Any] = None,
         url: Optional[str] = None,
         method: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         """Initialize rate limit error.
 
@@ -80,14 +105,17 @@ class RateLimitError(APIError):
             response_data: Raw response data
             url: Request URL
             method: HTTP method
+            headers: Response headers, lowercase keys
         """
-        super().__init__(message, status_code, response_data, url, method)
+        super().__init__(message, status_code, response_data, url, method, headers)
 
 
 
 class AuthenticationError(APIError):
     """Exception for authentication errors (401, 403)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -95,6 +123,7 @@ class AuthenticationError(APIError):
         response_data: Optional[Any] = None,
         url: Optional[str] = None,
         method: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         """Initialize authentication error.
 
@@ -104,13 +133,16 @@ class AuthenticationError(APIError):
             response_data: Raw response data
             url: Request URL
             method: HTTP method
+            headers: Response headers, lowercase keys
         """
-        super().__init__(message, status_code, response_data, url, method)
+        super().__init__(message, status_code, response_data, url, method, headers)
 
 
 class ValidationError(APIError):
     """Exception for validation errors (400)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -118,6 +150,7 @@ class ValidationError(APIError):
         response_data: Optional[Any] = None,
         url: Optional[str] = None,
         method: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         """Initialize validation error.
 
@@ -127,13 +160,16 @@ class ValidationError(APIError):
             response_data: Raw response data
             url: Request URL
             method: HTTP method
+            headers: Response headers, lowercase keys
         """
-        super().__init__(message, status_code, response_data, url, method)
+        super().__init__(message, status_code, response_data, url, method, headers)
 
 
 class ConflictError(APIError):
     """Exception for conflict errors (409)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -141,6 +177,7 @@ class ConflictError(APIError):
         response_data: Optional[Any] = None,
         url: Optional[str] = None,
         method: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
     ):
         """Initialize conflict error.
 
@@ -150,5 +187,6 @@ class ConflictError(APIError):
             response_data: Raw response data
             url: Request URL
             method: HTTP method
+            headers: Response headers, lowercase keys
         """
-        super().__init__(message, status_code, response_data, url, method)
+        super().__init__(message, status_code, response_data, url, method, headers)
@@ -1,13 +1,17 @@
 """HTTP client for Limitless Exchange API."""
 
+import asyncio
 import json
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Set, Tuple
-from urllib.parse import urlencode
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import quote_plus
 
 import aiohttp
+from yarl import URL
 
 from .errors import (
     APIError,
@@ -17,6 +21,7 @@ from .errors import (
     ValidationError,
 )
 from .hmac import compute_hmac_signature
+from .rate_limiter import AsyncTokenBucket
 from .._sdk_tracking import _build_sdk_tracking_headers
 from ..types.api_tokens import HMACCredentials
 from ..types.logger import ILogger, NoOpLogger
@@ -24,6 +29,10 @@ from ..types.logger import ILogger, NoOpLogger
 
 DEFAULT_API_URL = "https://api.limitless.exchange"
 DEFAULT_TIMEOUT = 30
+DEFAULT_POOL_SIZE = 50
+DEFAULT_KEEPALIVE_EXPIRY = 30
+DEFAULT_MAX_CONCURRENT = 50
+DEFAULT_DNS_CACHE_TTL = 300
 _AUTH_OVERRIDE_HEADERS = {
     "authorization",
     "cookie",
@@ -42,6 +51,24 @@ _REDACTED_HEADERS = {
     "lmts-timestamp",
     "x-api-key",
 }
+# Exact-casing variants the SDK and callers actually emit, so the debug-log
+# sanitizer does one set lookup per header instead of lowercasing each name
+_REDACTED_HEADERS_EXACT = _REDACTED_HEADERS | {
+    "Authorization",
+    "Cookie",
+    "Identity",
+    "X-API-Key",
+    "X-Api-Key",
+}
+# Status -> exception dispatch: one dict lookup instead of an if/elif
+# chain that grows with every new error class
+_STATUS_TO_EXC = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: AuthenticationError,
+    409: ConflictError,
+    429: RateLimitError,
+}
 
 
 def _build_iso_timestamp() -> str:
@@ -52,10 +79,69 @@ def _build_iso_timestamp() -> str:
     )
 
 
-def _serialize_json_body(data: Optional[Any]) -> str:
+# JSON (de)serialization runs on every request and response, so prefer
+# orjson (C extension, ~2-5x faster decode) when installed and fall back to
+# stdlib json so it stays an optional dependency — same pattern as the
+# websocket frame codec.
+try:
+    import orjson as _orjson
+
+    def _json_dumps(data: Any) -> str:
+        return _orjson.dumps(data).decode()
+
+    # Bodies go on the wire as bytes anyway; serializing straight to bytes
+    # skips a decode/re-encode round-trip per POST
+    _json_dumps_bytes = _orjson.dumps
+    _json_loads = _orjson.loads
+    _JsonDecodeError = _orjson.JSONDecodeError
+except ImportError:
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    def _json_dumps_bytes(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    _json_loads = json.loads
+    _JsonDecodeError = json.JSONDecodeError
+
+
+def _serialize_json_body(data: Optional[Any]) -> bytes:
+    # Bytes all the way to the socket: aiohttp sends them as-is, with no
+    # json-payload wrapper or str re-encode in between
     if data is None:
-        return ""
-    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        return b""
+    return _json_dumps_bytes(data)
+
+
+def _build_query(params: Dict[str, Any]) -> str:
+    """Encode a small flat param dict as a query string.
+
+    Specialized replacement for urllib's urlencode: the SDK's params are a
+    handful of str/int/bool values, so a tight append/join loop beats the
+    generic implementation. Output matches urlencode(doseq=True) for str
+    and int values (quote_plus quoting, repeated keys for sequences);
+    bools are emitted as the JSON-style "true"/"false" the API expects.
+    """
+    parts: List[str] = []
+    append = parts.append
+    for key, value in params.items():
+        encoded_key = quote_plus(key if isinstance(key, str) else str(key))
+        if isinstance(value, str):
+            append(encoded_key + "=" + quote_plus(value))
+        elif value is True:
+            append(encoded_key + "=true")
+        elif value is False:
+            append(encoded_key + "=false")
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                append(
+                    encoded_key
+                    + "="
+                    + quote_plus(item if isinstance(item, str) else str(item))
+                )
+        else:
+            append(encoded_key + "=" + quote_plus(str(value)))
+    return "&".join(parts)
 
 
 @dataclass
@@ -68,16 +154,75 @@ class HttpRawResponse:
 
 
 class HttpClient:
-    """HTTP client wrapper for Limitless Exchange API."""
+    """HTTP client wrapper for Limitless Exchange API.
+
+    Share one instance across the application: the underlying connection
+    pool amortizes TCP/TLS handshakes and DNS lookups across requests, so
+    per-call construction throws that reuse away.
+
+    Args:
+        base_url: API base URL (default: LIMITLESS_API_URL env or production)
+        api_key: API key for authentication
+        hmac_credentials: HMAC credentials for authenticated requests
+        timeout: Request timeout — seconds (split into connect/read
+            phases) or an aiohttp.ClientTimeout for full control
+        additional_headers: Extra headers sent with every request
+        logger: Optional logger for debugging
+        pool_size: Total connection pool size
+        pool_size_per_host: Per-host connection cap (0 = unlimited)
+        keepalive_expiry: Seconds to keep idle sockets open
+        dns_cache_ttl: Seconds to cache DNS lookups
+        max_concurrent: Bulkhead cap on in-flight requests
+        rate_limit: Optional proactive requests-per-second budget
+        cache_ttl: Seconds to cache GET responses (0 = caching disabled)
+        cache_maxsize: Maximum cached GET responses (LRU eviction)
+    """
+
+    # Slots skip the per-instance __dict__ and make attribute reads a fixed
+    # offset lookup — every request touches a dozen of these attributes, and
+    # it catches typo'd assignments. Subclasses adding state declare their
+    # own __slots__.
+    __slots__ = (
+        "base_url",
+        "_api_key",
+        "_hmac_credentials",
+        "_timeout",
+        "_pool_size",
+        "_pool_size_per_host",
+        "_keepalive_expiry",
+        "_dns_cache_ttl",
+        "_bulkhead",
+        "_rate_limiter",
+        "_additional_headers",
+        "_logger",
+        "_debug_enabled",
+        "_session",
+        "_url_cache",
+        "_cache_ttl",
+        "_cache_maxsize",
+        "_response_cache",
+        "_inflight",
+        "_base_headers_list",
+        "_base_headers_list_json",
+        "_static_headers_ok",
+    )
 
     def __init__(
         self,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         hmac_credentials: Optional[HMACCredentials] = None,
-        timeout: int = DEFAULT_TIMEOUT,
+        timeout: Union[int, float, aiohttp.ClientTimeout] = DEFAULT_TIMEOUT,
         additional_headers: Optional[Dict[str, str]] = None,
         logger: Optional[ILogger] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_size_per_host: int = 0,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        rate_limit: Optional[float] = None,
+        cache_ttl: float = 0.0,
+        cache_maxsize: int = 256,
     ):
         self.base_url = (
             base_url or os.getenv("LIMITLESS_API_URL") or DEFAULT_API_URL
@@ -92,15 +237,55 @@ class HttpClient:
                 else None
             )
         )
-        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        # Split timeout budget: connect phases fail fast (slow DNS or an
+        # unreachable host shouldn't consume the whole budget meant for the
+        # response), while reads keep the full window. Callers needing full
+        # control can pass a ClientTimeout directly.
+        if isinstance(timeout, aiohttp.ClientTimeout):
+            self._timeout = timeout
+        else:
+            self._timeout = aiohttp.ClientTimeout(
+                total=timeout,
+                connect=min(10, timeout),
+                sock_connect=min(10, timeout),
+                sock_read=timeout,
+            )
+        self._pool_size = pool_size
+        self._pool_size_per_host = pool_size_per_host
+        self._keepalive_expiry = keepalive_expiry
+        self._dns_cache_ttl = dns_cache_ttl
+        # Bulkhead: cap in-flight requests so a burst of concurrent retries
+        # and websocket handlers queues here instead of starving the event
+        # loop and piling sockets onto an already-loaded API. All SDK traffic
+        # targets one host, so a single semaphore suffices.
+        self._bulkhead = asyncio.Semaphore(max_concurrent)
+        # Optional proactive pacing: with rate_limit set, requests queue in a
+        # token bucket instead of triggering 429s and paying round-trip plus
+        # backoff for each. The bucket throttles itself down when a 429
+        # slips through anyway.
+        self._rate_limiter = AsyncTokenBucket(rate_limit) if rate_limit else None
         self._additional_headers = additional_headers or {}
         self._logger = logger or NoOpLogger()
+        # Resolved once: loggers without is_debug_enabled() (custom ILogger
+        # implementations) conservatively keep debug-context building on
+        self._debug_enabled = getattr(
+            self._logger, "is_debug_enabled", lambda: True
+        )()
         if not self._api_key and not self._hmac_credentials and not self._has_configured_header_auth():
             self._logger.warn(
                 "No configured authentication found. Authenticated endpoints will fail. "
                 "Set LIMITLESS_API_KEY, pass api_key, configure hmac_credentials, or supply auth headers."
             )
         self._session: Optional[aiohttp.ClientSession] = None
+        # Parsed-URL cache for param-less paths: handing aiohttp a prebuilt
+        # encoded yarl.URL skips its per-call parse/requote of the string
+        self._url_cache: Dict[str, URL] = {}
+        # Opt-in GET response cache (LRU with TTL) and single-flight map
+        self._cache_ttl = cache_ttl
+        self._cache_maxsize = cache_maxsize
+        self._response_cache: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        self._rebuild_base_headers()
 
     async def __aenter__(self):
         await self._ensure_session()
@@ -115,11 +300,33 @@ class HttpClient:
                 **_build_sdk_tracking_headers(),
                 "Accept": "application/json",
             }
-            self._session = aiohttp.ClientSession(headers=headers, timeout=self._timeout)
+            # Explicit pooled connector: all SDK traffic targets one host, so
+            # a persistent pool of keep-alive sockets (rather than aiohttp's
+            # defaults sized for many-host crawling) maximizes warm-socket
+            # reuse for small JSON calls and skips repeat DNS lookups. Idle
+            # sockets are kept open for keepalive_expiry seconds so retry
+            # loops and polling fetchers land on warm connections.
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_size,
+                limit_per_host=self._pool_size_per_host,
+                keepalive_timeout=self._keepalive_expiry,
+                ttl_dns_cache=self._dns_cache_ttl,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=headers, timeout=self._timeout, connector=connector
+            )
 
     async def close(self) -> None:
         if self._session and not self._session.closed:
             await self._session.close()
+            # Yield to the event loop once so the connector's transports
+            # finish their close handshake (aiohttp's recommended graceful
+            # shutdown); cleanup_closed on the connector handles lingering
+            # SSL sockets. Dropping the reference lets GC reclaim the
+            # session immediately and makes a later call reconnect cleanly.
+            await asyncio.sleep(0)
+        self._session = None
 
     def get_logger(self) -> ILogger:
         return self._logger
@@ -134,20 +341,48 @@ class HttpClient:
 
     def set_api_key(self, api_key: str) -> None:
         self._api_key = api_key
+        self._rebuild_base_headers()
         self._logger.debug("API key updated")
 
     def clear_api_key(self) -> None:
         self._api_key = None
+        self._rebuild_base_headers()
         self._logger.debug("API key cleared")
 
     def set_hmac_credentials(self, hmac_credentials: HMACCredentials) -> None:
         self._hmac_credentials = hmac_credentials.model_copy()
+        self._rebuild_base_headers()
         self._logger.debug("HMAC credentials updated")
 
     def clear_hmac_credentials(self) -> None:
         self._hmac_credentials = None
+        self._rebuild_base_headers()
         self._logger.debug("HMAC credentials cleared")
 
+    def _rebuild_base_headers(self) -> None:
+        """Precompute per-request header dicts for the no-override case.
+
+        Credentials and additional_headers only change through the setters
+        above, so the common request (no per-call headers, API-key auth)
+        can reuse one shared dict instead of rebuilding it per call. HMAC
+        auth signs the timestamp/path/body and stays on the dynamic path.
+        """
+        base = dict(self._additional_headers)
+        if (
+            self._api_key
+            and not self._hmac_credentials
+            and not self._has_configured_header_auth()
+        ):
+            base["X-API-Key"] = self._api_key
+        # Stored as (name, value) pair lists: aiohttp builds its CIMultiDict
+        # straight from the pairs instead of re-hashing a dict per request.
+        # Callers must treat these as immutable.
+        self._base_headers_list = list(base.items())
+        self._base_headers_list_json = [
+            pair for pair in base.items() if pair[0].lower() != "content-type"
+        ] + [("Content-Type", "application/json")]
+        self._static_headers_ok = not self._hmac_credentials
+
     def require_auth(self, operation: str) -> None:
         if self._api_key or self._hmac_credentials or self._has_configured_header_auth():
             return
@@ -162,11 +397,28 @@ class HttpClient:
             for key in self._additional_headers.keys()
         )
 
-    def _build_url(self, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
-        request_path = path
+    def _build_url(self, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[URL, str]:
+        # request_path is built with _build_query so the HMAC signature sees the
+        # exact string the server receives; the URL object wraps it with
+        # encoded=True so neither we nor aiohttp re-quote it
+        # Plain str concatenation beats the f-string's formatting machinery
+        # for two-operand joins on this hot path
         if params:
-            request_path = f"{path}?{urlencode(params, doseq=True)}"
-        return f"{self.base_url}{request_path}", request_path
+            if not path.startswith("/"):
+                raise ValueError(f"path must start with '/': {path!r}")
+            request_path = path + "?" + _build_query(params)
+            return URL(self.base_url + request_path, encoded=True), request_path
+
+        url = self._url_cache.get(path)
+        if url is None:
+            # Validated only on cache miss: a missing slash silently glues
+            # the path onto the host and yields confusing 404s
+            if not path.startswith("/"):
+                raise ValueError(f"path must start with '/': {path!r}")
+            url = URL(self.base_url + path, encoded=True)
+            if len(self._url_cache) < 256:
+                self._url_cache[path] = url
+        return url, path
 
     def _prepare_headers(
         self,
@@ -200,91 +452,312 @@ class HttpClient:
 
         return headers
 
-    def _sanitize_headers_for_logging(self, headers: Dict[str, str]) -> Dict[str, str]:
+    def _sanitize_headers_for_logging(
+        self, headers: Union[Dict[str, str], List[Tuple[str, str]]]
+    ) -> Dict[str, str]:
+        # Accepts both shapes the request methods use: the dynamic dict from
+        # _prepare_headers and the precomputed (name, value) pair lists
+        items = headers.items() if isinstance(headers, dict) else headers
         sanitized: Dict[str, str] = {}
-        for key, value in headers.items():
-            if key.lower() in _REDACTED_HEADERS:
+        for key, value in items:
+            # Exact-casing lookup first skips str.lower() for every header
+            # the SDK emits; the lowercase fallback still catches unusual
+            # casings from caller-supplied headers
+            if key in _REDACTED_HEADERS_EXACT or key.lower() in _REDACTED_HEADERS:
                 sanitized[key] = "***"
             else:
                 sanitized[key] = value
         return sanitized
 
     def _handle_error_response(
-        self, status: int, data: Any, url: str, method: str
+        self,
+        status: int,
+        data: Any,
+        url: str,
+        method: str,
+        headers: Optional[Dict[str, str]] = None,
     ) -> APIError:
         if isinstance(data, dict):
-            if isinstance(data.get("message"), list):
-                messages = []
-                for err in data["message"]:
+            raw_message = data.get("message")
+            if isinstance(raw_message, list):
+                # Single pass; no intermediate filtered dict per error item
+                parts = []
+                for err in raw_message:
                     if isinstance(err, dict):
-                        details = {k: v for k, v in err.items() if v}
-                        messages.append(", ".join(f"{k}: {v}" for k, v in details.items()))
+                        parts.append(
+                            ", ".join(f"{k}: {v}" for k, v in err.items() if v)
+                        )
                     else:
-                        messages.append(str(err))
-                message = " | ".join(messages) or data.get("error", str(data))
+                        parts.append(str(err))
+                message = " | ".join(parts) or data.get("error") or str(data)
             else:
                 message = (
-                    data.get("message")
+                    raw_message
                     or data.get("error")
                     or data.get("msg")
-                    or json.dumps(data)
+                    or _json_dumps(data)
                 )
         else:
             message = str(data)
 
-        self._logger.debug(
-            "Raw API Error Response",
-            {
-                "host": self.base_url,
-                "status": status,
-                "url": url,
-                "method": method,
-                "data": data,
-            },
+        if self._debug_enabled:
+            self._logger.debug(
+                "Raw API Error Response",
+                {
+                    "host": self.base_url,
+                    "status": status,
+                    "url": url,
+                    "method": method,
+                    "data": data,
+                },
+            )
+
+        if status == 429 and self._rate_limiter:
+            self._rate_limiter.throttle()
+        return _STATUS_TO_EXC.get(status, APIError)(
+            message, status, data, url, method, headers
         )
 
-        if status == 400:
-            return ValidationError(message, status, data, url, method)
-        if status == 409:
-            return ConflictError(message, status, data, url, method)
-        if status == 429:
-            return RateLimitError(message, status, data, url, method)
-        if status in (401, 403):
-            return AuthenticationError(message, status, data, url, method)
-        return APIError(message, status, data, url, method)
+    @staticmethod
+    def _normalize_timeout(
+        timeout: Optional[Union[int, float, "aiohttp.ClientTimeout"]],
+    ) -> Optional[aiohttp.ClientTimeout]:
+        if timeout is None or isinstance(timeout, aiohttp.ClientTimeout):
+            return timeout
+        return aiohttp.ClientTimeout(total=timeout)
+
+    @staticmethod
+    def _lower_headers(headers: Any) -> Dict[str, str]:
+        return {str(k).lower(): str(v) for k, v in headers.items()}
+
+    @staticmethod
+    def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> tuple:
+        """Build a hashable cache key from a GET's path and params.
+
+        List values are valid params (_build_query emits repeated keys
+        for sequences), so they are normalized to tuples here instead of
+        blowing up the cache dict's hash.
+        """
+        if not params:
+            return (path, ())
+        return (
+            path,
+            tuple(
+                (k, tuple(v) if isinstance(v, list) else v)
+                for k, v in sorted(params.items())
+            ),
+        )
 
     async def get(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        cache: bool = True,
+        timeout: Optional[Union[int, float, aiohttp.ClientTimeout]] = None,
     ) -> Any:
+        # TTL cache + single flight for idempotent GETs (opt-in via
+        # cache_ttl). Concurrent identical requests share one round-trip:
+        # the first caller owns the network request, followers await its
+        # future. Per-call cache=False bypasses both.
+        if not (self._cache_ttl and cache and headers is None):
+            return await self._request(
+                "GET", path, params=params, headers=headers, timeout=timeout
+            )
+
+        key = self._cache_key(path, params)
+        try:
+            entry = self._response_cache.get(key)
+        except TypeError:
+            # Param value still unhashable (e.g. a dict): serve the
+            # request uncached rather than failing it
+            return await self._request(
+                "GET", path, params=params, headers=headers, timeout=timeout
+            )
+        if entry is not None:
+            if time.monotonic() < entry[0]:
+                self._response_cache.move_to_end(key)
+                return entry[1]
+            del self._response_cache[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await self._request(
+                "GET", path, params=params, headers=headers, timeout=timeout
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when there are no followers
+            raise
+        else:
+            future.set_result(data)
+            self._response_cache[key] = (time.monotonic() + self._cache_ttl, data)
+            while len(self._response_cache) > self._cache_maxsize:
+                self._response_cache.popitem(last=False)
+            return data
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Union[int, float, aiohttp.ClientTimeout]] = None,
+        allow_redirects: bool = True,
+        raw: bool = False,
+        return_response: bool = False,
+    ) -> Any:
+        """Shared request path behind get/get_raw/post/delete.
+
+        One implementation keeps the hot setup/send/decode/error-map code
+        in a single warm frame instead of four near-identical copies, and
+        gives every optimization (header fast path, prebuilt URLs, raw
+        body decode) exactly one place to live.
+        """
         await self._ensure_session()
 
         url, request_path = self._build_url(path, params)
-        request_headers = self._prepare_headers("GET", request_path, "", headers)
-        request_headers["Content-Type"] = "application/json"
-
-        self._logger.debug(
-            f"GET {path}",
-            {
-                "host": self.base_url,
-                "full_url": url,
-                "params": params,
-                "headers": self._sanitize_headers_for_logging(request_headers),
-            },
-        )
+        body = _serialize_json_body(data) if method == "POST" else b""
+        # Only POST carries a body, so Content-Type is sent only there: the
+        # shared header lists keep aiohttp's header serialization on its
+        # fast path with no per-call dict build
+        if headers is None and self._static_headers_ok:
+            request_headers = (
+                self._base_headers_list_json if method == "POST" else self._base_headers_list
+            )
+        else:
+            # HMAC signs the textual body; decode only on this dynamic path
+            request_headers = self._prepare_headers(
+                method, request_path, body.decode() if body else "", headers
+            )
+            if method == "POST":
+                request_headers["Content-Type"] = "application/json"
+
+        if self._debug_enabled:
+            self._logger.debug(
+                f"{method} {path}",
+                {
+                    "host": self.base_url,
+                    "full_url": url,
+                    "params": params,
+                    "has_data": data is not None,
+                    "headers": self._sanitize_headers_for_logging(request_headers),
+                },
+            )
 
-        async with self._session.get(url, headers=request_headers) as response:
-            try:
-                data = await response.json()
-            except aiohttp.ContentTypeError:
-                data = await response.text()
+        if self._rate_limiter:
+            await self._rate_limiter.acquire()
+
+        send = getattr(self._session, method.lower())
+        kwargs: Dict[str, Any] = {"headers": request_headers}
+        if method == "POST":
+            kwargs["data"] = body or None
+        elif method == "DELETE":
+            kwargs["skip_auto_headers"] = ["Content-Type"]
+        if raw:
+            kwargs["allow_redirects"] = allow_redirects
+        elif not return_response:
+            kwargs["timeout"] = self._normalize_timeout(timeout) or self._timeout
+
+        # Happy path first throughout: most responses are 2xx, so the error
+        # branch lives in _raise_for_status and the success path runs
+        # straight through with one status comparison
+        if return_response:
+            # Caller owns the response object, so hold the bulkhead only
+            # for the request itself
+            async with self._bulkhead:
+                response = await send(url, **kwargs)
+            if response.status < 400:
+                return response
+            self._raise_for_status(
+                response, self._decode_body(await response.read()), path, method
+            )
 
-            if response.status >= 400:
-                raise self._handle_error_response(response.status, data, path, "GET")
+        async with self._bulkhead, send(url, **kwargs) as response:
+            # The API always returns JSON; decoding the raw bytes directly
+            # skips aiohttp's content-type check and charset sniffing, with
+            # the fallback covering rare non-JSON error bodies
+            response_data = self._decode_body(await response.read())
+
+            if response.status < 400:
+                if not raw:
+                    return response_data
+                return HttpRawResponse(
+                    status=response.status,
+                    headers=self._lower_headers(response.headers),
+                    data=response_data,
+                )
+            self._raise_for_status(response, response_data, path, method)
 
-            return data
+    def _raise_for_status(
+        self, response: Any, data: Any, path: str, method: str
+    ) -> None:
+        raise self._handle_error_response(
+            response.status, data, path, method, self._lower_headers(response.headers)
+        )
+
+    @staticmethod
+    def _decode_body(raw: bytes) -> Any:
+        try:
+            return _json_loads(raw)
+        except _JsonDecodeError:
+            return raw.decode("utf-8", errors="replace")
+
+    async def batch_get(
+        self,
+        paths: List[str],
+        params_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Issue multiple GETs concurrently over the shared connection pool.
+
+        Bursty callers fetching N resources sequentially pay N round-trips;
+        dispatching them together costs roughly one. Requests share the
+        pooled keep-alive sockets and are bounded by the client's bulkhead
+        and rate limiter like any other call, so a large batch cannot
+        exhaust the pool. The API has no server-side multi-path endpoint,
+        so this coalesces at the connection level.
+
+        Args:
+            paths: Request paths, one per GET
+            params_list: Optional per-path query params (parallel to paths)
+            return_exceptions: If True, failed requests yield their
+                exception in the result list instead of raising
+
+        Returns:
+            Responses in the same order as paths
+
+        Raises:
+            APIError: If any request fails and return_exceptions is False
+
+        Example:
+            >>> markets, positions = await http_client.batch_get(
+            ...     ["/markets/btc-2024", "/portfolio/positions"]
+            ... )
+        """
+        if params_list is None:
+            params_list = [None] * len(paths)
+        elif len(params_list) != len(paths):
+            raise ValueError("params_list must match paths in length")
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get(path, params=params)
+                    for path, params in zip(paths, params_list)
+                ),
+                return_exceptions=return_exceptions,
+            )
+        )
 
     async def get_with_identity(
         self,
@@ -308,81 +781,26 @@ class HttpClient:
         allow_redirects: bool = True,
         accepted_statuses: Optional[Set[int]] = None,
     ) -> HttpRawResponse:
-        await self._ensure_session()
-
-        url, request_path = self._build_url(path, params)
-        request_headers = self._prepare_headers("GET", request_path, "", headers)
-        request_headers["Content-Type"] = "application/json"
-
-        self._logger.debug(
-            f"GET {path} (raw)",
-            {
-                "host": self.base_url,
-                "full_url": url,
-                "params": params,
-                "allow_redirects": allow_redirects,
-                "headers": self._sanitize_headers_for_logging(request_headers),
-            },
-        )
-
-        async with self._session.get(
-            url,
-            headers=request_headers,
+        return await self._request(
+            "GET",
+            path,
+            params=params,
+            headers=headers,
             allow_redirects=allow_redirects,
-        ) as response:
-            try:
-                data = await response.json()
-            except aiohttp.ContentTypeError:
-                data = await response.text()
-
-            headers_map = {str(k).lower(): str(v) for k, v in response.headers.items()}
-
-            if response.status >= 400:
-                raise self._handle_error_response(response.status, data, path, "GET")
-
-            if accepted_statuses and response.status in accepted_statuses:
-                return HttpRawResponse(status=response.status, headers=headers_map, data=data)
-
-            return HttpRawResponse(status=response.status, headers=headers_map, data=data)
+            raw=True,
+        )
 
     async def post(
         self,
         path: str,
         data: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Union[int, float, aiohttp.ClientTimeout]] = None,
     ) -> Any:
-        await self._ensure_session()
-
-        url, request_path = self._build_url(path)
-        body = _serialize_json_body(data)
-        request_headers = self._prepare_headers("POST", request_path, body, headers)
-        request_headers["Content-Type"] = "application/json"
-
-        self._logger.debug(
-            f"POST {path}",
-            {
-                "host": self.base_url,
-                "full_url": url,
-                "has_data": data is not None,
-                "headers": self._sanitize_headers_for_logging(request_headers),
-            },
+        return await self._request(
+            "POST", path, data=data, headers=headers, timeout=timeout
         )
 
-        async with self._session.post(
-            url,
-            data=body or None,
-            headers=request_headers,
-        ) as response:
-            try:
-                response_data = await response.json()
-            except aiohttp.ContentTypeError:
-                response_data = await response.text()
-
-            if response.status >= 400:
-                raise self._handle_error_response(response.status, response_data, path, "POST")
-
-            return response_data
-
     async def post_with_identity(
         self,
         path: str,
@@ -411,68 +829,17 @@ class HttpClient:
         data: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> aiohttp.ClientResponse:
-        await self._ensure_session()
-
-        url, request_path = self._build_url(path)
-        body = _serialize_json_body(data)
-        request_headers = self._prepare_headers("POST", request_path, body, headers)
-        request_headers["Content-Type"] = "application/json"
-
-        self._logger.debug(
-            f"POST {path} (with response)",
-            {
-                "has_data": data is not None,
-                "headers": self._sanitize_headers_for_logging(request_headers),
-            },
-        )
-
-        response = await self._session.post(
-            url,
-            data=body or None,
-            headers=request_headers,
+        return await self._request(
+            "POST", path, data=data, headers=headers, return_response=True
         )
 
-        if response.status >= 400:
-            try:
-                response_data = await response.json()
-            except aiohttp.ContentTypeError:
-                response_data = await response.text()
-
-            raise self._handle_error_response(response.status, response_data, path, "POST")
-
-        return response
-
     async def delete(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Union[int, float, aiohttp.ClientTimeout]] = None,
     ) -> Any:
-        await self._ensure_session()
-
-        url, request_path = self._build_url(path, params)
-        request_headers = self._prepare_headers("DELETE", request_path, "", headers)
-
-        self._logger.debug(
-            f"DELETE {path}",
-            {
-                "host": self.base_url,
-                "full_url": url,
-                "headers": self._sanitize_headers_for_logging(request_headers),
-            },
+        return await self._request(
+            "DELETE", path, params=params, headers=headers, timeout=timeout
         )
-
-        async with self._session.delete(
-            url,
-            headers=request_headers,
-            skip_auto_headers=["Content-Type"],
-        ) as response:
-            try:
-                data = await response.json()
-            except aiohttp.ContentTypeError:
-                data = await response.text()
-
-            if response.status >= 400:
-                raise self._handle_error_response(response.status, data, path, "DELETE")
-
-            return data
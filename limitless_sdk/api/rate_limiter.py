@@ -0,0 +1,78 @@
+"""Token-bucket rate limiter for proactive request throttling."""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """Async token bucket that paces requests to a sustained rate.
+
+    Reactive 429 handling pays for each violation twice: the round-trip of
+    the rejected request plus the backoff sleep. Pacing requests through a
+    token bucket keeps the client under the server's limit so those 429s
+    never happen. Tokens refill continuously at ``rate`` per second up to
+    ``capacity``, so short bursts up to the capacity are still allowed.
+
+    Args:
+        rate: Sustained requests per second to allow
+        capacity: Maximum burst size in requests (default: rate)
+
+    Example:
+        >>> bucket = AsyncTokenBucket(rate=20)
+        >>> await bucket.acquire()  # returns immediately while tokens remain
+        >>> # ... 20 more calls within a second will pace at 20 req/s
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize token bucket.
+
+        Args:
+            rate: Sustained requests per second
+            capacity: Maximum burst size (default: rate)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = float(rate)
+        self._capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        # Lock held across the refill wait gives FIFO fairness under
+        # contention: waiters drain in arrival order instead of racing
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current sustained rate in requests per second."""
+        return self._rate
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until the bucket refills if empty.
+
+        Returns:
+            None once a token has been consumed
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+    def throttle(self, factor: float = 0.5, floor: float = 1.0) -> None:
+        """Reduce the sustained rate, e.g. after a 429 slips through.
+
+        A 429 despite pacing means the configured rate is above what the
+        server actually allows; halving converges on the real limit quickly.
+
+        Args:
+            factor: Multiplier applied to the current rate (default: 0.5)
+            floor: Minimum rate to throttle down to (default: 1.0 req/s)
+        """
+        self._rate = max(floor, self._rate * factor)
@@ -1,10 +1,13 @@
 """Retry decorator for handling transient failures."""
 
 import asyncio
+import random
 import time
+from datetime import datetime, timezone
 from functools import wraps
 from typing import Callable, List, Optional, Set, TypeVar, Any
 
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
 from .errors import APIError
 from ..types.logger import ILogger, NoOpLogger
 
@@ -12,6 +15,40 @@ from ..types.logger import ILogger, NoOpLogger
 T = TypeVar("T")
 
 
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Extract a Retry-After hint from a rate-limited APIError.
+
+    Supports both delta-seconds and HTTP-date forms of the header.
+
+    Args:
+        error: Exception raised by the request attempt
+
+    Returns:
+        Seconds to wait as hinted by the server, or None if no usable
+        Retry-After header is present
+    """
+    headers = getattr(error, "headers", None)
+    if not headers or getattr(error, "status_code", None) != 429:
+        return None
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        from email.utils import parsedate_to_datetime
+
+        target = parsedate_to_datetime(value)
+        return max(0.0, (target - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
 class RetryConfig:
     """Configuration for retry behavior.
 
@@ -48,11 +85,24 @@ class RetryConfig:
         self.max_delay = max_delay
         self.on_retry = on_retry
 
+        # Materialize the base-delay schedule once. Retries fire on the hot
+        # error path of the event loop, so get_delay() should be a tuple
+        # index plus one random call rather than per-attempt pow/min work.
+        if delays:
+            self._delay_table = tuple(
+                delays[min(i, len(delays) - 1)] for i in range(max_retries)
+            )
+        else:
+            self._delay_table = tuple(
+                min(exponential_base**i, max_delay) for i in range(max_retries)
+            )
+
     def get_delay(self, attempt: int) -> float:
         """Calculate delay for given retry attempt with jitter.
 
-        Uses exponential backoff with jitter to prevent thundering herd problem.
-        Jitter adds randomness (±20%) to spread out retry attempts from multiple clients.
+        Looks up the precomputed backoff table and applies ±20% jitter to
+        spread out retry attempts from multiple clients (prevents thundering
+        herd).
 
         Args:
             attempt: Retry attempt number (0-based)
@@ -65,18 +115,8 @@ class RetryConfig:
             >>> # Without jitter: 1s, 2s, 4s
             >>> # With jitter: 0.8-1.2s, 1.6-2.4s, 3.2-4.8s
         """
-        import random
-
-        if self.delays:
-            # Use specified delays
-            base_delay = self.delays[min(attempt, len(self.delays) - 1)]
-        else:
-            # Exponential backoff
-            base_delay = min(self.exponential_base**attempt, self.max_delay)
-
-        # Add jitter (±20%) to prevent thundering herd
-        jitter = base_delay * 0.2 * (2 * random.random() - 1)
-        return max(0.1, base_delay + jitter)
+        base_delay = self._delay_table[min(attempt, len(self._delay_table) - 1)]
+        return max(0.1, base_delay * random.uniform(0.8, 1.2))
 
 
 def retry_on_errors(
@@ -162,8 +202,12 @@ def retry_on_errors(
             # Retry attempts
             for attempt in range(config.max_retries):
                 try:
-                    # Calculate delay
+                    # Calculate delay; a server Retry-After hint on 429s
+                    # overrides a shorter configured backoff
                     delay = config.get_delay(attempt)
+                    retry_after = _retry_after_seconds(last_exception)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
 
                     # Call user callback if provided
                     if config.on_retry:
@@ -222,9 +266,17 @@ class RetryableClient:
     This class wraps an HttpClient and automatically retries failed requests
     based on configured retry settings.
 
+    A circuit breaker guards every attempt: after repeated 5xx failures the
+    breaker opens and requests fail fast with CircuitOpenError instead of
+    issuing the HTTP call and sleeping through backoff — blind retries
+    during a sustained outage only amplify load on the API.
+
     Args:
         http_client: HttpClient instance to wrap
         retry_config: Retry configuration (default: RetryConfig())
+        circuit_breaker: Circuit breaker guarding requests (default:
+            CircuitBreaker()); share one instance across clients hitting
+            the same host
         logger: Optional logger
 
     Example:
@@ -246,6 +298,7 @@ class RetryableClient:
         self,
         http_client: Any,  # HttpClient type
         retry_config: Optional[RetryConfig] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
         logger: Optional[ILogger] = None,
     ):
         """Initialize retryable client wrapper.
@@ -253,12 +306,56 @@ class RetryableClient:
         Args:
             http_client: HttpClient instance to wrap
             retry_config: Retry configuration
+            circuit_breaker: Circuit breaker guarding requests
             logger: Optional logger
         """
         self._client = http_client
         self._config = retry_config or RetryConfig()
+        self._breaker = circuit_breaker or CircuitBreaker()
         self._logger = logger or NoOpLogger()
 
+        # Build the retry pipeline ONCE. The previous shape re-applied
+        # retry_on_errors (a fresh RetryConfig, decorator, and two closures)
+        # on every get/post/delete call, which is pure allocator pressure in
+        # request loops. Bound methods + explicit args avoid all of it.
+        self._request = retry_on_errors(
+            status_codes=self._config.status_codes,
+            max_retries=self._config.max_retries,
+            delays=self._config.delays,
+            exponential_base=self._config.exponential_base,
+            max_delay=self._config.max_delay,
+            logger=self._logger,
+            on_retry=self._config.on_retry,
+        )(self._guarded)
+
+    async def _guarded(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run one request attempt through the circuit breaker.
+
+        Args:
+            fn: Bound HttpClient method to invoke
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Response data
+
+        Raises:
+            CircuitOpenError: If the breaker is open (no request is made)
+            APIError: If the request fails
+        """
+        if not self._breaker.allow():
+            raise CircuitOpenError(self._breaker.recovery_in())
+        try:
+            result = await fn(*args, **kwargs)
+        except APIError as e:
+            # Only server-side failures trip the breaker; 4xx client errors
+            # say nothing about API health
+            if e.status_code is not None and e.status_code >= 500:
+                self._breaker.on_failure()
+            raise
+        self._breaker.on_success()
+        return result
+
     async def get(self, path: str, **kwargs) -> Any:
         """GET request with retry logic.
 
@@ -272,20 +369,7 @@ class RetryableClient:
         Raises:
             APIError: If all retries exhausted
         """
-
-        @retry_on_errors(
-            status_codes=self._config.status_codes,
-            max_retries=self._config.max_retries,
-            delays=self._config.delays,
-            exponential_base=self._config.exponential_base,
-            max_delay=self._config.max_delay,
-            logger=self._logger,
-            on_retry=self._config.on_retry,
-        )
-        async def _get():
-            return await self._client.get(path, **kwargs)
-
-        return await _get()
+        return await self._request(self._client.get, path, **kwargs)
 
     async def post(self, path: str, data: Optional[Any] = None, **kwargs) -> Any:
         """POST request with retry logic.
@@ -301,20 +385,7 @@ class RetryableClient:
         Raises:
             APIError: If all retries exhausted
         """
-
-        @retry_on_errors(
-            status_codes=self._config.status_codes,
-            max_retries=self._config.max_retries,
-            delays=self._config.delays,
-            exponential_base=self._config.exponential_base,
-            max_delay=self._config.max_delay,
-            logger=self._logger,
-            on_retry=self._config.on_retry,
-        )
-        async def _post():
-            return await self._client.post(path, data, **kwargs)
-
-        return await _post()
+        return await self._request(self._client.post, path, data, **kwargs)
 
     async def delete(self, path: str, **kwargs) -> Any:
         """DELETE request with retry logic.
@@ -329,20 +400,7 @@ class RetryableClient:
         Raises:
             APIError: If all retries exhausted
         """
-
-        @retry_on_errors(
-            status_codes=self._config.status_codes,
-            max_retries=self._config.max_retries,
-            delays=self._config.delays,
-            exponential_base=self._config.exponential_base,
-            max_delay=self._config.max_delay,
-            logger=self._logger,
-            on_retry=self._config.on_retry,
-        )
-        async def _delete():
-            return await self._client.delete(path, **kwargs)
-
-        return await _delete()
+        return await self._request(self._client.delete, path, **kwargs)
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
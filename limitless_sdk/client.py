@@ -3,15 +3,21 @@
 import asyncio
 import logging
 import math
+import random
 import time
 import os
+from bisect import bisect_left
 from functools import wraps
-from typing import Dict, List, Optional, Union, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import aiohttp
-from eth_account import Account
+from yarl import URL
 
 from ._sdk_tracking import _build_sdk_tracking_headers
+from .api.rate_limiter import AsyncTokenBucket
 from .exceptions import LimitlessAPIError, RateLimitError, AuthenticationError
 from .models import (
     CreateOrderDto,
@@ -19,79 +25,187 @@ from .models import (
     DeleteOrderBatchDto,
     MarketSlugValidator,
 )
+from .utils.constants import ZERO_ADDRESS
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson (C extension, ~2-5x faster decode) when installed and fall
+# back to stdlib json so it stays an optional dependency — same pattern as
+# api.http_client. Orderbook/history/market pages are kilobytes of nested
+# JSON, so decode CPU dominates response handling.
+try:
+    import orjson as _orjson
+
+    def _json_dumps(data: Any) -> str:
+        return _orjson.dumps(data).decode()
+
+    _parse_json = _orjson.loads
+except ImportError:
+    import json as _stdlib_json
+
+    def _json_dumps(data: Any) -> str:
+        return _stdlib_json.dumps(data)
+
+    _parse_json = _stdlib_json.loads
+
+# One ClientSession per process, shared by every LimitlessClient: aiohttp
+# sessions own the connection pool, so sharing keeps TCP+TLS sockets warm
+# across client instances instead of re-handshaking per script or loop.
+# Per-client state (API key, extra headers) travels as request headers.
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOCK = asyncio.Lock()
+
+# Interval classification table for get_historical_prices: one bisect on
+# the sorted thresholds (seconds) replaces the if/elif comparison ladder.
+# bisect_left keeps the boundaries inclusive, matching `time_diff <= 60`.
+_INTERVAL_THRESHOLDS = (60, 300, 900, 1800, 43200)
+_INTERVAL_LABELS = ("1m", "5m", "15m", "30m", "12h", "unknown")
+
+
+def _retry_after_seconds(error) -> Optional[float]:
+    """Extract a Retry-After delay (seconds) from an exception, if any.
+
+    Handles both delta-seconds and HTTP-date forms. Returns None when the
+    exception carries no usable header (legacy exceptions raised from a
+    response body string have none).
+    """
+    headers = getattr(error, 'headers', None)
+    if not headers:
+        return None
+    value = headers.get('Retry-After') or headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        try:
+            retry_at = parsedate_to_datetime(str(value))
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return max(0.0, seconds)
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    """Whether an exception represents an HTTP 429, in any shape raised here.
 
-def retry_on_rate_limit(max_retries: int = 2, delays: List[int] = None):
+    Typed exceptions (RateLimitError, aiohttp.ClientResponseError) carry a
+    status attribute that is trusted outright; anything else falls back to
+    the legacy "429 ... Too Many Requests" message pattern.
+    """
+    status = getattr(error, 'status_code', getattr(error, 'status', None))
+    if status is not None:
+        return status == 429
+    if isinstance(error, (RateLimitError, aiohttp.ClientResponseError)):
+        return False
+    text = str(error)
+    return "429" in text and "Too Many Requests" in text
+
+
+def retry_on_rate_limit(max_retries: int = 5, base: float = 0.5, cap: float = 30.0):
     """
     Decorator to retry API calls on rate limiting (429 errors).
-    
+
+    Uses exponential backoff with decorrelated jitter (AWS formula:
+    sleep = min(cap, uniform(base, prev * 3))) so concurrent callers
+    spread their retries instead of hitting the API again in lockstep.
+    When the server sends a Retry-After header it is honored as a lower
+    bound on the computed delay. The wrapper is a single uniform loop:
+    classification lives in _is_rate_limit, so there is one try/except
+    for all attempts instead of parallel first-attempt/retry branches.
+
     Args:
-        max_retries: Maximum number of retries (default: 2)
-        delays: List of delay times in seconds for each retry (default: [5, 10])
+        max_retries: Maximum number of retries (default: 5)
+        base: Minimum backoff delay in seconds (default: 0.5)
+        cap: Maximum backoff delay in seconds (default: 30.0)
     """
-    if delays is None:
-        delays = [5, 10]
-    
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
-            
-            # First attempt
-            try:
-                return await func(*args, **kwargs)
-            except (RateLimitError, aiohttp.ClientResponseError) as e:
-                # Check if it's actually a rate limit error
-                status_code = getattr(e, 'status_code', getattr(e, 'status', None))
-                if status_code != 429:
-                    # Not a rate limit error, raise immediately
-                    raise e
-                last_exception = e
-                logger.warning(f"Rate limit hit on {func.__name__} (HTTP {status_code}), starting retry sequence...")
-            except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
-                # Don't retry on timeout errors, they're not rate limits
-                raise e
-            except Exception as e:
-                # Check if it's our custom exception pattern with 429 in the message
-                if "429" in str(e) and "Too Many Requests" in str(e):
-                    last_exception = e
-                    logger.warning(f"Rate limit hit on {func.__name__}, starting retry sequence...")
-                else:
-                    # Not a rate limit error, raise immediately
-                    raise e
-            
-            # Retry attempts
-            for attempt in range(max_retries):
+            prev_delay = base
+            for attempt in range(max_retries + 1):
                 try:
-                    delay = delays[attempt] if attempt < len(delays) else delays[-1]
-                    logger.info(f"Retrying {func.__name__} after {delay} seconds (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(delay)
                     return await func(*args, **kwargs)
-                except (RateLimitError, aiohttp.ClientResponseError) as e:
-                    status_code = getattr(e, 'status_code', getattr(e, 'status', None))
-                    if status_code != 429:
-                        # Not a rate limit error, raise immediately
-                        raise e
-                    last_exception = e
-                    logger.warning(f"Rate limit hit again on {func.__name__}, attempt {attempt + 1}/{max_retries}")
-                except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
-                    # Don't retry on timeout errors, they're not rate limits
-                    raise e
+                except (aiohttp.ServerTimeoutError, asyncio.TimeoutError):
+                    # Timeouts are not rate limits; never retry them here
+                    raise
                 except Exception as e:
-                    # Check if it's our custom exception pattern with 429 in the message
-                    if "429" in str(e) and "Too Many Requests" in str(e):
-                        last_exception = e
-                        logger.warning(f"Rate limit hit again on {func.__name__}, attempt {attempt + 1}/{max_retries}")
-                    else:
-                        # Not a rate limit error, raise immediately
-                        raise e
-            
-            # All retries exhausted, raise the last exception
-            logger.error(f"All retries exhausted for {func.__name__}, raising last exception")
-            raise last_exception
-        
+                    if not _is_rate_limit(e):
+                        raise
+                    if attempt == max_retries:
+                        logger.error(f"All retries exhausted for {func.__name__}, raising last exception")
+                        raise
+                    prev_delay = min(cap, random.uniform(base, prev_delay * 3))
+                    delay = prev_delay
+                    retry_after = _retry_after_seconds(e)
+                    if retry_after is not None:
+                        delay = max(delay, min(cap, retry_after))
+                    logger.warning(f"Rate limit hit on {func.__name__}; retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries + 1})")
+                    await asyncio.sleep(delay)
+
+        return wrapper
+    return decorator
+
+
+def ttl_cache(ttl: float):
+    """Serve repeated idempotent GETs from memory for `ttl` seconds.
+
+    Strategy loops poll the same markets/orderbooks every tick; each poll
+    is otherwise a full round-trip plus JSON parse. Entries live in a
+    per-client ``{key: (expires_at, value)}`` dict, and concurrent
+    identical calls are coalesced through a ``{key: Future}`` map so N
+    coroutines racing for the same orderbook share one request. The
+    client's ``cache_policy`` picks the mode:
+
+    - ``"enabled"``: normal read-through cache (default)
+    - ``"read_only"``: serve hits but never store new entries
+    - ``"disabled"``: bypass entirely
+    - ``"replay"``: serve from cache only, ignoring expiry; a miss
+      raises instead of touching the network (for offline tests)
+
+    Args:
+        ttl: Seconds a cached response stays fresh
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            policy = self._cache_policy
+            if policy == "disabled":
+                return await func(self, *args, **kwargs)
+
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                if policy == "replay" or time.monotonic() < entry[0]:
+                    return entry[1]
+                del self._response_cache[key]
+            if policy == "replay":
+                raise LimitlessAPIError(
+                    f"Cache replay miss for {func.__name__} with key {key[1:]}"
+                )
+
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                return await inflight
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                value = await func(self, *args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                future.exception()  # mark retrieved when there are no followers
+                raise
+            else:
+                future.set_result(value)
+                if policy != "read_only":
+                    self._response_cache[key] = (time.monotonic() + ttl, value)
+                return value
+            finally:
+                self._inflight.pop(key, None)
+
         return wrapper
     return decorator
 
@@ -99,21 +213,70 @@ def retry_on_rate_limit(max_retries: int = 2, delays: List[int] = None):
 class LimitlessClient:
     """Async client for Limitless Exchange API."""
     
-    def __init__(self, private_key: str,  api_key: Optional[str] = None, additional_headers: Optional[Dict[str, str]] = None):
+    def __init__(self, private_key: str,  api_key: Optional[str] = None, additional_headers: Optional[Dict[str, str]] = None, rpm: Optional[float] = None, concurrency: int = 16, cache_policy: str = "enabled"):
         """Initialize the API client.
-        
+
         Args:
             private_key: Ethereum private key for authentication (required)
             additional_headers: Optional additional headers to include in all requests (e.g., for rate limiting bypass)
+            rpm: Optional requests-per-minute budget; when set, calls are
+                paced through a token bucket so bursts stay under the API
+                limit instead of triggering 429s and retries. Configure it
+                slightly under the server quota to absorb clock skew.
+            concurrency: Maximum in-flight requests; parallel fan-outs
+                (gathered get_market/get_orderbook calls) queue at this cap
+                instead of opening unbounded sockets (default: 16)
+            cache_policy: TTL-cache mode for idempotent GET endpoints —
+                "enabled", "read_only", "disabled", or "replay"
+                (default: "enabled"; see ttl_cache)
         """
         self.base_url = "https://api.limitless.exchange"
+        # Pre-parsed yarl URL bases: joining segments with / is a C-level
+        # operation that percent-encodes variable parts correctly, and
+        # aiohttp accepts URL objects directly, skipping a re-parse per
+        # call — all URL assembly cost moves to construction time
+        self._url_markets = URL(self.base_url) / "markets"
+        self._url_markets_active = self._url_markets / "active"
+        self._url_orders = URL(self.base_url) / "orders"
+        self._url_cancel_batch = self._url_orders / "cancel-batch"
+        self._url_positions = URL(self.base_url) / "portfolio" / "positions"
+        self._url_history = URL(self.base_url) / "portfolio" / "history"
+        self._url_profiles = URL(self.base_url) / "profiles"
         self.private_key = private_key
+        # Deferred import: eth_account drags in the whole crypto stack
+        # (~100-300ms cold start) that DTO-only consumers never need
+        from eth_account import Account
+
         self.account = Account.from_key(private_key)
         self.timeout = aiohttp.ClientTimeout(total=30)
         self.session = None
         self.signing_message = None
-        self.api_key = api_key or os.getenv("LIMITLESS_API_KEY") 
+        self.api_key = api_key or os.getenv("LIMITLESS_API_KEY")
         self.additional_headers = additional_headers or {}
+        # The fastest retry is the one never made: proactive pacing shapes
+        # concurrent get_all_active_markets / batched order traffic below
+        # the server budget rather than reacting to 429s after the fact.
+        self._limiter = AsyncTokenBucket(rpm / 60.0) if rpm else None
+        self._concurrency = concurrency
+        self._sem = asyncio.Semaphore(concurrency)
+        # Last (message, signature) pair from _sign_message; the signing
+        # message is fixed per session so repeats skip the ECDSA work
+        self._cached_signature: Optional[tuple] = None
+        # Per-request headers: the session is shared process-wide, so
+        # anything client-specific must ride on each call, not the session
+        self._headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            self._headers["X-API-Key"] = self.api_key
+        self._headers.update(self.additional_headers)
+        # TTL cache + single-flight state for ttl_cache-decorated GETs
+        self._cache_policy = cache_policy
+        self._response_cache: Dict[Any, tuple] = {}
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        # Coalescing buffer for cancel_order_coalesced: (order_id, future)
+        # pairs collected during one flush window, sent as a single batch
+        self._pending_cancels: List[tuple] = []
+        self._cancel_flush_task: Optional[asyncio.Task] = None
+        self._cancel_lock = asyncio.Lock()
     
     async def __aenter__(self):
         """Create session when used as context manager."""
@@ -125,44 +288,142 @@ class LimitlessClient:
         await self.close_session()
     
     async def create_session(self):
-        """Create an aiohttp session with API key authentication."""
-        if self.session is None or self.session.closed:
-            headers = {
-                **_build_sdk_tracking_headers(),
-                "Content-Type": "application/json",
-            }
+        """Bind this client to the shared process-wide aiohttp session.
 
-            # Add X-API-Key header if available
-            if self.api_key:
-                headers["X-API-Key"] = self.api_key
-
-            # Merge additional headers if provided
-            headers.update(self.additional_headers)
+        The session (and its connection pool) is created lazily on first
+        use and lives for the lifetime of the application, as aiohttp
+        recommends. Only process-invariant SDK tracking headers are set
+        on the session itself; auth and caller-supplied headers go out
+        per request via self._headers.
+        """
+        global _SHARED_SESSION
+        if self.session is not None and not self.session.closed:
+            return
+        async with _SESSION_LOCK:
+            if _SHARED_SESSION is None or _SHARED_SESSION.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    keepalive_timeout=75,
+                )
+                _SHARED_SESSION = aiohttp.ClientSession(
+                    headers=_build_sdk_tracking_headers(),
+                    timeout=self.timeout,
+                    connector=connector,
+                    json_serialize=_json_dumps,
+                )
+        self.session = _SHARED_SESSION
 
-            # Create session
-            self.session = aiohttp.ClientSession(
-                headers=headers,
-                timeout=self.timeout,
-            )
-    
     async def close_session(self):
-        """Close the aiohttp session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Detach from the shared session without closing it.
+
+        The pool is shared by every client in the process, so tearing it
+        down here would drop other clients' warm connections. Use
+        LimitlessClient.shutdown_shared_session() at program exit.
+        """
+        self.session = None
+
+    @classmethod
+    async def shutdown_shared_session(cls):
+        """Close the process-wide shared session (call once at exit)."""
+        global _SHARED_SESSION
+        async with _SESSION_LOCK:
+            if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
+                await _SHARED_SESSION.close()
+            _SHARED_SESSION = None
     
+    async def ensure_authenticated(self):
+        """Ensure credentials are configured before an authenticated call.
+
+        The API authenticates via the X-API-Key header attached once at
+        session creation, so there is no signing-message/JWT handshake to
+        repeat or cache — this is a constant-time attribute check, and the
+        session header does the rest on every request.
+        """
+        if not self.api_key:
+            raise AuthenticationError(
+                "API key required: pass api_key or set LIMITLESS_API_KEY", 401
+            )
+
     async def ensure_session(self):
-        """Ensure session exists."""
+        """Ensure session exists and pace the upcoming request."""
         if self.session is None or self.session.closed:
             await self.create_session()
+        # _request (and cancel_order) calls ensure_session() right before
+        # sending, so acquiring here rate-shapes all traffic without
+        # touching each call site individually
+        if self._limiter:
+            await self._limiter.acquire()
     
+    # Status -> (exception class, message prefix) for the common error
+    # statuses every endpoint shares; one dict lookup replaces the per-
+    # method elif ladders that used to repeat this mapping twelve times
+    _STATUS_EXC = {
+        429: (RateLimitError, "Rate limit exceeded"),
+        401: (AuthenticationError, "Unauthorized"),
+    }
+
+    @retry_on_rate_limit()
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json_payload: Optional[Any] = None,
+        ok_status: int = 200,
+        failure: str = "Request failed",
+        extra_errors: Optional[Dict[int, str]] = None,
+        authenticated: bool = False,
+    ) -> Any:
+        """Send one HTTP request with the shared status dispatch.
+
+        The semaphore caps in-flight requests so parallel fan-outs queue
+        here instead of exhausting sockets, and the status handling that
+        used to be copy-pasted across every endpoint method lives in this
+        single place.
+
+        Args:
+            method: HTTP method name
+            url: Fully built request URL
+            params: Optional query parameters
+            json_payload: Optional JSON request body
+            ok_status: Status code treated as success (default: 200)
+            failure: Message prefix for unexpected error statuses
+            extra_errors: Optional status -> message prefix overrides
+
+        Args (cont.):
+            authenticated: When True, verify credentials before sending
+
+        Returns:
+            Decoded JSON response body
+        """
+        if authenticated:
+            await self.ensure_authenticated()
+        await self.ensure_session()
+
+        async with self._sem:
+            async with self.session.request(
+                method, url, params=params, json=json_payload, headers=self._headers
+            ) as response:
+                status = response.status
+                if status == ok_status:
+                    # read() returns bytes; decoding them directly skips
+                    # aiohttp's charset sniffing and the intermediate str
+                    return _parse_json(await response.read())
+                error_text = await response.text()
+                exc_info = self._STATUS_EXC.get(status)
+                if exc_info is not None:
+                    raise exc_info[0](f"{exc_info[1]}: {error_text}", status)
+                if extra_errors and status in extra_errors:
+                    raise LimitlessAPIError(f"{extra_errors[status]}: {error_text}", status)
+                raise LimitlessAPIError(f"{failure}: {status} - {error_text}", status)
+
     def _generate_salt(self) -> int:
         """Generate a random salt for order."""
-        import random
         return random.randint(1, 2**32 - 1)
 
     def _get_current_timestamp(self) -> int:
         """Get current timestamp."""
-        import time
         return int(time.time())
 
     async def _get_token_id_for_market(self, market_id: str, outcome_index: int = 0) -> str:
@@ -204,7 +465,6 @@ class LimitlessClient:
         logger.info(f"Calculated amounts - Maker: {maker_amount}, Taker: {taker_amount}")
         return maker_amount, taker_amount
 
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
     async def get_user_profile(self, account_address: str = None) -> Dict:
         """Get user profile by account address.
         
@@ -214,25 +474,45 @@ class LimitlessClient:
         Returns:
             User profile data including id (which is used as ownerId)
         """
-        await self.ensure_session()
-        
         # Use current user's address if not specified
         if account_address is None:
             account_address = self.account.address
         
-        url = f"{self.base_url}/profiles/{account_address}"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            elif response.status == 404:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"User profile not found: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to get user profile: {response.status} - {error_text}", response.status)
+        url = self._url_profiles / account_address
+        return await self._request(
+            "GET",
+            url,
+            failure="Failed to get user profile",
+            extra_errors={404: "User profile not found"},
+        )
+
+    def _sign_message(self, message: str) -> str:
+        """Sign a plain-text message (EIP-191) with the result memoized.
+
+        The keccak prefix hash plus secp256k1 signing is the most expensive
+        CPU op in this module, and a session's signing message never
+        changes — so re-signing the same message returns the cached
+        signature instead.
+
+        Args:
+            message: Message text to sign
+
+        Returns:
+            Signature as hex string with 0x prefix
+        """
+        cached = self._cached_signature
+        if cached is not None and cached[0] == message:
+            return cached[1]
+
+        from eth_account.messages import encode_defunct
+
+        signed = self.account.sign_message(encode_defunct(text=message))
+        signature = signed.signature.hex()
+        if not signature.startswith('0x'):
+            signature = '0x' + signature
+
+        self._cached_signature = (message, signature)
+        return signature
 
     def _sign_order(self, order: "Order", is_negrisk: bool = False) -> str:
         """Sign an order using EIP-712 with the correct Limitless Exchange parameters."""
@@ -296,7 +576,7 @@ class LimitlessClient:
             "salt": order.salt,
             "maker": order.maker,
             "signer": order.signer,
-            "taker": order.taker or "0x0000000000000000000000000000000000000000",
+            "taker": order.taker or ZERO_ADDRESS,
             "tokenId": int(order.tokenId),
             "makerAmount": order.makerAmount,
             "takerAmount": order.takerAmount,
@@ -378,7 +658,7 @@ class LimitlessClient:
             side=side,
             signature="0x",  # Will be filled after signing
             signatureType=0,  # EOA
-            taker="0x0000000000000000000000000000000000000000",
+            taker=ZERO_ADDRESS,
             expiration=expiration,
             nonce=nonce,
             price=price
@@ -403,21 +683,66 @@ class LimitlessClient:
         
         return create_order_dto
     
-    async def get_all_active_markets(self) -> List[Dict]:
-        """Get all active markets."""
-        await self.ensure_session()
-        
-        data = await self.get_active_markets(page=1, limit=10)
-        rest_pages = math.ceil(data['totalMarketsCount'] / 10) - 1
-        all_markets_data = data['data']
+    async def iter_active_markets(self, limit: int = 100) -> AsyncIterator[Dict]:
+        """Iterate over all active markets, streaming page by page.
 
-        for page in range(2, rest_pages + 2):
-            data = await self.get_active_markets(page=page, limit=10)
-            all_markets_data.extend(data['data'])
+        Yields markets as each page arrives instead of materializing the
+        full list, so downstream filtering starts right after page 1 and
+        peak memory stays O(prefetch depth * page size) rather than
+        O(total markets). Up to four pages are prefetched concurrently
+        while the consumer works on the current one; the client's
+        semaphore (and rate limiter, when configured) bounds the burst.
+
+        Args:
+            limit: Page size for each request (default: 100)
 
-        return all_markets_data
+        Yields:
+            Market dictionaries in page order
+        """
+        prefetch_depth = 4
+        data = await self.get_active_markets(page=1, limit=limit)
+        total_pages = math.ceil(data['totalMarketsCount'] / limit)
+
+        # Sliding window of in-flight page fetches: consuming page N kicks
+        # off page N + depth, so the pipeline hides per-page latency
+        pending = {
+            page: asyncio.ensure_future(self.get_active_markets(page=page, limit=limit))
+            for page in range(2, min(total_pages, 1 + prefetch_depth) + 1)
+        }
+        try:
+            for market in data['data']:
+                yield market
+            for page in range(2, total_pages + 1):
+                result = await pending.pop(page)
+                next_page = page + prefetch_depth
+                if next_page <= total_pages:
+                    pending[next_page] = asyncio.ensure_future(
+                        self.get_active_markets(page=next_page, limit=limit)
+                    )
+                for market in result['data']:
+                    yield market
+        finally:
+            if pending:
+                for task in pending.values():
+                    task.cancel()
+                # Reap the tasks: cancel() is a no-op on ones that already
+                # failed, so awaiting retrieves their exceptions (no "Task
+                # exception was never retrieved" noise) and confirms the
+                # cancellations landed before the loop can wind down
+                await asyncio.gather(*pending.values(), return_exceptions=True)
 
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
+    async def get_all_active_markets(self, limit: int = 100) -> List[Dict]:
+        """Get all active markets as one list.
+
+        Thin wrapper over iter_active_markets for callers that want the
+        materialized list; prefer the iterator when only scanning.
+
+        Args:
+            limit: Page size for each request (default: 100)
+        """
+        return [market async for market in self.iter_active_markets(limit=limit)]
+
+    @ttl_cache(ttl=30)
     async def get_active_markets(self, page: int = 1, limit: int = 10) -> Dict:
         """Get active markets with pagination.
         
@@ -425,139 +750,62 @@ class LimitlessClient:
             page: Page number for pagination (default: 1)
             limit: Number of items per page (default: 10)
         """
-        await self.ensure_session()
-        
-        url = f"{self.base_url}/markets/active?page={page}&limit={limit}"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to get markets: {response.status} - {error_text}", response.status)
+        url = self._url_markets_active.with_query(page=page, limit=limit)
+        return await self._request("GET", url, failure="Failed to get markets")
 
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
+    @ttl_cache(ttl=30)
     async def get_market(self, slug_or_address: str) -> Dict:
         """Get a specific market by slug or address."""
-        await self.ensure_session()
-        
-        url = f"{self.base_url}/markets/{slug_or_address}"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to get market: {response.status} - {error_text}", response.status)
+        url = self._url_markets / slug_or_address
+        return await self._request("GET", url, failure="Failed to get market")
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
+    @ttl_cache(ttl=60)
     async def get_historical_prices(self, slug_or_address: str, interval: str = "all") -> tuple[Dict, str]:
         """Get the historical probability of a specific market by slug or address."""
-        await self.ensure_session()
+        url = (self._url_markets / slug_or_address / "historical-price").with_query(interval=interval)
+        data = await self._request(
+            "GET", url, failure="Failed to get historical prices for market"
+        )
 
-        url = f"{self.base_url}/markets/{slug_or_address}/historical-price?interval={interval}"
-        
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                data = await response.json()
-                
-                # Extract the prices array from the response
-                prices = data.get("prices", [])
-                
-                # Handle insufficient data case
-                if not prices or len(prices) < 2:
-                    return data, "unknown"
-                
-                # Calculate time difference between first two data points
-                timestamps = [int(item["timestamp"]) for item in prices[:2]]
-                time_diff = abs(timestamps[1] - timestamps[0]) / 1000  # Convert to seconds
-                
-                # Map time differences to intervals
-                if time_diff <= 60:  # 1 minute
-                    data_actual_interval = "1m"
-                elif time_diff <= 300:  # 5 minutes
-                    data_actual_interval = "5m"
-                elif time_diff <= 900:  # 15 minutes
-                    data_actual_interval = "15m"
-                elif time_diff <= 1800:  # 30 minutes
-                    data_actual_interval = "30m"
-                elif time_diff <= 43200:  # 12 hours
-                    data_actual_interval = "12h"
-                else:
-                    data_actual_interval = "unknown"
-                
-                return data, data_actual_interval
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to get historical prices for market: {response.status} - {error_text}", response.status)
+        # Extract the prices array from the response
+        prices = data.get("prices", [])
+
+        # Handle insufficient data case
+        if not prices or len(prices) < 2:
+            return data, "unknown"
+
+        # Calculate time difference between first two data points and map
+        # it to an interval label via the precomputed threshold table
+        time_diff = abs(int(prices[1]["timestamp"]) - int(prices[0]["timestamp"])) / 1000
+        data_actual_interval = _INTERVAL_LABELS[bisect_left(_INTERVAL_THRESHOLDS, time_diff)]
+
+        return data, data_actual_interval
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
+    @ttl_cache(ttl=2)
     async def get_orderbook(self, slug: str) -> Dict:
         """Get the orderbook for a market."""
-        await self.ensure_session()
-        
-        url = f"{self.base_url}/markets/{slug}/orderbook"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            elif response.status == 500:
-                error_text = await response.text()
-                # Server-side error - log but don't crash the whole operation
-                logger.warning(f"Orderbook temporarily unavailable for {slug}: {error_text}")
-                raise LimitlessAPIError(f"Orderbook server error for {slug}: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to get orderbook: {response.status} - {error_text}", response.status)
+        url = self._url_markets / slug / "orderbook"
+        return await self._request(
+            "GET",
+            url,
+            failure="Failed to get orderbook",
+            extra_errors={500: f"Orderbook server error for {slug}"},
+        )
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
     async def get_user_orders(self, slug: str) -> List[Dict]:
         """Get user's orders for a specific market."""
-        await self.ensure_authenticated()
-        await self.ensure_session()
-        
-        url = f"{self.base_url}/markets/{slug}/user-orders"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            elif response.status == 401:
-                raise AuthenticationError(f"Unauthorized: {await response.text()}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to get user orders: {response.status} - {error_text}", response.status)
+        url = self._url_markets / slug / "user-orders"
+        return await self._request(
+            "GET", url, failure="Failed to get user orders", authenticated=True
+        )
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
     async def get_positions(self) -> List[Dict]:
         """Get all positions for the authenticated user."""
-        await self.ensure_authenticated()
-        await self.ensure_session()
-        
-        url = f"{self.base_url}/portfolio/positions"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            elif response.status == 401:
-                raise AuthenticationError(f"Unauthorized: {await response.text()}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to get positions: {response.status} - {error_text}", response.status)
+        url = self._url_positions
+        return await self._request(
+            "GET", url, failure="Failed to get positions", authenticated=True
+        )
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
     async def get_user_history(self, cursor: str | None = None, limit: int = 20) -> Dict[str, Union[List[Dict], int]]:
         """Get user history with cursor-based pagination.
 
@@ -573,31 +821,21 @@ class LimitlessClient:
                 - data: List of history entries
                 - nextCursor: Opaque cursor for next page (null when no more pages)
         """
-        await self.ensure_authenticated()
-        await self.ensure_session()
-
-        url = f"{self.base_url}/portfolio/history"
+        url = self._url_history
         params = {
             "cursor": cursor or "",
             "limit": limit
         }
         
-        async with self.session.get(url, params=params) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 400:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Invalid pagination parameters: {error_text}", response.status)
-            elif response.status == 401:
-                raise AuthenticationError(f"Unauthorized: {await response.text()}", response.status)
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to get user history: {response.status} - {error_text}", response.status)
+        return await self._request(
+            "GET",
+            url,
+            params=params,
+            failure="Failed to get user history",
+            extra_errors={400: "Invalid pagination parameters"},
+            authenticated=True,
+        )
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
     async def place_order(self, create_order_dto: "CreateOrderDto") -> Dict:
         """Create a new order using the CreateOrderDto.
         
@@ -607,28 +845,22 @@ class LimitlessClient:
         Returns:
             Order details
         """
-        await self.ensure_authenticated()
-        await self.ensure_session()
-
-        url = f"{self.base_url}/orders"
-        
-        # Convert dataclass to dict for API request
-        from dataclasses import asdict
-        payload = asdict(create_order_dto)
-        
-        async with self.session.post(url, json=payload) as response:
-            if response.status == 201:
-                return await response.json()
-            elif response.status == 401:
-                raise AuthenticationError(f"Unauthorized: {await response.text()}", response.status)
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to create order: {response.status} - {error_text}", response.status)
+        url = self._url_orders
+        
+        # Serialize with pydantic's Rust core: one model_dump call instead
+        # of a recursive Python-level asdict walk
+        payload = create_order_dto.model_dump(mode="json")
+        
+        return await self._request(
+            "POST",
+            url,
+            json_payload=payload,
+            ok_status=201,
+            failure="Failed to create order",
+            authenticated=True,
+        )
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
+    @retry_on_rate_limit()
     async def cancel_order(self, cancel_order_dto: "CancelOrderDto") -> Dict:
         """Cancel an order using the CancelOrderDto.
         
@@ -641,26 +873,19 @@ class LimitlessClient:
         await self.ensure_authenticated()
         await self.ensure_session()
         
-        url = f"{self.base_url}/orders/{cancel_order_dto.order_id}"
+        url = self._url_orders / cancel_order_dto.order_id
         
-        # For DELETE requests, we need to avoid sending Content-Type header
-        # Create a new request without the default session headers
-        # but include additional headers (like X-API-Key, rate limiting bypass)
-        delete_headers = _build_sdk_tracking_headers()
-        if self.additional_headers:
-            delete_headers.update(self.additional_headers)
-
-        # Add X-API-Key header for authentication
-        if self.api_key:
-            delete_headers["X-API-Key"] = self.api_key
+        # DELETE must go out without a Content-Type header; since headers
+        # ride per-request on the shared session, sending a copy with
+        # Content-Type stripped does the job without a throwaway session
+        delete_headers = {
+            k: v for k, v in self._headers.items() if k != "Content-Type"
+        }
 
-        async with aiohttp.ClientSession(
-            timeout=self.timeout,
-            headers=delete_headers
-        ) as delete_session:
-            async with delete_session.delete(url) as response:
+        async with self._sem:
+            async with self.session.delete(url, headers=delete_headers) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return _parse_json(await response.read())
                 elif response.status == 401:
                     raise AuthenticationError(f"Unauthorized: {await response.text()}", response.status)
                 elif response.status == 429:
@@ -670,7 +895,6 @@ class LimitlessClient:
                     error_text = await response.text()
                     raise LimitlessAPIError(f"Failed to cancel order: {response.status} - {error_text}", response.status)
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
     async def cancel_order_batch(self, delete_order_batch_dto: "DeleteOrderBatchDto") -> Dict:
         """Cancel multiple orders using the DeleteOrderBatchDto.
         
@@ -680,29 +904,72 @@ class LimitlessClient:
         Returns:
             List of cancelled order details
         """
-        await self.ensure_authenticated()
-        await self.ensure_session()
-        
-        url = f"{self.base_url}/orders/cancel-batch"
+        url = self._url_cancel_batch
         
-        # Convert dataclass to dict for API request
-        from dataclasses import asdict
-        payload = asdict(delete_order_batch_dto)
+        payload = delete_order_batch_dto.model_dump(mode="json")
         
         # This is a POST request so we can use the normal session with JSON headers
-        async with self.session.post(url, json=payload) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 401:
-                raise AuthenticationError(f"Unauthorized: {await response.text()}", response.status)
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to cancel orders batch: {response.status} - {error_text}", response.status)
+        return await self._request(
+            "POST",
+            url,
+            json_payload=payload,
+            failure="Failed to cancel orders batch",
+            authenticated=True,
+        )
     
-    @retry_on_rate_limit(max_retries=2, delays=[5, 10])
+    async def cancel_order_coalesced(self, order_id: str, flush_ms: float = 10) -> Dict:
+        """Cancel an order, coalescing nearby cancels into one batch call.
+
+        Cancels submitted within flush_ms of each other are buffered and
+        sent as a single cancel_order_batch request, collapsing N round
+        trips (and N rate-limiter tokens) into one. Each caller awaits its
+        own future: when the batch response is a list aligned with the
+        submitted IDs the caller gets its own entry, otherwise the shared
+        batch response.
+
+        Args:
+            order_id: Order ID to cancel
+            flush_ms: Coalescing window in milliseconds (default: 10)
+
+        Returns:
+            Cancellation details for this order (or the batch response)
+        """
+        future = asyncio.get_running_loop().create_future()
+        async with self._cancel_lock:
+            self._pending_cancels.append((order_id, future))
+            if self._cancel_flush_task is None or self._cancel_flush_task.done():
+                self._cancel_flush_task = asyncio.create_task(
+                    self._flush_cancels_after(flush_ms / 1000.0)
+                )
+        return await future
+
+    async def _flush_cancels_after(self, delay: float) -> None:
+        """Sleep out the coalescing window, then send one batch cancel."""
+        await asyncio.sleep(delay)
+        async with self._cancel_lock:
+            pending, self._pending_cancels = self._pending_cancels, []
+        if not pending:
+            return
+        order_ids = [order_id for order_id, _ in pending]
+        try:
+            result = await self.cancel_order_batch(
+                DeleteOrderBatchDto(orderIds=order_ids)
+            )
+        except BaseException as e:
+            # Distribute the failure to every waiter instead of letting it
+            # die inside the task
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            aligned = (
+                result if isinstance(result, list) and len(result) == len(pending)
+                else None
+            )
+            for i, (_, future) in enumerate(pending):
+                if not future.done():
+                    future.set_result(aligned[i] if aligned is not None else result)
+
     async def cancel_all_orders(self, market_slug_validator: MarketSlugValidator) -> Dict:
         """Cancel all orders for a specific market using MarketSlugValidator.
         
@@ -712,18 +979,7 @@ class LimitlessClient:
         Returns:
             List of cancelled order details
         """
-        await self.ensure_authenticated()
-        await self.ensure_session()
-        
-        url = f"{self.base_url}/orders/all/{market_slug_validator.slug}"
-        async with self.session.delete(url) as response:
-            if response.status == 200:
-                return await response.json()
-            elif response.status == 401:
-                raise AuthenticationError(f"Unauthorized: {await response.text()}", response.status)
-            elif response.status == 429:
-                error_text = await response.text()
-                raise RateLimitError(f"Rate limit exceeded: {error_text}", response.status)
-            else:
-                error_text = await response.text()
-                raise LimitlessAPIError(f"Failed to cancel all orders: {response.status} - {error_text}", response.status) 
+        url = self._url_orders / "all" / market_slug_validator.slug
+        return await self._request(
+            "DELETE", url, failure="Failed to cancel all orders", authenticated=True
+        )
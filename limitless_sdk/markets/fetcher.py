@@ -1,6 +1,7 @@
 """Market data fetcher for Limitless Exchange."""
 
-from typing import List, Optional, Dict
+import time
+from typing import List, Optional, Dict, Tuple
 from ..api.http_client import HttpClient
 from ..types.markets import (
     Market,
@@ -13,6 +14,13 @@ from ..types.markets import (
 from ..types.logger import ILogger, NoOpLogger
 
 
+# Market objects change slowly relative to how often trading code looks them
+# up, so cache them briefly; 30s is short enough that prices/status shown to
+# users stay fresh while back-to-back orders on one market skip the API call.
+MARKET_CACHE_TTL = 30.0
+MARKET_CACHE_MAXSIZE = 512
+
+
 class MarketFetcher:
     """Market data fetcher for retrieving market information and orderbooks.
 
@@ -53,6 +61,7 @@ class MarketFetcher:
         self._http_client = http_client
         self._logger = logger or NoOpLogger()
         self._venue_cache: Dict[str, Venue] = {}  # Cache venues by market slug
+        self._market_cache: Dict[str, Tuple[float, Market]] = {}  # slug -> (fetched_at, market)
 
     async def get_active_markets(
         self, params: Optional[ActiveMarketsParams] = None
@@ -116,9 +125,13 @@ class MarketFetcher:
             self._logger.error("Failed to fetch active markets", error, params.model_dump())
             raise
 
-    async def get_market(self, slug: str) -> Market:
+    async def get_market(self, slug: str, refresh: bool = False) -> Market:
         """Get a single market by slug.
 
+        Results are memoized per slug for MARKET_CACHE_TTL seconds, so bots
+        placing back-to-back orders on the same market skip the network
+        round-trip entirely. Pass refresh=True to bypass the cache.
+
         Automatically caches venue information for efficient order creation.
         After calling this method, use get_venue(slug) to retrieve cached venue.
 
@@ -127,6 +140,7 @@ class MarketFetcher:
 
         Args:
             slug: Market slug identifier
+            refresh: Bypass the TTL cache and fetch from the API
 
         Returns:
             Market object with http_client attached for fluent API
@@ -147,6 +161,12 @@ class MarketFetcher:
             >>> venue = fetcher.get_venue("bitcoin-price-2024")
             >>> print(f"Exchange: {venue.exchange}")
         """
+        if not refresh:
+            cached = self._market_cache.get(slug)
+            if cached and time.monotonic() - cached[0] < MARKET_CACHE_TTL:
+                self._logger.debug("Market cache hit", {"slug": slug})
+                return cached[1]
+
         self._logger.debug("Fetching market", {"slug": slug})
 
         try:
@@ -168,6 +188,16 @@ class MarketFetcher:
                 "Market fetched successfully", {"slug": slug, "title": market.title}
             )
 
+            # Memoize; evict expired entries first when the cache is full
+            if len(self._market_cache) >= MARKET_CACHE_MAXSIZE:
+                now = time.monotonic()
+                self._market_cache = {
+                    s: entry
+                    for s, entry in self._market_cache.items()
+                    if now - entry[0] < MARKET_CACHE_TTL
+                }
+            self._market_cache[slug] = (time.monotonic(), market)
+
             return market
 
         except Exception as error:
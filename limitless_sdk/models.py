@@ -2,7 +2,8 @@
 
 from enum import Enum, IntEnum
 from typing import List, Optional
-from dataclasses import dataclass
+
+from pydantic import BaseModel, ConfigDict
 
 
 class OrderSide(IntEnum):
@@ -23,9 +24,13 @@ class SignatureType(IntEnum):
     EOA = 0
 
 
-@dataclass
-class Order:
+class Order(BaseModel):
     """Order model for creating orders."""
+
+    # Mutable (not frozen): the signature field is filled in after the
+    # EIP-712 signing step.
+    model_config = ConfigDict(populate_by_name=True)
+
     salt: int
     maker: str
     signer: str
@@ -33,37 +38,49 @@ class Order:
     makerAmount: int
     takerAmount: int
     feeRateBps: int
-    side: int  # 0 - BUY, 1 - SELL
+    # side/signatureType are plain ints, not OrderSide/SignatureType: the
+    # enums stay for call-site readability, and pydantic coerces them to
+    # exact int on ingress, so serialization in the place_order hot path
+    # skips IntEnum .value dereferences entirely
+    side: int  # 0 - BUY, 1 - SELL (OrderSide accepted)
     signature: str
-    signatureType: int  # 0 for EOA
+    signatureType: int = 0  # 0 for EOA (SignatureType accepted)
     taker: Optional[str] = None
     expiration: Optional[str] = None
     nonce: Optional[int] = None
     price: Optional[float] = None
 
 
-@dataclass
-class CreateOrderDto:
+class CreateOrderDto(BaseModel):
     """DTO for creating orders."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
     order: Order
     ownerId: int
     orderType: str
     marketSlug: str
 
 
-@dataclass
-class CancelOrderDto:
+class CancelOrderDto(BaseModel):
     """DTO for canceling orders."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
     order_id: str
 
 
-@dataclass
-class DeleteOrderBatchDto:
+class DeleteOrderBatchDto(BaseModel):
     """DTO for batch deleting orders."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
     orderIds: List[str]
 
 
-@dataclass
-class MarketSlugValidator:
+class MarketSlugValidator(BaseModel):
     """Validator for market slugs."""
-    slug: str 
\ No newline at end of file
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    slug: str
@@ -1,14 +1,13 @@
 """Orders module for Limitless Exchange."""
 
 from .builder import OrderBuilder
-from .signer import OrderSigner
-from .client import OrderClient
 from .validator import (
     ValidationError,
     validate_gtc_order_args,
     validate_fok_order_args,
     validate_unsigned_order,
     validate_signed_order,
+    validate_signed_orders_batch,
 )
 
 __all__ = [
@@ -20,4 +19,27 @@ __all__ = [
     "validate_fok_order_args",
     "validate_unsigned_order",
     "validate_signed_order",
+    "validate_signed_orders_batch",
 ]
+
+# OrderSigner and OrderClient pull in eth_account; defer them (PEP 562) so
+# read-only consumers of the builder/validators skip the crypto import cost.
+_LAZY_IMPORTS = {
+    "OrderSigner": ".signer",
+    "OrderClient": ".client",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -4,6 +4,7 @@ import secrets
 import time
 from typing import Optional
 from ..types.orders import UnsignedOrder, Side, SignatureType
+from ..utils.constants import ZERO_ADDRESS
 
 
 class OrderBuilder:
@@ -50,6 +51,10 @@ class OrderBuilder:
         self._maker_address = maker_address
         self._fee_rate_bps = fee_rate_bps
         self._price_tick = price_tick
+        # Validated once, then cloned per order via model_copy (which
+        # skips revalidation): only the fields that vary per order pay
+        # any construction cost on the hot path
+        self._prototype: Optional[UnsignedOrder] = None
 
     def build_order(
         self,
@@ -119,23 +124,20 @@ class OrderBuilder:
 
         # Default values
         expiration_value = expiration if expiration is not None else 0
-        taker = taker or "0x0000000000000000000000000000000000000000"
-
-        return UnsignedOrder(
-            salt=salt,
-            maker=self._maker_address,
-            signer=self._maker_address,
-            taker=taker,
-            token_id=token_id,
-            maker_amount=maker_amount,
-            taker_amount=taker_amount,
-            expiration=expiration_value,  # Keep as int for EIP-712 signing
-            nonce=0,
-            fee_rate_bps=self._fee_rate_bps,
-            side=side.value,
-            signature_type=SignatureType.EOA.value,
-            price=price,  # Include price (required for GTC, NOT part of EIP-712 signature)
-        )
+        # The interned constant (not a fresh literal) keeps the
+        # validator's identity fast-path and lru_cache hitting one object
+        taker = taker or ZERO_ADDRESS
+
+        return self._order_prototype().model_copy(update={
+            "salt": salt,
+            "taker": taker,
+            "token_id": token_id,
+            "maker_amount": maker_amount,
+            "taker_amount": taker_amount,
+            "expiration": expiration_value,  # Keep as int for EIP-712 signing
+            "side": side.value,
+            "price": price,  # Required for GTC, NOT part of EIP-712 signature
+        })
 
     def build_fok_order(
         self,
@@ -189,22 +191,45 @@ class OrderBuilder:
 
         # Default values
         expiration_value = expiration if expiration is not None else 0
-        taker = taker or "0x0000000000000000000000000000000000000000"
-
-        return UnsignedOrder(
-            salt=salt,
-            maker=self._maker_address,
-            signer=self._maker_address,
-            taker=taker,
-            token_id=token_id,
-            maker_amount=maker_amount_scaled,
-            taker_amount=1,  # FOK orders always have takerAmount = 1
-            expiration=expiration_value,
-            nonce=0,
-            fee_rate_bps=self._fee_rate_bps,
-            side=side.value,
-            signature_type=SignatureType.EOA.value,
-        )
+        taker = taker or ZERO_ADDRESS
+
+        return self._order_prototype().model_copy(update={
+            "salt": salt,
+            "taker": taker,
+            "token_id": token_id,
+            "maker_amount": maker_amount_scaled,
+            "taker_amount": 1,  # FOK orders always have takerAmount = 1
+            "expiration": expiration_value,
+            "side": side.value,
+        })
+
+    def _order_prototype(self) -> UnsignedOrder:
+        """Return the cached validated order skeleton for this builder.
+
+        Orders from one builder share maker, signer, fee rate, nonce and
+        signature type; validating those once and cloning with
+        model_copy(update=...) amortizes pydantic's per-field coercion
+        to near-zero across a batch of orders.
+
+        Returns:
+            UnsignedOrder prototype with placeholder per-order fields
+        """
+        if self._prototype is None:
+            self._prototype = UnsignedOrder(
+                salt=0,
+                maker=self._maker_address,
+                signer=self._maker_address,
+                taker=ZERO_ADDRESS,
+                token_id="0",
+                maker_amount=0,
+                taker_amount=0,
+                expiration=0,
+                nonce=0,
+                fee_rate_bps=self._fee_rate_bps,
+                side=Side.BUY.value,
+                signature_type=SignatureType.EOA.value,
+            )
+        return self._prototype
 
     def _generate_salt(self) -> int:
         """Generate cryptographically secure random salt for order uniqueness.
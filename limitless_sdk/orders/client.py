@@ -1,6 +1,7 @@
 """Order client for managing orders on Limitless Exchange."""
 
-from typing import Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 from eth_account import Account
 
 from ..api.http_client import HttpClient
@@ -84,6 +85,7 @@ class OrderClient:
         wallet: Account,
         signing_config: Optional[OrderSigningConfig] = None,
         market_fetcher: Optional[MarketFetcher] = None,
+        user_data: Optional[UserData] = None,
         logger: Optional[ILogger] = None,
     ):
         """Initialize order client.
@@ -93,15 +95,24 @@ class OrderClient:
             wallet: Ethereum account for signing
             signing_config: Custom signing config (optional)
             market_fetcher: Shared MarketFetcher for venue caching (optional)
+            user_data: Pre-fetched user data (user_id, fee_rate_bps); when
+                provided, skips the profile fetch on first order creation
             logger: Optional logger
         """
         self._http_client = http_client
         self._wallet = wallet
         self._logger = logger or NoOpLogger()
 
-        # User data will be lazily loaded on first order creation
-        self._cached_user_data: Optional[UserData] = None
+        # User data will be lazily loaded on first order creation unless
+        # provided up front (e.g. from a caller-side cache)
+        self._cached_user_data: Optional[UserData] = user_data
         self._builder: Optional[OrderBuilder] = None
+        if user_data:
+            self._builder = OrderBuilder(
+                maker_address=wallet.address,
+                fee_rate_bps=user_data.fee_rate_bps,
+                price_tick=0.001,
+            )
 
         # Initialize order signer
         self._signer = OrderSigner(wallet, logger)
@@ -373,6 +384,59 @@ class OrderClient:
 
         return OrderResponse(**response_data)
 
+    async def create_orders(self, specs: List[Dict[str, Any]]) -> List[OrderResponse]:
+        """Create and submit multiple orders concurrently.
+
+        Each spec is a dict of create_order() keyword arguments. Orders are
+        signed and submitted in parallel with asyncio.gather, so a ladder of
+        N quotes costs roughly one API round-trip instead of N. Signing runs
+        in a thread pool, and the HTTP client's pooled connections carry the
+        posts concurrently.
+
+        User data and venue info are resolved once before fanning out, so
+        concurrent orders don't race on the profile fetch.
+
+        Args:
+            specs: List of create_order() keyword-argument dicts
+
+        Returns:
+            List of OrderResponse in the same order as specs
+
+        Raises:
+            ValueError: If any spec is invalid for its order type
+            APIError: If any order submission fails
+
+        Example:
+            >>> # Place a ladder of bids in one round-trip
+            >>> specs = [
+            ...     dict(
+            ...         token_id=token_id,
+            ...         price=p,
+            ...         size=10.0,
+            ...         side=Side.BUY,
+            ...         order_type=OrderType.GTC,
+            ...         market_slug="bitcoin-2024",
+            ...     )
+            ...     for p in (0.45, 0.46, 0.47)
+            ... ]
+            >>> orders = await client.create_orders(specs)
+        """
+        # Resolve shared state up front so the gathered calls don't each
+        # trigger a profile fetch or market lookup.
+        await self._ensure_user_data()
+        for spec in specs:
+            market_slug = spec.get("market_slug")
+            if market_slug and not self._market_fetcher.get_venue(market_slug):
+                await self._market_fetcher.get_market(market_slug)
+
+        self._logger.info(
+            "Creating orders concurrently", {"count": len(specs)}
+        )
+
+        return list(await asyncio.gather(
+            *(self.create_order(**spec) for spec in specs)
+        ))
+
     async def cancel(self, order_id: str) -> dict:
         """Cancel an order by ID.
 
@@ -1,6 +1,7 @@
 """Order signer for EIP-712 signature generation."""
 
-from typing import Dict, Any
+import asyncio
+from typing import Any, Dict, Tuple
 from eth_account import Account
 from eth_account.messages import encode_typed_data
 
@@ -9,6 +10,32 @@ from ..types.logger import ILogger, NoOpLogger
 from ..utils.constants import PROTOCOL_NAME, PROTOCOL_VERSION
 
 
+# The EIP-712 type definitions never change; build them once instead of
+# allocating the nested dicts on every sign_order() call.
+_EIP712_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "Order": [
+        {"name": "salt", "type": "uint256"},
+        {"name": "maker", "type": "address"},
+        {"name": "signer", "type": "address"},
+        {"name": "taker", "type": "address"},
+        {"name": "tokenId", "type": "uint256"},
+        {"name": "makerAmount", "type": "uint256"},
+        {"name": "takerAmount", "type": "uint256"},
+        {"name": "expiration", "type": "uint256"},
+        {"name": "nonce", "type": "uint256"},
+        {"name": "feeRateBps", "type": "uint256"},
+        {"name": "side", "type": "uint8"},
+        {"name": "signatureType", "type": "uint8"},
+    ],
+}
+
+
 class OrderSigner:
     """EIP-712 order signing utility.
 
@@ -44,6 +71,9 @@ class OrderSigner:
         """
         self._account = account
         self._logger = logger or NoOpLogger()
+        # Domain separators are static per (chain, contract); a trading bot
+        # signs many orders against the same venue, so reuse the dict
+        self._domain_cache: Dict[Tuple[int, str], Dict[str, Any]] = {}
 
     async def sign_order(
         self, order: UnsignedOrder, config: OrderSigningConfig
@@ -77,14 +107,11 @@ class OrderSigner:
         # Build EIP-712 typed data
         typed_data = self._build_typed_data(order, config)
 
-        # Sign using eth_account's EIP-712 implementation
-        encoded_message = encode_typed_data(full_message=typed_data)
-        signed_message = self._account.sign_message(encoded_message)
-
-        # Extract signature with 0x prefix
-        signature = signed_message.signature.hex()
-        if not signature.startswith("0x"):
-            signature = "0x" + signature
+        # The keccak hashing and secp256k1 signing are CPU-bound; run them in
+        # the default executor so concurrent order creation (asyncio.gather)
+        # doesn't serialize on the event loop.
+        loop = asyncio.get_running_loop()
+        signature = await loop.run_in_executor(None, self._sign_typed_data, typed_data)
 
         self._logger.info(
             "Order signature generated",
@@ -97,6 +124,27 @@ class OrderSigner:
 
         return signature
 
+    def _sign_typed_data(self, typed_data: Dict[str, Any]) -> str:
+        """Encode and sign EIP-712 typed data (blocking).
+
+        Runs in an executor thread from sign_order() so the hashing and
+        signing work doesn't block the event loop.
+
+        Args:
+            typed_data: EIP-712 typed data structure
+
+        Returns:
+            Signature as hex string with 0x prefix
+        """
+        encoded_message = encode_typed_data(full_message=typed_data)
+        signed_message = self._account.sign_message(encoded_message)
+
+        signature = signed_message.signature.hex()
+        if not signature.startswith("0x"):
+            signature = "0x" + signature
+
+        return signature
+
     def _build_typed_data(
         self, order: UnsignedOrder, config: OrderSigningConfig
     ) -> Dict[str, Any]:
@@ -117,37 +165,18 @@ class OrderSigner:
         Reference:
             EIP-712: https://eips.ethereum.org/EIPS/eip-712
         """
-        # Domain separator
-        domain = {
-            "name": PROTOCOL_NAME,
-            "version": PROTOCOL_VERSION,
-            "chainId": config.chain_id,
-            "verifyingContract": config.contract_address,
-        }
-
-        # Type definitions
-        types = {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-            ],
-            "Order": [
-                {"name": "salt", "type": "uint256"},
-                {"name": "maker", "type": "address"},
-                {"name": "signer", "type": "address"},
-                {"name": "taker", "type": "address"},
-                {"name": "tokenId", "type": "uint256"},
-                {"name": "makerAmount", "type": "uint256"},
-                {"name": "takerAmount", "type": "uint256"},
-                {"name": "expiration", "type": "uint256"},
-                {"name": "nonce", "type": "uint256"},
-                {"name": "feeRateBps", "type": "uint256"},
-                {"name": "side", "type": "uint8"},
-                {"name": "signatureType", "type": "uint8"},
-            ],
-        }
+        # Domain separator - cached per venue since only the per-order
+        # message changes between sign calls
+        domain_key = (config.chain_id, config.contract_address)
+        domain = self._domain_cache.get(domain_key)
+        if domain is None:
+            domain = {
+                "name": PROTOCOL_NAME,
+                "version": PROTOCOL_VERSION,
+                "chainId": config.chain_id,
+                "verifyingContract": config.contract_address,
+            }
+            self._domain_cache[domain_key] = domain
 
         # Message data
         message = {
@@ -167,7 +196,7 @@ class OrderSigner:
 
         # EIP-712 typed data structure
         typed_data = {
-            "types": types,
+            "types": _EIP712_TYPES,
             "primaryType": "Order",
             "domain": domain,
             "message": message,
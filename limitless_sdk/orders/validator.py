@@ -1,8 +1,99 @@
-"""Order validation utilities."""
+"""Order validation utilities.
 
-import re
-from typing import Optional
+This module is deliberately straight-line, fully annotated code with no
+dynamic class creation, which keeps it compilable by mypyc/Cython as an
+opt-in build step (``mypyc limitless_sdk/orders/validator.py``) for
+deployments that want the checks specialized to C. The wheel stays pure
+Python so installs never require a compiler.
+"""
+
+from functools import lru_cache
+from typing import Optional, Sequence
 from ..types.orders import UnsignedOrder, SignedOrder, Side
+from ..utils.constants import ZERO_ADDRESS
+
+
+def _is_ascii_digits(value: str) -> bool:
+    r"""Whether value is one or more ASCII digits (what ^\d+$ matched).
+
+    str.isdigit alone also accepts Unicode digits, so the isascii check
+    keeps the old regex semantics while staying a C-level walk with no
+    NFA simulation.
+    """
+    return value.isascii() and value.isdigit()
+
+
+# Hoisted check constants: the numeric-type tuple and valid-side set are
+# built once instead of per call on the validation hot path.
+_NUMERIC = (int, float)
+_VALID_SIDES = frozenset((0, 1))
+
+
+def _is_nonneg_int(value: object) -> bool:
+    """Whether value is an exact int >= 0.
+
+    Order fields come out of pydantic already coerced to exact int, so
+    the identity test on type() (cheaper than isinstance, and shared by
+    five check-table rows instead of five identical lambdas) is safe.
+    """
+    return type(value) is int and value >= 0
+
+
+def _is_pos_int(value: object) -> bool:
+    """Whether value is an exact int > 0."""
+    return type(value) is int and value > 0
+
+_HEX_CHARS = frozenset(b"0123456789abcdefABCDEF")
+
+
+def _is_hex_body(value: str) -> bool:
+    """Whether value is non-empty and entirely hex (case-insensitive).
+
+    frozenset.issuperset over the encoded bytes is a single C pass with
+    O(1) membership per character — no regex machinery, no fromhex
+    whitespace-skipping caveats. Callers check the 0x prefix and length
+    themselves since those differ per field.
+    """
+    try:
+        body = value.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    return bool(body) and _HEX_CHARS.issuperset(body)
+
+
+@lru_cache(maxsize=256)
+def _check_address(address: str) -> bool:
+    """Cached check that a string is 0x plus 40 hex characters.
+
+    Maker/signer/taker addresses come from a small bounded set (the
+    user's wallet plus a few counterparties), so after the first scan a
+    repeat validation is one dict lookup.
+    """
+    return (
+        len(address) == 42
+        and address.startswith("0x")
+        and _is_hex_body(address[2:])
+    )
+
+
+def _is_valid_address(address: str) -> bool:
+    """Check if address is a valid Ethereum address.
+
+    Args:
+        address: Ethereum address to validate
+
+    Returns:
+        True if valid, False otherwise
+    """
+    # Identity fast-path: open orders carry the interned ZERO_ADDRESS
+    # constant (OrderBuilder defaults to it), so the overwhelmingly
+    # common taker value is accepted with one pointer compare before any
+    # hashing or scanning happens
+    if address is ZERO_ADDRESS:
+        return True
+    # The type guard stays outside the cache so unhashable or non-str
+    # inputs return False instead of tripping lru_cache
+    return isinstance(address, str) and _check_address(address)
 
 
 class ValidationError(Exception):
@@ -20,6 +111,39 @@ class ValidationError(Exception):
     pass
 
 
+def _validate_common(
+    token_id: str,
+    taker: Optional[str],
+    expiration: Optional[int],
+    nonce: Optional[int],
+) -> None:
+    """Run the token_id/taker/expiration/nonce checks shared by both
+    order-args validators, so the logic lives (and evolves) in one place.
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    if not token_id:
+        raise ValidationError("TokenId is required")
+
+    if token_id == "0":
+        raise ValidationError("TokenId cannot be zero")
+
+    # tokenId must be a numeric string
+    if not _is_ascii_digits(token_id):
+        raise ValidationError(f"Invalid tokenId format: {token_id}")
+
+    if taker is not None:
+        if not _is_valid_address(taker):
+            raise ValidationError(f"Invalid taker address: {taker}")
+
+    if expiration is not None and not _is_nonneg_int(expiration):
+        raise ValidationError(f"Invalid expiration format: {expiration}")
+
+    if nonce is not None and not _is_nonneg_int(nonce):
+        raise ValidationError(f"Invalid nonce: {nonce}")
+
+
 def validate_gtc_order_args(
     token_id: str,
     price: float,
@@ -52,40 +176,16 @@ def validate_gtc_order_args(
         ...     side=Side.BUY
         ... )
     """
-    # Validate tokenId
-    if not token_id:
-        raise ValidationError("TokenId is required")
-
-    if token_id == "0":
-        raise ValidationError("TokenId cannot be zero")
-
-    # Validate tokenId format (should be numeric string)
-    if not re.match(r"^\d+$", token_id):
-        raise ValidationError(f"Invalid tokenId format: {token_id}")
-
-    # Validate taker address if provided
-    if taker is not None:
-        if not _is_valid_address(taker):
-            raise ValidationError(f"Invalid taker address: {taker}")
-
-    # Validate expiration if provided
-    if expiration is not None:
-        if not isinstance(expiration, int) or expiration < 0:
-            raise ValidationError(f"Invalid expiration format: {expiration}")
-
-    # Validate nonce if provided
-    if nonce is not None:
-        if not isinstance(nonce, int) or nonce < 0:
-            raise ValidationError(f"Invalid nonce: {nonce}")
+    _validate_common(token_id, taker, expiration, nonce)
 
     # GTC order validation
-    if not isinstance(price, (int, float)):
+    if not isinstance(price, _NUMERIC):
         raise ValidationError("Price must be a valid number")
 
     if price < 0 or price > 1:
         raise ValidationError(f"Price must be between 0 and 1, got: {price}")
 
-    if not isinstance(size, (int, float)):
+    if not isinstance(size, _NUMERIC):
         raise ValidationError("Size must be a valid number")
 
     if size <= 0:
@@ -121,53 +221,57 @@ def validate_fok_order_args(
         ...     side=Side.BUY
         ... )
     """
-    # Validate tokenId
-    if not token_id:
-        raise ValidationError("TokenId is required")
-
-    if token_id == "0":
-        raise ValidationError("TokenId cannot be zero")
-
-    # Validate tokenId format (should be numeric string)
-    if not re.match(r"^\d+$", token_id):
-        raise ValidationError(f"Invalid tokenId format: {token_id}")
-
-    # Validate taker address if provided
-    if taker is not None:
-        if not _is_valid_address(taker):
-            raise ValidationError(f"Invalid taker address: {taker}")
-
-    # Validate expiration if provided
-    if expiration is not None:
-        if not isinstance(expiration, int) or expiration < 0:
-            raise ValidationError(f"Invalid expiration format: {expiration}")
-
-    # Validate nonce if provided
-    if nonce is not None:
-        if not isinstance(nonce, int) or nonce < 0:
-            raise ValidationError(f"Invalid nonce: {nonce}")
+    _validate_common(token_id, taker, expiration, nonce)
 
     # FOK order validation
-    if not isinstance(maker_amount, (int, float)):
+    if not isinstance(maker_amount, _NUMERIC):
         raise ValidationError("Amount must be a valid number")
 
     if maker_amount <= 0:
         raise ValidationError(f"Amount must be positive, got: {maker_amount}")
 
-    # Validate max 2 decimal places
-    amount_str = str(maker_amount)
-    decimal_index = amount_str.find(".")
-    if decimal_index != -1:
-        decimal_places = len(amount_str) - decimal_index - 1
-        if decimal_places > 2:
-            raise ValidationError(
-                f"Amount must have max 2 decimal places, got: {maker_amount} ({decimal_places} decimals)"
-            )
+    # Validate max 2 decimal places by comparing against the value
+    # rounded to cents — pure arithmetic instead of float-to-str
+    # formatting; str() only runs on the cold failure path
+    if maker_amount != round(maker_amount * 100) / 100.0:
+        amount_str = str(maker_amount)
+        decimal_index = amount_str.find(".")
+        decimal_places = len(amount_str) - decimal_index - 1 if decimal_index != -1 else 0
+        raise ValidationError(
+            f"Amount must have max 2 decimal places, got: {maker_amount} ({decimal_places} decimals)"
+        )
+
+
+# Field checks for validate_unsigned_order as one precomputed
+# (attribute, predicate, message) table: a single loop with one raise
+# site replaces fifteen inline isinstance/comparison blocks. Cheap
+# integer/range tests run before the string scans (token id, three
+# addresses) so hostile or malformed orders fail fast; the redundant
+# truthiness-then-range amount pairs are collapsed into one row each.
+_UNSIGNED_ORDER_CHECKS = (
+    ("salt", _is_pos_int, "Invalid salt: {}"),
+    ("nonce", _is_nonneg_int, "Invalid nonce: {}"),
+    ("maker_amount", _is_pos_int, "Invalid makerAmount: {}"),
+    ("taker_amount", _is_pos_int, "Invalid takerAmount: {}"),
+    ("fee_rate_bps", _is_nonneg_int, "Invalid feeRateBps: {}"),
+    ("side", _VALID_SIDES.__contains__, "Invalid side: {}. Must be 0 (BUY) or 1 (SELL)"),
+    ("signature_type", _is_nonneg_int, "Invalid signatureType: {}"),
+    ("expiration", _is_nonneg_int, "Invalid expiration format: {}"),
+    ("token_id", _is_ascii_digits, "Invalid tokenId format: {}"),
+    ("maker", _is_valid_address, "Invalid maker address: {}"),
+    ("signer", _is_valid_address, "Invalid signer address: {}"),
+    ("taker", _is_valid_address, "Invalid taker address: {}"),
+)
 
 
 def validate_unsigned_order(order: UnsignedOrder) -> None:
     """Validate an unsigned order.
 
+    Successful validations are memoized on the (frozen, hashable) order,
+    so re-validating the same order along the builder -> signer ->
+    submitter -> retry pipeline is a single cache lookup. Failures are
+    never cached — lru_cache does not store raised exceptions.
+
     Args:
         order: Unsigned order to validate
 
@@ -177,114 +281,109 @@ def validate_unsigned_order(order: UnsignedOrder) -> None:
     Example:
         >>> validate_unsigned_order(unsigned_order)
     """
-    # Validate addresses
-    if not _is_valid_address(order.maker):
-        raise ValidationError(f"Invalid maker address: {order.maker}")
+    try:
+        _validate_unsigned_cached(order)
+    except TypeError:
+        # Unhashable (e.g. a non-frozen subclass): validate directly
+        _validate_unsigned_impl(order)
 
-    if not _is_valid_address(order.signer):
-        raise ValidationError(f"Invalid signer address: {order.signer}")
 
-    if not _is_valid_address(order.taker):
-        raise ValidationError(f"Invalid taker address: {order.taker}")
+@lru_cache(maxsize=1024)
+def _validate_unsigned_cached(order: UnsignedOrder) -> None:
+    _validate_unsigned_impl(order)
 
-    # Validate amounts
-    if not order.maker_amount or order.maker_amount == 0:
-        raise ValidationError("MakerAmount must be greater than zero")
 
-    if not order.taker_amount or order.taker_amount == 0:
-        raise ValidationError("TakerAmount must be greater than zero")
+def _validate_unsigned_impl(order: UnsignedOrder) -> None:
+    for attr, ok, message in _UNSIGNED_ORDER_CHECKS:
+        value = getattr(order, attr)
+        if not ok(value):
+            raise ValidationError(message.format(value))
 
-    # Validate amounts are positive numbers
-    if not isinstance(order.maker_amount, int) or order.maker_amount <= 0:
-        raise ValidationError(f"Invalid makerAmount: {order.maker_amount}")
+    # Validate price if present (for GTC orders)
+    price = order.price
+    if price is not None:
+        if not isinstance(price, _NUMERIC):
+            raise ValidationError("Price must be a valid number")
 
-    if not isinstance(order.taker_amount, int) or order.taker_amount <= 0:
-        raise ValidationError(f"Invalid takerAmount: {order.taker_amount}")
+        if price < 0 or price > 1:
+            raise ValidationError(f"Price must be between 0 and 1, got: {price}")
 
-    if not re.match(r"^\d+$", order.token_id):
-        raise ValidationError(f"Invalid tokenId format: {order.token_id}")
 
-    if not isinstance(order.expiration, int) or order.expiration < 0:
-        raise ValidationError(f"Invalid expiration format: {order.expiration}")
+def validate_signed_order(order: SignedOrder) -> None:
+    """Validate a signed order.
 
-    # Validate salt
-    if not isinstance(order.salt, int) or order.salt <= 0:
-        raise ValidationError(f"Invalid salt: {order.salt}")
+    Memoized like validate_unsigned_order; the order hash covers the
+    signature field, so a re-signed order is a distinct cache entry.
 
-    # Validate nonce
-    if not isinstance(order.nonce, int) or order.nonce < 0:
-        raise ValidationError(f"Invalid nonce: {order.nonce}")
+    Args:
+        order: Signed order to validate
 
-    # Validate feeRateBps
-    if not isinstance(order.fee_rate_bps, int) or order.fee_rate_bps < 0:
-        raise ValidationError(f"Invalid feeRateBps: {order.fee_rate_bps}")
+    Raises:
+        ValidationError: If validation fails
 
-    # Validate side (0 or 1)
-    if order.side not in (0, 1):
-        raise ValidationError(
-            f"Invalid side: {order.side}. Must be 0 (BUY) or 1 (SELL)"
-        )
+    Example:
+        >>> validate_signed_order(signed_order)
+    """
+    try:
+        _validate_signed_cached(order)
+    except TypeError:
+        _validate_signed_impl(order)
 
-    # Validate signatureType
-    if not isinstance(order.signature_type, int) or order.signature_type < 0:
-        raise ValidationError(f"Invalid signatureType: {order.signature_type}")
 
-    # Validate price if present (for GTC orders)
-    if order.price is not None:
-        if not isinstance(order.price, (int, float)):
-            raise ValidationError("Price must be a valid number")
+@lru_cache(maxsize=1024)
+def _validate_signed_cached(order: SignedOrder) -> None:
+    _validate_signed_impl(order)
 
-        if order.price < 0 or order.price > 1:
-            raise ValidationError(f"Price must be between 0 and 1, got: {order.price}")
 
+def validate_signed_orders_batch(orders: Sequence[SignedOrder]) -> None:
+    """Validate every signed order in a batch before bulk submission.
 
-def validate_signed_order(order: SignedOrder) -> None:
-    """Validate a signed order.
+    Runs the memoized per-order validator across the batch, so orders
+    seen before (retries, re-submitted batches) cost one cache lookup
+    each; the error message names the failing position so callers can
+    pinpoint the bad order without re-validating one by one.
 
     Args:
-        order: Signed order to validate
+        orders: Signed orders to validate
 
     Raises:
-        ValidationError: If validation fails
+        ValidationError: If any order fails, noting its index
 
     Example:
-        >>> validate_signed_order(signed_order)
+        >>> validate_signed_orders_batch(signed_orders)
     """
+    for index, order in enumerate(orders):
+        try:
+            validate_signed_order(order)
+        except ValidationError as exc:
+            raise ValidationError(f"Order {index}: {exc}") from exc
+
+
+def _validate_signed_impl(order: SignedOrder) -> None:
     # Validate unsigned order fields first
     validate_unsigned_order(order)
 
-    # Validate signature
-    if not order.signature:
+    # Validate signature: one compound test on the happy path (0x + 130
+    # hex chars for 65 bytes); the per-condition diagnostics below only
+    # run once the fast path has already failed
+    signature = order.signature
+    if (
+        signature
+        and len(signature) == 132
+        and signature.startswith("0x")
+        and _is_hex_body(signature[2:])
+    ):
+        return
+
+    if not signature:
         raise ValidationError("Signature is required")
 
-    if not order.signature.startswith("0x"):
+    if not signature.startswith("0x"):
         raise ValidationError("Signature must start with 0x")
 
-    # Signature should be 132 characters (0x + 130 hex chars for 65 bytes)
-    if len(order.signature) != 132:
+    if len(signature) != 132:
         raise ValidationError(
-            f"Invalid signature length: {len(order.signature)}. Expected 132 characters."
+            f"Invalid signature length: {len(signature)}. Expected 132 characters."
         )
 
-    # Validate hex format
-    if not re.match(r"^0x[0-9a-fA-F]{130}$", order.signature):
-        raise ValidationError("Signature must be valid hex string")
-
-
-def _is_valid_address(address: str) -> bool:
-    """Check if address is a valid Ethereum address.
-
-    Args:
-        address: Ethereum address to validate
-
-    Returns:
-        True if valid, False otherwise
-    """
-    if not address or not isinstance(address, str):
-        return False
-
-    # Check basic format: 0x followed by 40 hex characters
-    if not re.match(r"^0x[0-9a-fA-F]{40}$", address):
-        return False
-
-    return True
+    raise ValidationError("Signature must be valid hex string")
@@ -88,8 +88,12 @@ class Client:
 
     def new_websocket_client(self, config: Optional[WebSocketConfig] = None) -> WebSocketClient:
         config = config or WebSocketConfig()
+        # WebSocketConfig is frozen; fill in missing credentials via a copy
+        updates = {}
         if not config.api_key and self.http.get_api_key():
-            config.api_key = self.http.get_api_key()
+            updates['api_key'] = self.http.get_api_key()
         if not config.hmac_credentials and self.http.get_hmac_credentials():
-            config.hmac_credentials = self.http.get_hmac_credentials()
+            updates['hmac_credentials'] = self.http.get_hmac_credentials()
+        if updates:
+            config = config.model_copy(update=updates)
         return WebSocketClient(config=config, logger=self.http.get_logger())
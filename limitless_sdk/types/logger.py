@@ -30,6 +30,17 @@ class ILogger(Protocol):
         """
         ...
 
+    def is_debug_enabled(self) -> bool:
+        """Report whether debug messages will be emitted.
+
+        Hot paths use this to skip building debug context (dicts,
+        f-strings) that would be thrown away.
+
+        Returns:
+            True if debug logging is active
+        """
+        ...
+
     def info(self, message: str, context: Optional[Any] = None) -> None:
         """Log info message.
 
@@ -72,6 +83,10 @@ class NoOpLogger:
         """No-op debug logging."""
         pass
 
+    def is_debug_enabled(self) -> bool:
+        """Debug output is never emitted."""
+        return False
+
     def info(self, message: str, context: Optional[Any] = None) -> None:
         """No-op info logging."""
         pass
@@ -151,6 +166,10 @@ class ConsoleLogger:
         if self._should_log(LogLevel.DEBUG):
             self._logger.debug(f"{message}{self._format_context(context)}")
 
+    def is_debug_enabled(self) -> bool:
+        """Check whether debug messages pass the configured level."""
+        return self._should_log(LogLevel.DEBUG)
+
     def info(self, message: str, context: Optional[Any] = None) -> None:
         """Log info message."""
         if self._should_log(LogLevel.INFO):
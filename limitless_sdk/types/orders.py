@@ -164,7 +164,12 @@ class UnsignedOrder(BaseModel):
     signature_type: int = Field(alias="signatureType")
     price: Optional[float] = None  # Required for GTC orders, NOT part of EIP-712 signature
 
-    model_config = ConfigDict(populate_by_name=True)
+    # Frozen: orders are immutable once built (signing produces a new
+    # SignedOrder rather than mutating), which also makes instances
+    # hashable for cache keys and lets model_copy clones skip state
+    # bookkeeping. Pydantic models cannot use field __slots__, so this
+    # is the layout optimization available here.
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     @field_validator("salt", "maker_amount", "taker_amount", mode="before")
     @classmethod
@@ -13,7 +13,7 @@ Performance optimizations:
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 from socketio import AsyncClient
 from socketio.exceptions import ConnectionError as SocketIOConnectionError
 
@@ -38,6 +38,59 @@ from .types import (
 DEFAULT_WS_URL = "wss://ws.limitless.exchange"
 DEFAULT_NAMESPACE = "/markets"
 
+# Channels that require an API key or HMAC credentials. Built once at
+# import as a frozenset (SubscriptionChannel is a str subclass, so plain
+# channel strings hash into it directly) instead of a per-call list scan.
+_AUTHENTICATED_CHANNELS = frozenset((
+    SubscriptionChannel.POSITIONS,
+    SubscriptionChannel.TRANSACTIONS,
+))
+
+# Frame (de)serialization happens inside Socket.IO for every message, so on a
+# high-frequency orderbook stream the JSON parser is hot-path event-loop work.
+# Prefer a C-extension codec when one is installed — orjson first, then
+# msgspec — and fall back to stdlib json so both stay optional dependencies.
+# Either way handlers still receive plain dicts matching the TypedDict
+# payload shapes in .types.
+try:
+    import orjson as _orjson
+
+    class _OrjsonSerializer:
+        """Module-like json shim for python-socketio backed by orjson."""
+
+        @staticmethod
+        def dumps(obj, *args, **kwargs):
+            # socketio passes stdlib-json kwargs (separators, cls); orjson
+            # needs none of them for compact output
+            return _orjson.dumps(obj).decode()
+
+        @staticmethod
+        def loads(data, *args, **kwargs):
+            return _orjson.loads(data)
+
+    _json_serializer = _OrjsonSerializer
+except ImportError:
+    try:
+        import msgspec.json as _msgspec_json
+
+        class _MsgspecSerializer:
+            """Module-like json shim for python-socketio backed by msgspec."""
+
+            _encode = _msgspec_json.Encoder().encode
+            _decode = _msgspec_json.Decoder().decode
+
+            @staticmethod
+            def dumps(obj, *args, **kwargs):
+                return _MsgspecSerializer._encode(obj).decode()
+
+            @staticmethod
+            def loads(data, *args, **kwargs):
+                return _MsgspecSerializer._decode(data)
+
+        _json_serializer = _MsgspecSerializer
+    except ImportError:
+        import json as _json_serializer
+
 
 def _build_iso_timestamp() -> str:
     return (
@@ -116,8 +169,13 @@ class WebSocketClient:
         # Subscription management (O(1) lookup)
         self._subscriptions: Dict[str, SubscriptionOptions] = {}
 
-        # Pending listeners (registered before connect)
-        self._pending_listeners: List[Dict[str, Any]] = []
+        # Handler registry: one list per event name, populated at
+        # registration time. A single dispatcher per event is attached to
+        # Socket.IO, so per-frame dispatch is one dict hit plus a list walk —
+        # no re-registration churn and no poking at Socket.IO internals for
+        # off()/once().
+        self._handlers: Dict[str, List[Callable]] = {}
+        self._dispatchers: Dict[str, Callable] = {}
 
         # Connection lock for thread-safe operations
         self._connection_lock = asyncio.Lock()
@@ -151,7 +209,8 @@ class WebSocketClient:
         Example:
             >>> client.set_api_key('new-api-key')
         """
-        self._config.api_key = api_key
+        # The config model is frozen; swap in an updated copy
+        self._config = self._config.model_copy(update={'api_key': api_key})
 
         # If already connected, reconnect with new auth
         if self.is_connected():
@@ -160,7 +219,9 @@ class WebSocketClient:
 
     def set_hmac_credentials(self, hmac_credentials: HMACCredentials) -> None:
         """Set HMAC credentials for authenticated subscriptions."""
-        self._config.hmac_credentials = hmac_credentials.model_copy()
+        self._config = self._config.model_copy(
+            update={'hmac_credentials': hmac_credentials.model_copy()}
+        )
 
         if self.is_connected():
             self._logger.info("HMAC credentials updated, reconnecting...")
@@ -168,7 +229,7 @@ class WebSocketClient:
 
     def clear_hmac_credentials(self) -> None:
         """Clear HMAC credentials."""
-        self._config.hmac_credentials = None
+        self._config = self._config.model_copy(update={'hmac_credentials': None})
 
         if self.is_connected():
             self._logger.info("HMAC credentials cleared, reconnecting...")
@@ -211,6 +272,7 @@ class WebSocketClient:
                     reconnection_delay_max=min(self._config.reconnect_delay * 32, 60),  # Max 60s
                     reconnection_attempts=self._config.max_reconnect_attempts or 0,  # 0 = infinite
                     randomization_factor=0.2,  # Add jitter to prevent thundering herd
+                    json=_json_serializer,  # orjson when installed (see module top)
                 )
 
                 # Setup internal event handlers
@@ -320,16 +382,19 @@ class WebSocketClient:
             self._sio = None
             self._state = WebSocketState.DISCONNECTED
             self._subscriptions.clear()
+            # Dispatchers were bound to the old AsyncClient; a reconnect
+            # creates a fresh one, so they must be re-attached then.
+            self._dispatchers.clear()
 
     async def subscribe(
         self,
-        channel: SubscriptionChannel,
+        channel: Union[SubscriptionChannel, str],
         options: Optional[SubscriptionOptions] = None
     ) -> None:
         """Subscribe to a channel.
 
         Args:
-            channel: Channel to subscribe to
+            channel: Channel to subscribe to (enum member or channel string)
             options: Subscription options (market slug, filters, etc.)
 
         Raises:
@@ -350,10 +415,14 @@ class WebSocketClient:
         if not self.is_connected():
             raise ConnectionError("WebSocket not connected. Call connect() first.")
 
+        # Normalize to the exact wire string: Socket.IO event names go out
+        # as strings, and the C-extension codecs reject str subclasses
+        if isinstance(channel, SubscriptionChannel):
+            channel = channel.value
+
         # Check if authentication is required for authenticated channels
-        authenticated_channels = ['subscribe_positions', 'subscribe_transactions']
         if (
-            channel in authenticated_channels
+            channel in _AUTHENTICATED_CHANNELS
             and not self._config.api_key
             and not self._config.hmac_credentials
         ):
@@ -386,13 +455,13 @@ class WebSocketClient:
 
     async def unsubscribe(
         self,
-        channel: SubscriptionChannel,
+        channel: Union[SubscriptionChannel, str],
         options: Optional[SubscriptionOptions] = None
     ) -> None:
         """Unsubscribe from a channel.
 
         Args:
-            channel: Channel to unsubscribe from
+            channel: Channel to unsubscribe from (enum member or channel string)
             options: Subscription options (must match subscribe call)
 
         Raises:
@@ -405,6 +474,9 @@ class WebSocketClient:
         if not self.is_connected():
             raise ConnectionError("WebSocket not connected")
 
+        if isinstance(channel, SubscriptionChannel):
+            channel = channel.value
+
         if options is None:
             options = {}
 
@@ -452,12 +524,9 @@ class WebSocketClient:
             >>> client.on('orderbookUpdate', on_orderbook)
         """
         def decorator(func: Callable) -> Callable:
-            if self._sio is None:
-                # Store listener to be attached when socket is created
-                self._pending_listeners.append({"event": event, "handler": func})
-            else:
-                # Attach listener immediately to /markets namespace
-                self._sio.on(event, handler=func, namespace=DEFAULT_NAMESPACE)
+            self._handlers.setdefault(event, []).append(func)
+            if self._sio is not None:
+                self._ensure_dispatcher(event)
             return func
 
         if handler is None:
@@ -468,6 +537,30 @@ class WebSocketClient:
             decorator(handler)
             return self
 
+    def _ensure_dispatcher(self, event: str) -> None:
+        """Attach the per-event dispatcher to Socket.IO once.
+
+        Internal method. The dispatcher captures the handler list by
+        reference, so later on()/off() calls take effect without touching
+        Socket.IO again.
+        """
+        if event in self._dispatchers or self._sio is None:
+            return
+
+        handlers = self._handlers[event]
+
+        async def _dispatch(*args: Any, **kwargs: Any) -> None:
+            # Fast path: the common single-handler case avoids the copy
+            if len(handlers) == 1:
+                await handlers[0](*args, **kwargs)
+                return
+            # Copy so a once()-wrapper removing itself mid-frame is safe
+            for func in tuple(handlers):
+                await func(*args, **kwargs)
+
+        self._dispatchers[event] = _dispatch
+        self._sio.on(event, handler=_dispatch, namespace=DEFAULT_NAMESPACE)
+
     def once(self, event: str, handler: Callable) -> 'WebSocketClient':
         """Register a one-time event listener for /markets namespace events.
 
@@ -478,22 +571,104 @@ class WebSocketClient:
         Returns:
             This client for chaining
 
-        Raises:
-            ConnectionError: If not connected
-
         Example:
             >>> client.once('orderbookUpdate', lambda data: print(f'First update: {data}'))
         """
-        if self._sio is None:
-            raise ConnectionError("WebSocket not initialized. Call connect() first.")
-
-        # Create one-time wrapper
+        # Create one-time wrapper; deregistering first makes re-entry safe
         async def once_wrapper(*args, **kwargs):
+            self.off(event, once_wrapper)
             await handler(*args, **kwargs)
-            self._sio.off(event, handler=once_wrapper, namespace=DEFAULT_NAMESPACE)
 
-        self._sio.on(event, handler=once_wrapper, namespace=DEFAULT_NAMESPACE)
-        return self
+        return self.on(event, once_wrapper)
+
+    def on_coalesced(
+        self,
+        event: str,
+        handler: Optional[Callable] = None,
+        *,
+        interval_ms: float = 50,
+        key: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Register a listener that coalesces bursts into one call per interval.
+
+        High-frequency streams like orderbookUpdate can deliver many frames
+        per market within milliseconds; intermediate frames are superseded by
+        the time a handler could react to them. This wrapper keeps only the
+        newest frame per market and invokes the handler at most once per
+        interval per market, cutting handler invocations by the burst factor
+        at the cost of up to interval_ms of added latency.
+
+        Can be used as decorator or direct call, like on().
+
+        Args:
+            event: Event name
+            handler: Event handler (optional if used as decorator)
+            interval_ms: Coalescing window in milliseconds (default: 50)
+            key: Function extracting the coalescing key from a frame
+                (default: the frame's marketSlug, falling back to a single
+                shared key for payloads without one)
+
+        Returns:
+            Decorator function if handler not provided, otherwise self
+
+        Example:
+            >>> @client.on_coalesced('orderbookUpdate', interval_ms=50)
+            >>> async def on_orderbook(data):
+            ...     print(f"Latest orderbook: {data}")
+        """
+        if key is None:
+            def key(frame: Any) -> Any:
+                return frame.get('marketSlug') if isinstance(frame, dict) else None
+
+        def decorator(func: Callable) -> Callable:
+            latest: Dict[Any, Any] = {}
+            flushing = False
+            # Strong references so running flush tasks can't be GC'd
+            flush_tasks: Set[asyncio.Task] = set()
+
+            async def _flush() -> None:
+                nonlocal flushing
+                try:
+                    # Loop: frames that arrive while the handlers below are
+                    # awaiting land in latest after the clear(), and with
+                    # flushing still True nothing else will schedule a
+                    # task for them — they start the next cycle here.
+                    while True:
+                        await asyncio.sleep(interval_ms / 1000)
+                        frames = list(latest.values())
+                        latest.clear()
+                        for frame in frames:
+                            try:
+                                await func(frame)
+                            except Exception as e:
+                                # One bad frame must not stall the stream
+                                self._logger.error(
+                                    "Coalesced handler error", e, {"event": event}
+                                )
+                        if not latest:
+                            return
+                finally:
+                    flushing = False
+
+            async def coalesce(frame: Any, *args: Any, **kwargs: Any) -> None:
+                latest[key(frame)] = frame
+                nonlocal flushing
+                if not flushing:
+                    flushing = True
+                    task = asyncio.create_task(_flush())
+                    flush_tasks.add(task)
+                    task.add_done_callback(flush_tasks.discard)
+
+            self.on(event, coalesce)
+            return func
+
+        if handler is None:
+            # Used as decorator
+            return decorator
+        else:
+            # Direct call
+            decorator(handler)
+            return self
 
     def off(self, event: str, handler: Optional[Callable] = None) -> 'WebSocketClient':
         """Remove an event listener from /markets namespace.
@@ -508,36 +683,31 @@ class WebSocketClient:
         Example:
             >>> client.off('orderbookUpdate', on_orderbook)
         """
-        if self._sio is None:
+        handlers = self._handlers.get(event)
+        if not handlers:
             return self
 
         if handler is None:
-            # Remove all handlers for event in /markets namespace
-            # Socket.IO doesn't have a built-in way to do this, so we need to
-            # remove the event from the handlers dict directly
-            namespace_key = DEFAULT_NAMESPACE
-            if hasattr(self._sio, 'handlers') and namespace_key in self._sio.handlers:
-                if event in self._sio.handlers[namespace_key]:
-                    self._sio.handlers[namespace_key][event] = []
+            handlers.clear()
         else:
-            self._sio.off(event, handler=handler, namespace=DEFAULT_NAMESPACE)
+            try:
+                handlers.remove(handler)
+            except ValueError:
+                pass  # Not registered (or already removed by a once wrapper)
 
         return self
 
     def _attach_pending_listeners(self) -> None:
-        """Attach any pending event listeners that were added before connect().
+        """Attach dispatchers for listeners registered before connect().
 
-        Internal method for attaching listeners registered before Socket.IO client creation.
-        All listeners are attached to the /markets namespace.
+        Internal method. One dispatcher per event name is attached to the
+        /markets namespace; the handler lists themselves live on the client.
         """
-        if self._sio is None or len(self._pending_listeners) == 0:
+        if self._sio is None:
             return
 
-        for listener in self._pending_listeners:
-            self._sio.on(listener['event'], handler=listener['handler'], namespace=DEFAULT_NAMESPACE)
-
-        # Clear pending listeners
-        self._pending_listeners.clear()
+        for event in self._handlers:
+            self._ensure_dispatcher(event)
 
     def _setup_internal_handlers(self) -> None:
         """Setup internal event handlers for connection management.
@@ -7,10 +7,16 @@ and subscriptions for real-time market data from Limitless Exchange.
 import os
 from enum import Enum
 from typing import Any, Callable, Dict, List, Literal, Optional, TypedDict, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..types.api_tokens import HMACCredentials
 
+# Resolved once at import: reconnect loops and tests construct many
+# short-lived configs, and each default_factory call was another
+# os.environ lookup. Set LIMITLESS_API_KEY before importing (or pass
+# api_key explicitly) if the environment changes at runtime.
+_DEFAULT_API_KEY = os.getenv('LIMITLESS_API_KEY')
+
 
 class WebSocketState(str, Enum):
     """WebSocket connection state.
@@ -29,18 +35,30 @@ class WebSocketState(str, Enum):
     ERROR = "error"
 
 
-# Subscription channel types
-SubscriptionChannel = Literal[
-    "orderbook",
-    "trades",
-    "orders",
-    "fills",
-    "markets",
-    "prices",
-    "subscribe_market_prices",
-    "subscribe_positions",
-    "subscribe_transactions"
-]
+class SubscriptionChannel(str, Enum):
+    """Subscription channel names.
+
+    A str subclass, so members compare and hash interchangeably with the
+    plain channel strings the public subscribe()/unsubscribe() API has
+    always accepted: existing string call sites keep working, while enum
+    call sites get autocomplete and the membership checks in the client
+    resolve against sets built once at import instead of per-call lists.
+    The wire protocol is unchanged — Socket.IO event names are strings,
+    and the client emits the .value.
+
+    Example:
+        >>> await client.subscribe(SubscriptionChannel.MARKET_PRICES,
+        ...                        {'marketSlugs': ['market-123']})
+    """
+    ORDERBOOK = "orderbook"
+    TRADES = "trades"
+    ORDERS = "orders"
+    FILLS = "fills"
+    MARKETS = "markets"
+    PRICES = "prices"
+    MARKET_PRICES = "subscribe_market_prices"
+    POSITIONS = "subscribe_positions"
+    TRANSACTIONS = "subscribe_transactions"
 
 
 class WebSocketConfig(BaseModel):
@@ -74,8 +92,15 @@ class WebSocketConfig(BaseModel):
         ...     auto_reconnect=True
         ... )
     """
+    # Frozen: skips pydantic's mutation bookkeeping and lets reconnect
+    # loops share one config safely. Credential rotation goes through the
+    # client's set_api_key()/set_hmac_credentials(), which swap in a
+    # model_copy. extra='forbid' turns misspelled kwargs into errors
+    # instead of silently stored dead weight.
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     url: str = Field(default="wss://ws.limitless.exchange")
-    api_key: Optional[str] = Field(default_factory=lambda: os.getenv('LIMITLESS_API_KEY'))
+    api_key: Optional[str] = Field(default=_DEFAULT_API_KEY)
     hmac_credentials: Optional[HMACCredentials] = Field(default=None)
     auto_reconnect: bool = Field(default=True)
     reconnect_delay: float = Field(default=1.0)
@@ -131,6 +156,14 @@ class OrderbookData(TypedDict):
     minSize: float
 
 
+# Event payloads stay TypedDicts deliberately: python-socketio decodes
+# frames itself (through the codec shim in .client, which already
+# prefers orjson/msgspec) and hands handlers plain dicts, so TypedDict
+# gives the typing contract at zero runtime cost. Converting these to
+# instantiated struct classes would add an allocation per event on a
+# >100/sec stream, not remove one.
+
+
 class OrderbookUpdate(TypedDict):
     """Orderbook update event - matches API format exactly.
 
@@ -0,0 +1,81 @@
+"""Tests for the CircuitBreaker state machine and RetryableClient wiring."""
+
+import pytest
+
+from limitless_sdk.api import (
+    APIError,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RetryableClient,
+    RetryConfig,
+)
+
+
+class _FailingClient:
+    """Stub HttpClient whose get() always raises a 503."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, path, **kwargs):
+        self.calls += 1
+        raise APIError("Service unavailable", status_code=503)
+
+
+def test_breaker_starts_closed_and_allows():
+    breaker = CircuitBreaker()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_opens_after_threshold_failures():
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+    for _ in range(2):
+        breaker.on_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.on_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.recovery_in() > 0
+
+
+def test_breaker_half_open_probe_after_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.on_failure()
+    assert breaker.state == CircuitState.OPEN
+    # recovery_timeout=0 -> probe allowed immediately
+    assert breaker.allow()
+    assert breaker.state == CircuitState.HALF_OPEN
+    # Failed probe re-opens without needing another full threshold
+    breaker.on_failure()
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_breaker_success_closes_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.on_failure()
+    assert breaker.allow()  # half-open probe
+    breaker.on_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_retryable_client_fails_fast_when_open():
+    client = _FailingClient()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    retryable = RetryableClient(
+        client,
+        retry_config=RetryConfig(max_retries=0),
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(APIError):
+        await retryable.get("/markets")
+    assert breaker.state == CircuitState.OPEN
+
+    # Second call is rejected without touching the wrapped client
+    with pytest.raises(CircuitOpenError):
+        await retryable.get("/markets")
+    assert client.calls == 1
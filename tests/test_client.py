@@ -68,28 +68,52 @@ def test_additional_headers_initialization():
 
 @pytest.mark.asyncio
 async def test_additional_headers_in_session():
-    """Test that additional_headers are included in session headers."""
+    """Test per-request headers and the shared session's tracking headers."""
     private_key = "0x" + "a" * 64
     additional_headers = {"x-secret-bypass": "secret-token", "x-custom": "value"}
-    
+
     client = LimitlessClient(private_key=private_key, additional_headers=additional_headers)
-    
-    with patch('aiohttp.ClientSession') as mock_session:
+
+    # Client-specific headers ride on every request, not the shared session
+    assert client._headers['Content-Type'] == 'application/json'
+    assert client._headers['x-secret-bypass'] == 'secret-token'
+    assert client._headers['x-custom'] == 'value'
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+            patch('limitless_sdk.client._SHARED_SESSION', None):
         await client.create_session()
-        
-        # Verify that ClientSession was called with headers including additional_headers
+
+        # The shared session carries only process-invariant tracking headers
         mock_session.assert_called_once()
         call_kwargs = mock_session.call_args[1]
-        
+
         assert 'headers' in call_kwargs
         headers = call_kwargs['headers']
-        
-        # Check that default headers are present
-        assert headers['Content-Type'] == 'application/json'
+
         assert headers['user-agent'].startswith('lmts-sdk-py/')
         assert 'python/' in headers['user-agent']
         assert headers['x-sdk-version'].startswith('lmts-sdk-py/')
-        
-        # Check that additional headers are present
-        assert headers['x-secret-bypass'] == 'secret-token'
-        assert headers['x-custom'] == 'value' 
+
+        assert 'x-secret-bypass' not in headers
+        assert 'Content-Type' not in headers 
+
+
+@pytest.mark.asyncio
+async def test_cancel_order_coalesced_batches_concurrent_cancels():
+    """Concurrent coalesced cancels collapse into one batch request."""
+    import asyncio
+
+    private_key = "0x" + "a" * 64
+    client = LimitlessClient(private_key=private_key, api_key="key")
+
+    with patch.object(LimitlessClient, 'cancel_order_batch', new_callable=AsyncMock) as mock_batch:
+        mock_batch.return_value = [{"id": "order-a"}, {"id": "order-b"}]
+        results = await asyncio.gather(
+            client.cancel_order_coalesced("order-a"),
+            client.cancel_order_coalesced("order-b"),
+        )
+
+    mock_batch.assert_awaited_once()
+    dto = mock_batch.call_args[0][0]
+    assert dto.orderIds == ["order-a", "order-b"]
+    assert results == [{"id": "order-a"}, {"id": "order-b"}]
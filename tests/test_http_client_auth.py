@@ -17,9 +17,14 @@ class _MockResponse:
         self._data = data
         self.headers = headers or {}
 
-    async def json(self):
+    async def json(self, loads=None):
         return self._data
 
+    async def read(self):
+        import json
+
+        return json.dumps(self._data).encode()
+
     async def text(self):
         return str(self._data)
 
@@ -36,6 +41,8 @@ class _MockResponseContext:
 
 
 class _CapturedSession:
+    closed = False
+
     def __init__(self, response):
         self.response = response
         self.calls = []
@@ -71,18 +78,13 @@ async def test_http_client_prefers_hmac_over_api_key(monkeypatch):
         hmac_credentials=credentials,
     )
     client._session = session
-
-    async def _noop_ensure():
-        return None
-
-    client._ensure_session = _noop_ensure
     monkeypatch.setattr("limitless_sdk.api.http_client._build_iso_timestamp", lambda: timestamp)
 
     await client.post("/orders", {"foo": "bar"})
 
     method, url, headers, kwargs = session.calls[0]
     assert method == "POST"
-    assert url == "https://api.limitless.exchange/orders"
+    assert str(url) == "https://api.limitless.exchange/orders"
     assert headers["lmts-api-key"] == "token-123"
     assert headers["lmts-timestamp"] == timestamp
     assert headers["lmts-signature"] == _expected_hmac(
@@ -93,7 +95,7 @@ async def test_http_client_prefers_hmac_over_api_key(monkeypatch):
         '{"foo":"bar"}',
     )
     assert "X-API-Key" not in headers
-    assert kwargs["data"] == '{"foo":"bar"}'
+    assert kwargs["data"] == b'{"foo":"bar"}'
 
 
 @pytest.mark.asyncio
@@ -106,11 +108,6 @@ async def test_http_client_identity_overrides_hmac_and_api_key():
     )
     client._session = session
 
-    async def _noop_ensure():
-        return None
-
-    client._ensure_session = _noop_ensure
-
     await client.get_with_identity("/auth/api-tokens/capabilities", "identity-token")
 
     _, _, headers, _ = session.calls[0]
@@ -126,11 +123,6 @@ async def test_http_client_encodes_special_characters_in_query_params():
     client = HttpClient(base_url="https://api.limitless.exchange", api_key="plain-api-key")
     client._session = session
 
-    async def _noop_ensure():
-        return None
-
-    client._ensure_session = _noop_ensure
-
     await client.get(
         "/auth/api-tokens",
         params={"tokenId": "token/with space", "marketSlug": "slug/with space"},
@@ -139,7 +131,7 @@ async def test_http_client_encodes_special_characters_in_query_params():
     method, url, _, _ = session.calls[0]
     assert method == "GET"
     assert (
-        url
+        str(url)
         == "https://api.limitless.exchange/auth/api-tokens?tokenId=token%2Fwith+space&marketSlug=slug%2Fwith+space"
     )
 
@@ -150,11 +142,6 @@ async def test_http_client_maps_409_to_conflict_error():
     client = HttpClient(base_url="https://api.limitless.exchange", api_key="plain-api-key")
     client._session = session
 
-    async def _noop_ensure():
-        return None
-
-    client._ensure_session = _noop_ensure
-
     with pytest.raises(ConflictError) as exc:
         await client.post("/profiles/partner-accounts", {"displayName": "Bot"})
 
@@ -0,0 +1,110 @@
+"""Tests for HttpClient GET response caching and single-flight dedup."""
+
+import asyncio
+
+import pytest
+
+from limitless_sdk.api.http_client import HttpClient
+
+
+class _CountingResponse:
+    status = 200
+    headers = {}
+
+    def __init__(self, counter):
+        self._counter = counter
+
+    async def json(self, loads=None):
+        return {"call": self._counter["calls"]}
+
+    async def read(self):
+        import json
+
+        return json.dumps({"call": self._counter["calls"]}).encode()
+
+    async def text(self):
+        return ""
+
+
+class _CountingSession:
+    closed = False
+
+    def __init__(self):
+        self.counter = {"calls": 0}
+
+    def get(self, *args, **kwargs):
+        self.counter["calls"] += 1
+        response = _CountingResponse(dict(self.counter))
+        session = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                return response
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return False
+
+        return _Ctx()
+
+
+def _make_client(**kwargs):
+    client = HttpClient(base_url="https://api.limitless.exchange", api_key="k", **kwargs)
+    client._session = _CountingSession()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_cached_get_hits_network_once():
+    client = _make_client(cache_ttl=30)
+    first = await client.get("/markets/abc")
+    second = await client.get("/markets/abc")
+    assert first == second
+    assert client._session.counter["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default():
+    client = _make_client()
+    await client.get("/markets/abc")
+    await client.get("/markets/abc")
+    assert client._session.counter["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_per_call_cache_false_bypasses():
+    client = _make_client(cache_ttl=30)
+    await client.get("/markets/abc")
+    await client.get("/markets/abc", cache=False)
+    assert client._session.counter["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request():
+    client = _make_client(cache_ttl=30)
+    results = await asyncio.gather(*(client.get("/markets/abc") for _ in range(5)))
+    assert client._session.counter["calls"] == 1
+    assert all(r == results[0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_different_params_cached_separately():
+    client = _make_client(cache_ttl=30)
+    await client.get("/markets", params={"page": 1})
+    await client.get("/markets", params={"page": 2})
+    assert client._session.counter["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_list_param_values_are_cacheable():
+    client = _make_client(cache_ttl=30)
+    await client.get("/markets", params={"ids": ["a", "b"]})
+    await client.get("/markets", params={"ids": ["a", "b"]})
+    assert client._session.counter["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unhashable_param_value_falls_back_to_uncached():
+    client = _make_client(cache_ttl=30)
+    await client.get("/markets", params={"filter": {"a": 1}})
+    await client.get("/markets", params={"filter": {"a": 1}})
+    assert client._session.counter["calls"] == 2
@@ -12,9 +12,14 @@ class _MockResponse:
         self._data = data
         self.headers = headers or {}
 
-    async def json(self):
+    async def json(self, loads=None):
         return self._data
 
+    async def read(self):
+        import json
+
+        return json.dumps(self._data).encode()
+
     async def text(self):
         return str(self._data)
 
@@ -31,6 +36,8 @@ class _MockResponseContext:
 
 
 class _MockSession:
+    closed = False
+
     def __init__(self, response):
         self._response = response
 
@@ -71,11 +78,6 @@ async def test_get_raw_does_not_whitelist_http_errors_with_accepted_statuses():
     client = HttpClient(base_url="https://api.limitless.exchange", api_key="test-key")
     client._session = _MockSession(_MockResponse(status=404, data={"message": "not found"}))
 
-    async def _noop_ensure():
-        return None
-
-    client._ensure_session = _noop_ensure
-
     with pytest.raises(APIError) as exc:
         await client.get_raw("/missing", accepted_statuses={404})
 
@@ -89,11 +91,6 @@ async def test_get_raw_allows_accepted_non_error_status():
         _MockResponse(status=301, data="", headers={"Location": "/crypto"})
     )
 
-    async def _noop_ensure():
-        return None
-
-    client._ensure_session = _noop_ensure
-
     response = await client.get_raw(
         "/market-pages/by-path",
         params={"path": "/old-crypto"},
@@ -4,7 +4,9 @@ from limitless_sdk.orders.builder import OrderBuilder
 from limitless_sdk.types import Side
 
 
-@pytest.fixture
+# Module-scoped: the builder is stateless apart from its internal order
+# prototype cache, so one instance serves every test here.
+@pytest.fixture(scope="module")
 def order_builder() -> OrderBuilder:
     return OrderBuilder(
         maker_address="0x" + "1" * 40,
@@ -0,0 +1,40 @@
+"""Tests for the AsyncTokenBucket rate limiter."""
+
+import time
+
+import pytest
+
+from limitless_sdk.api import AsyncTokenBucket
+
+
+@pytest.mark.asyncio
+async def test_burst_within_capacity_is_immediate():
+    bucket = AsyncTokenBucket(rate=100, capacity=5)
+    start = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.02
+
+
+@pytest.mark.asyncio
+async def test_paces_once_bucket_is_empty():
+    bucket = AsyncTokenBucket(rate=50, capacity=1)
+    await bucket.acquire()  # drain the single token
+    start = time.monotonic()
+    await bucket.acquire()  # must wait ~1/50s for a refill
+    elapsed = time.monotonic() - start
+    assert elapsed >= 0.015
+
+
+def test_throttle_halves_rate_with_floor():
+    bucket = AsyncTokenBucket(rate=20)
+    bucket.throttle()
+    assert bucket.rate == 10
+    for _ in range(10):
+        bucket.throttle()
+    assert bucket.rate == 1.0
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        AsyncTokenBucket(rate=0)
@@ -0,0 +1,105 @@
+"""Tests for WebSocketClient.on_coalesced burst coalescing."""
+
+import asyncio
+
+import pytest
+
+from limitless_sdk.websocket import WebSocketClient
+
+
+def _frame(slug, seq):
+    return {"marketSlug": slug, "orderbook": {"seq": seq}}
+
+
+@pytest.mark.asyncio
+async def test_burst_coalesced_to_latest_frame():
+    client = WebSocketClient()
+    received = []
+
+    @client.on_coalesced('orderbookUpdate', interval_ms=10)
+    async def on_orderbook(data):
+        received.append(data)
+
+    intake = client._handlers['orderbookUpdate'][0]
+    for seq in range(5):
+        await intake(_frame("btc-market", seq))
+
+    await asyncio.sleep(0.05)
+    assert received == [_frame("btc-market", 4)]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_is_per_market():
+    client = WebSocketClient()
+    received = []
+
+    @client.on_coalesced('orderbookUpdate', interval_ms=10)
+    async def on_orderbook(data):
+        received.append(data)
+
+    intake = client._handlers['orderbookUpdate'][0]
+    await intake(_frame("btc-market", 1))
+    await intake(_frame("eth-market", 1))
+    await intake(_frame("btc-market", 2))
+
+    await asyncio.sleep(0.05)
+    assert _frame("btc-market", 2) in received
+    assert _frame("eth-market", 1) in received
+    assert len(received) == 2
+
+
+@pytest.mark.asyncio
+async def test_new_frames_after_flush_schedule_another():
+    client = WebSocketClient()
+    received = []
+
+    @client.on_coalesced('orderbookUpdate', interval_ms=5)
+    async def on_orderbook(data):
+        received.append(data)
+
+    intake = client._handlers['orderbookUpdate'][0]
+    await intake(_frame("btc-market", 1))
+    await asyncio.sleep(0.03)
+    await intake(_frame("btc-market", 2))
+    await asyncio.sleep(0.03)
+
+    assert received == [_frame("btc-market", 1), _frame("btc-market", 2)]
+
+
+@pytest.mark.asyncio
+async def test_frame_arriving_during_slow_handler_still_delivered():
+    client = WebSocketClient()
+    received = []
+
+    @client.on_coalesced('orderbookUpdate', interval_ms=5)
+    async def on_orderbook(data):
+        received.append(data)
+        await asyncio.sleep(0.02)  # slower than the coalescing window
+
+    intake = client._handlers['orderbookUpdate'][0]
+    await intake(_frame("btc-market", 1))
+    await asyncio.sleep(0.01)  # handler for frame 1 is now running
+    await intake(_frame("btc-market", 2))
+    await asyncio.sleep(0.05)
+
+    assert received == [_frame("btc-market", 1), _frame("btc-market", 2)]
+
+
+@pytest.mark.asyncio
+async def test_raising_handler_does_not_stop_later_flushes():
+    client = WebSocketClient()
+    received = []
+
+    @client.on_coalesced('orderbookUpdate', interval_ms=5)
+    async def on_orderbook(data):
+        if data["orderbook"]["seq"] == 1:
+            raise RuntimeError("boom")
+        received.append(data)
+
+    intake = client._handlers['orderbookUpdate'][0]
+    await intake(_frame("btc-market", 1))
+    await asyncio.sleep(0.02)
+    await intake(_frame("btc-market", 2))
+    await asyncio.sleep(0.02)
+
+    assert received == [_frame("btc-market", 2)]